@@ -0,0 +1,93 @@
+"""Measure import cost of the data layer and Streamlit script time per rerun.
+
+Two numbers, each median of --repeat fresh runs:
+
+  * import: a new interpreter importing --import (by default the whole
+    portal.data package), reporting wall time and whether streamlit/pandas
+    got pulled in
+  * rerun: AppTest first run (cold) and repeated reruns (warm) of --app for
+    each role's landing page, i.e. what every widget interaction pays
+
+Runs without a database too (queries then fail fast), which isolates script
+and import overhead from SQL time.
+
+    python benchmarks/bench_cold_start.py --repeat 5
+    python benchmarks/bench_cold_start.py --app /tmp/app2_before.py --import "import app2_before"
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.join(HERE, "..")
+DEFAULT_IMPORT = ("import portal.data.accounts, portal.data.analytics, portal.data.bulk_import, "
+                  "portal.data.dashboard, portal.data.matching, portal.data.mentors, portal.data.mentorship, "
+                  "portal.data.placements, portal.data.ratings, portal.data.reference, portal.data.search, "
+                  "portal.data.skills")
+PROBE = """
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(elapsed, 'streamlit' in sys.modules, 'pandas' in sys.modules)
+"""
+ROLES = {
+    "Student": "Home",
+    "Alumni": "Home",
+    "Administrator": "Home",
+}
+
+
+def measure_import(statement, repeat):
+    samples, loaded = [], None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement)], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.split()
+        samples.append(float(output[-3]) * 1000)
+        loaded = {"streamlit": output[-2] == "True", "pandas": output[-1] == "True"}
+    return statistics.median(samples), loaded
+
+
+def measure_reruns(app, role, reruns):
+    from streamlit.testing.v1 import AppTest
+
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)  # `streamlit run` puts the app's directory on the path; AppTest does not
+    at = AppTest.from_file(app, default_timeout=60)
+    at.session_state["logged_in"] = True
+    at.session_state["role"] = role
+    at.session_state["user_id"] = 1
+    at.session_state["name"] = "Bench"
+    started = time.perf_counter()
+    at.run()
+    cold = (time.perf_counter() - started) * 1000
+    warm = []
+    for _ in range(reruns):
+        started = time.perf_counter()
+        at.run()
+        warm.append((time.perf_counter() - started) * 1000)
+    return cold, statistics.median(warm)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default=os.path.join(ROOT, "app2.py"))
+    parser.add_argument("--import", dest="statement", default=DEFAULT_IMPORT)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    import_ms, loaded = measure_import(args.statement, args.repeat)
+    print(f"import: {import_ms:.0f} ms  (streamlit loaded: {loaded['streamlit']}, pandas loaded: {loaded['pandas']})")
+
+    print(f"\n{'role':<16}{'cold run ms':>12}{'warm rerun ms':>15}")
+    for role in ROLES:
+        cold, warm = measure_reruns(args.app, role, args.reruns)
+        print(f"{role:<16}{cold:>12.1f}{warm:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Compare the student dashboard loader against the original per-query sequence.
+
+Runs against the MySQL database in portal.db.DB_CONFIG (schema_updates.sql applied)
+and times, for one student:
+
+  * original: what home_page() did before the loader existed -- the two
+    stats counts, every approved mentor through the DISTINCT skills join
+    (deduplicated in Python), one fn_CalculateAlumniRating call per mentor,
+    then the placement row, each on its own pooled connection
+  * original-connect: the same queries, each on a fresh
+    mysql.connector.connect() as the original execute_query() opened them
+  * loader: load_student_dashboard(), a single proc_GetStudentDashboard CALL
+
+Both original paths still understate the old cost: fn_CalculateAlumniRating
+is now a primary-key read of Alumni_Rating_Summary rather than an AVG over
+Feedback, so the per-mentor lookups are cheaper than they used to be.
+
+    python benchmarks/bench_dashboard_loader.py --student-id 1 --iterations 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import mysql.connector  # noqa: E402
+
+from portal.data import dashboard, placements  # noqa: E402
+from portal.db import DB_CONFIG, execute_query  # noqa: E402
+
+# The mentor list and rating lookups exactly as home_page() originally issued them
+ORIGINAL_MENTORS_QUERY = """
+SELECT DISTINCT a.Alumni_ID, a.Name, a.Current_Designation, a.years_of_experience,
+       i.Name as Industry_Name
+FROM Alumni a
+LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID
+LEFT JOIN Alumni_Skills als ON a.Alumni_ID = als.Alumni_ID
+LEFT JOIN Skills s ON als.Skill_ID = s.Skill_ID
+WHERE a.Approved = TRUE
+"""
+ORIGINAL_RATING_QUERY = "SELECT fn_CalculateAlumniRating(%s) as rating"
+
+
+ORIGINAL_STATS_QUERIES = (
+    "SELECT COUNT(*) AS cnt FROM Mentorship_Session WHERE Student_ID = %s AND Status = 'Completed'",
+    "SELECT COUNT(*) AS cnt FROM Mentorship_Request WHERE Student_ID = %s AND Status = 'Pending'",
+)
+ORIGINAL_PLACEMENT_QUERY = "SELECT * FROM Placement WHERE Student_ID = %s"
+
+
+def original(student_id):
+    dashboard.get_student_stats(student_id)
+    seen = set()
+    for mentor in execute_query(ORIGINAL_MENTORS_QUERY) or []:
+        if mentor['Alumni_ID'] not in seen:
+            seen.add(mentor['Alumni_ID'])
+            execute_query(ORIGINAL_RATING_QUERY, (mentor['Alumni_ID'],))
+    placements.get_placement_status(student_id)
+
+
+def connect_query(query, params=None):
+    connection = mysql.connector.connect(**DB_CONFIG)
+    try:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
+    finally:
+        connection.close()
+
+
+def original_connect(student_id):
+    for query in ORIGINAL_STATS_QUERIES:
+        connect_query(query, (student_id,))
+    seen = set()
+    for mentor in connect_query(ORIGINAL_MENTORS_QUERY):
+        if mentor['Alumni_ID'] not in seen:
+            seen.add(mentor['Alumni_ID'])
+            connect_query(ORIGINAL_RATING_QUERY, (mentor['Alumni_ID'],))
+    connect_query(ORIGINAL_PLACEMENT_QUERY, (student_id,))
+
+
+def loader(student_id):
+    dashboard.load_student_dashboard(student_id)
+
+
+def measure(func, student_id, iterations):
+    func(student_id)  # Warm the pool
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func(student_id)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p95": samples[int(len(samples) * 0.95) - 1],
+        "mean": statistics.fmean(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--student-id", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'path':<18}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for name, func in (("original", original), ("original-connect", original_connect), ("loader", loader)):
+        result = measure(func, args.student_id, args.iterations)
+        print(f"{name:<18}{result['p50']:>10.2f}{result['p95']:>10.2f}{result['mean']:>10.2f}")
+    print("\nNote: fn_CalculateAlumniRating now reads the rating summary table instead of averaging"
+          "\nFeedback, so both original paths understate what the old dashboard cost.")
+
+
+if __name__ == "__main__":
+    main()
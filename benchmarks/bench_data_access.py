@@ -0,0 +1,170 @@
+"""Time the portal.data access functions against a seeded database and write a JSON report.
+
+Point it at a database built by seed_synthetic_data.py. Each case is called
+--iterations times (after --warmup calls) with IDs drawn from --seed, and the
+report records p50/p95/p99/mean latency and calls per second per case, plus the
+dataset size and git revision, so runs can be compared:
+
+    python benchmarks/bench_data_access.py --output bench-main.json
+    python benchmarks/bench_data_access.py --output bench-branch.json --compare bench-main.json
+
+Outside Streamlit no per-session memo store is installed, so per-user
+memoized readers go to the database on every call. Pass --cold to also clear
+the process-wide data caches before every call; by default cached readers
+such as get_site_statistics are timed as the app serves them.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from portal import caching, db  # noqa: E402
+from portal.data import accounts, analytics, dashboard, mentors, mentorship, ratings  # noqa: E402
+
+
+def build_cases(rng, ids):
+    """Name -> zero-argument callable drawing fresh IDs per call"""
+    student = lambda: rng.randint(ids["student"][0], ids["student"][1])  # noqa: E731
+    alumni = lambda: rng.randint(ids["alumni"][0], ids["alumni"][1])  # noqa: E731
+    today = date.today()
+
+    return {
+        "get_alumni_with_industry": lambda: mentors.get_alumni_with_industry({}, limit=mentors.MENTOR_PAGE_SIZE),
+        "get_alumni_with_industry[skill]": lambda: mentors.get_alumni_with_industry({"skill": "Python"}, limit=mentors.MENTOR_PAGE_SIZE),
+        "get_mentor_page[industry]": lambda: mentors.get_mentor_page({"industry_id": rng.randint(1, 12)}),
+        "get_alumni_rating": lambda: ratings.get_alumni_rating(alumni()),
+        "get_alumni_ratings[20]": lambda: ratings.get_alumni_ratings([alumni() for _ in range(20)]),
+        "get_alumni_feedback": lambda: ratings.get_alumni_feedback(alumni()),
+        "get_student_sessions_by_status": lambda: mentorship.get_student_sessions_by_status(student()),
+        "get_alumni_sessions_by_status": lambda: mentorship.get_alumni_sessions_by_status(alumni()),
+        "get_requests_by_status": lambda: mentorship.get_requests_by_status(student(), "Student", "Pending"),
+        "load_student_dashboard": lambda: dashboard.load_student_dashboard(student()),
+        "get_site_statistics": analytics.get_site_statistics,
+        "get_placement_trends[week]": lambda: analytics.get_placement_trends(today - timedelta(days=365), today, "week"),
+        "get_placement_log": lambda: analytics.get_placement_log({}),
+        "get_user_directory_page[search]": lambda: accounts.get_user_directory_page("Student", rng.choice("ABDKMNPRSTV")),
+    }
+
+
+def id_ranges():
+    ranges = {}
+    for key, table, column in (("student", "Student", "Student_ID"), ("alumni", "Alumni", "Alumni_ID")):
+        row = db.execute_query(f"SELECT MIN({column}) AS lo, MAX({column}) AS hi, COUNT(*) AS n FROM {table}")[0]
+        ranges[key] = (row["lo"], row["hi"], row["n"])
+    return ranges
+
+
+def dataset_size():
+    tables = ["Student", "Alumni", "Skills", "Student_Skills", "Alumni_Skills", "Mentorship_Request",
+              "Mentorship_Session", "Feedback", "Placement", "Placement_Log"]
+    return {table: db.execute_query(f"SELECT COUNT(*) AS n FROM {table}")[0]["n"] for table in tables}
+
+
+def percentile(samples, fraction):
+    return samples[min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))]
+
+
+def measure(func, iterations, warmup, cold):
+    for _ in range(warmup):
+        func()
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if cold:
+            caching.clear_data_caches()
+        call_started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - call_started) * 1000)
+    elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": round(percentile(samples, 0.50), 3),
+        "p95_ms": round(percentile(samples, 0.95), 3),
+        "p99_ms": round(percentile(samples, 0.99), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+        "throughput_per_s": round(iterations / elapsed, 1),
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline_path, max_regression):
+    """Print p95 deltas against a baseline report; return the names that regressed"""
+    with open(baseline_path, encoding="utf-8") as handle:
+        baseline = json.load(handle)["results"]
+    regressed = []
+    print(f"\n{'case':<36}{'base p95':>10}{'p95':>10}{'change':>9}")
+    for name, result in report["results"].items():
+        if name not in baseline:
+            continue
+        before, after = baseline[name]["p95_ms"], result["p95_ms"]
+        change = (after - before) / before if before else 0.0
+        flag = "  REGRESSED" if change > max_regression else ""
+        print(f"{name:<36}{before:>10.2f}{after:>10.2f}{change:>8.0%}{flag}")
+        if flag:
+            regressed.append(name)
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", default="AlumniMentorshipBench")
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--only", nargs="*", help="run only these case names")
+    parser.add_argument("--cold", action="store_true", help="clear the data caches before every call")
+    parser.add_argument("--output", default="bench-report.json")
+    parser.add_argument("--compare", help="baseline report to diff p95 against")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="allowed p95 growth before failing")
+    args = parser.parse_args()
+
+    db.DB_CONFIG["database"] = args.database  # Read when the pool opens its first connection
+    rng = random.Random(args.seed)
+    ids = id_ranges()
+    cases = build_cases(rng, ids)
+    if args.only:
+        cases = {name: func for name, func in cases.items() if name in args.only}
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "python": platform.python_version(),
+        "database": args.database,
+        "dataset": dataset_size(),
+        "settings": {"iterations": args.iterations, "warmup": args.warmup, "seed": args.seed, "cold": args.cold},
+        "results": {},
+    }
+
+    print(f"{'case':<36}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'calls/s':>10}")
+    for name, func in cases.items():
+        result = measure(func, args.iterations, args.warmup, args.cold)
+        report["results"][name] = result
+        print(f"{name:<36}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+              f"{result['throughput_per_s']:>10.1f}")
+
+    with open(args.output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"\nReport written to {args.output}")
+
+    if args.compare and compare(report, args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
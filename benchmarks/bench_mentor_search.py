@@ -0,0 +1,184 @@
+"""Benchmark the mentor search query before/after removing the skills JOIN fan-out.
+
+Builds a synthetic directory (50k alumni by default) in an in-memory SQLite
+database that mirrors the tables get_alumni_with_industry() reads, then runs
+the old query shape (DISTINCT over Alumni x Alumni_Skills x Skills, with the
+original substring skill match) and the query get_alumni_with_industry()
+runs today (EXISTS semi-join on an exact Skill_Name only when filtering by
+skill, ordered by the Alumni.Avg_Rating copy) for a few filter combinations,
+reporting joined rows, returned rows and median latency.
+
+    python benchmarks/bench_mentor_search.py --alumni 50000 --repeat 5
+"""
+import argparse
+import random
+import sqlite3
+import statistics
+import time
+
+INDUSTRIES = ["Software", "Finance", "Healthcare", "Consulting", "Manufacturing",
+              "Education", "Retail", "Energy", "Media", "Government"]
+SKILLS = ["Python", "Java", "SQL", "Machine Learning", "Data Analysis", "Cloud",
+          "DevOps", "Leadership", "Product Management", "Marketing", "Finance",
+          "Public Speaking", "UI Design", "Security", "Networking", "C++",
+          "Statistics", "Project Management", "Sales", "Research"]
+FIRST_NAMES = ["Aarav", "Diya", "Kabir", "Meera", "Rohan", "Sara", "Vikram", "Anaya",
+               "Ishaan", "Priya", "Arjun", "Nisha", "Dev", "Kavya", "Rahul", "Tara"]
+LAST_NAMES = ["Sharma", "Mahesh", "Iyer", "Rao", "Patel", "Gupta", "Nair", "Reddy",
+              "Kumar", "Singh", "Menon", "Das"]
+
+OLD_QUERY = """
+SELECT DISTINCT a.Alumni_ID, a.Name, a.Current_Designation, a.years_of_experience,
+       i.Name as Industry_Name, COALESCE(r.Avg_Rating, 0) as Rating
+FROM Alumni a
+LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID
+LEFT JOIN Alumni_Rating_Summary r ON a.Alumni_ID = r.Alumni_ID
+LEFT JOIN Alumni_Skills als ON a.Alumni_ID = als.Alumni_ID
+LEFT JOIN Skills s ON als.Skill_ID = s.Skill_ID
+WHERE a.Approved = TRUE
+"""
+
+OLD_FANOUT_QUERY = """
+SELECT COUNT(*)
+FROM Alumni a
+LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID
+LEFT JOIN Alumni_Rating_Summary r ON a.Alumni_ID = r.Alumni_ID
+LEFT JOIN Alumni_Skills als ON a.Alumni_ID = als.Alumni_ID
+LEFT JOIN Skills s ON als.Skill_ID = s.Skill_ID
+WHERE a.Approved = TRUE
+"""
+
+# Same statement as portal.data.mentors.get_alumni_with_industry()
+NEW_QUERY = """
+SELECT a.Alumni_ID, a.Name, a.Current_Designation, a.years_of_experience,
+       i.Name as Industry_Name, a.Avg_Rating as Rating
+FROM Alumni a
+LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID
+WHERE a.Approved = TRUE
+"""
+
+CASES = {
+    "no filter": {},
+    "name": {"name": "Meera"},
+    "industry": {"industry_id": 1},
+    "skill": {"skill": "Machine Learning"},
+    "name + skill": {"name": "Rao", "skill": "Python"},
+}
+
+
+def build_database(alumni_count, skills_per_alumni, seed):
+    rng = random.Random(seed)
+    db = sqlite3.connect(":memory:")
+    db.executescript("""
+    CREATE TABLE Industry (Industry_ID INTEGER PRIMARY KEY, Name TEXT);
+    CREATE TABLE Skills (Skill_ID INTEGER PRIMARY KEY, Skill_Name TEXT);
+    CREATE TABLE Alumni (Alumni_ID INTEGER PRIMARY KEY, Name TEXT, Current_Designation TEXT,
+                         years_of_experience INTEGER, Industry_ID INTEGER, Approved BOOLEAN,
+                         Avg_Rating REAL NOT NULL DEFAULT 0);
+    CREATE TABLE Alumni_Skills (Alumni_ID INTEGER, Skill_ID INTEGER, PRIMARY KEY (Alumni_ID, Skill_ID));
+    CREATE TABLE Alumni_Rating_Summary (Alumni_ID INTEGER PRIMARY KEY, Avg_Rating REAL);
+    CREATE INDEX idx_alumni_industry ON Alumni (Industry_ID);
+    CREATE INDEX idx_skills_name ON Skills (Skill_Name);
+    CREATE INDEX idx_alumni_mentor_order ON Alumni (Approved, Avg_Rating DESC, Name, Alumni_ID);
+    CREATE INDEX idx_alumni_industry_order ON Alumni (Approved, Industry_ID, Avg_Rating DESC, Name, Alumni_ID);
+    """)
+    db.executemany("INSERT INTO Industry VALUES (?, ?)", enumerate(INDUSTRIES, start=1))
+    db.executemany("INSERT INTO Skills VALUES (?, ?)", enumerate(SKILLS, start=1))
+
+    alumni, alumni_skills, ratings = [], [], []
+    for alumni_id in range(1, alumni_count + 1):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)} {alumni_id}"
+        alumni.append((alumni_id, name, "Engineer", rng.randint(0, 30),
+                       rng.randint(1, len(INDUSTRIES)), rng.random() < 0.95))
+        for skill_id in rng.sample(range(1, len(SKILLS) + 1), skills_per_alumni):
+            alumni_skills.append((alumni_id, skill_id))
+        if rng.random() < 0.7:
+            ratings.append((alumni_id, round(rng.uniform(1, 5), 2)))
+    db.executemany("INSERT INTO Alumni (Alumni_ID, Name, Current_Designation, years_of_experience, Industry_ID, Approved) "
+                   "VALUES (?, ?, ?, ?, ?, ?)", alumni)
+    db.executemany("INSERT INTO Alumni_Skills VALUES (?, ?)", alumni_skills)
+    db.executemany("INSERT INTO Alumni_Rating_Summary VALUES (?, ?)", ratings)
+    # The copy the rating-summary triggers keep in step in MySQL
+    db.executemany("UPDATE Alumni SET Avg_Rating = ? WHERE Alumni_ID = ?", [(rating, alumni_id) for alumni_id, rating in ratings])
+    db.commit()
+    return db
+
+
+def old_sql(filters):
+    query, fanout, params = OLD_QUERY, OLD_FANOUT_QUERY, []
+    if filters.get("name"):
+        query += " AND a.Name LIKE ?"
+        fanout += " AND a.Name LIKE ?"
+        params.append(f"%{filters['name']}%")
+    if filters.get("industry_id"):
+        query += " AND a.Industry_ID = ?"
+        fanout += " AND a.Industry_ID = ?"
+        params.append(filters["industry_id"])
+    if filters.get("skill"):
+        query += " AND s.Skill_Name LIKE ?"
+        fanout += " AND s.Skill_Name LIKE ?"
+        params.append(f"%{filters['skill']}%")
+    return query, fanout, params
+
+
+def new_sql(filters):
+    query, params = NEW_QUERY, []
+    if filters.get("name"):
+        query += " AND a.Name LIKE ?"
+        params.append(f"%{filters['name']}%")
+    if filters.get("industry_id"):
+        query += " AND a.Industry_ID = ?"
+        params.append(filters["industry_id"])
+    if filters.get("skill"):
+        query += """
+        AND EXISTS (
+            SELECT 1 FROM Alumni_Skills als
+            JOIN Skills s ON als.Skill_ID = s.Skill_ID
+            WHERE als.Alumni_ID = a.Alumni_ID AND s.Skill_Name = ?
+        )
+        """
+        params.append(filters['skill'])
+    query += " ORDER BY a.Avg_Rating DESC, a.Name, a.Alumni_ID"
+    return query, params
+
+
+def time_query(db, query, params, repeat, dedupe=False):
+    samples, rows = [], []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = db.execute(query, params).fetchall()
+        if dedupe:
+            # The pages used to deduplicate again in Python
+            seen, unique = set(), []
+            for row in rows:
+                if row[0] not in seen:
+                    seen.add(row[0])
+                    unique.append(row)
+            rows = unique
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000, len(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alumni", type=int, default=50000)
+    parser.add_argument("--skills-per-alumni", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    db = build_database(args.alumni, args.skills_per_alumni, args.seed)
+    print(f"Synthetic dataset: {args.alumni} alumni, {args.skills_per_alumni} skills each (SQLite stand-in)\n")
+    print(f"{'case':<14}{'joined rows':>13}{'old rows':>10}{'old ms':>10}{'new rows':>10}{'new ms':>10}{'speedup':>9}")
+
+    for case, filters in CASES.items():
+        query, fanout, params = old_sql(filters)
+        joined = db.execute(fanout, params).fetchone()[0]
+        old_ms, old_rows = time_query(db, query, params, args.repeat, dedupe=True)
+        query, params = new_sql(filters)
+        new_ms, new_rows = time_query(db, query, params, args.repeat)
+        print(f"{case:<14}{joined:>13}{old_rows:>10}{old_ms:>10.1f}{new_rows:>10}{new_ms:>10.1f}{old_ms / new_ms:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare a page's reads issued one after another against fetch_all() fan-out.
+
+Runs against the MySQL database in portal.db.DB_CONFIG and times, for one
+alumnus, the reads alumni_dashboard() and edit_profile() make:
+
+  * sequential: each read in turn, the way the pages used to call them
+  * fanout: the same reads through portal.fanout.fetch_all(), concurrently
+
+    python benchmarks/bench_page_fanout.py --alumni-id 1 --iterations 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from portal.data.accounts import get_alumni_achievements, get_alumni_info  # noqa: E402
+from portal.data.mentorship import get_pending_requests_for_alumni  # noqa: E402
+from portal.data.ratings import get_alumni_feedback, get_alumni_rating  # noqa: E402
+from portal.data.skills import get_alumni_skills  # noqa: E402
+from portal.fanout import fetch_all  # noqa: E402
+
+PAGES = {
+    "alumni_dashboard": lambda alumni_id: {
+        "info": (get_alumni_info, alumni_id),
+        "rating": (get_alumni_rating, alumni_id),
+        "pending_requests": (get_pending_requests_for_alumni, alumni_id),
+        "feedback": (get_alumni_feedback, alumni_id),
+    },
+    "edit_profile": lambda alumni_id: {
+        "info": (get_alumni_info, alumni_id),
+        "skills": (get_alumni_skills, alumni_id),
+        "achievements": (get_alumni_achievements, alumni_id),
+    },
+}
+
+
+def sequential(calls):
+    return {name: func(*args) for name, (func, *args) in calls.items()}
+
+
+def fanout(calls):
+    return fetch_all(**calls)
+
+
+def measure(func, calls, iterations):
+    func(calls)  # Warm the pool and the worker threads
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func(calls)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return {
+        "p50": statistics.median(samples),
+        "p95": samples[int(len(samples) * 0.95) - 1],
+        "mean": statistics.fmean(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--alumni-id", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'page':<18}{'path':<12}{'p50 ms':>10}{'p95 ms':>10}{'mean ms':>10}")
+    for page, build in PAGES.items():
+        calls = build(args.alumni_id)
+        for name, func in (("sequential", sequential), ("fanout", fanout)):
+            result = measure(func, calls, args.iterations)
+            print(f"{page:<18}{name:<12}{result['p50']:>10.2f}{result['p95']:>10.2f}{result['mean']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Hammer mentorship request creation from many threads at once.
+
+Runs against the MySQL database in portal.db.DB_CONFIG (schema_updates.sql applied).
+Each round, --threads workers fire at the same (student, mentor) pair behind a
+barrier, the way a double/triple click does, using either:
+
+  * legacy: the old check SELECT followed by an INSERT on a second connection
+  * upsert: create_mentorship_request(), one INSERT ... ON DUPLICATE KEY UPDATE
+
+and reports latency plus how many active duplicates each round left behind.
+The legacy path needs the uq_request_active_pair key dropped to show its race;
+with the key in place its losing INSERTs fail instead.
+
+    python benchmarks/bench_request_creation.py --student-id 1 --alumni-ids 1-20 --threads 8
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from portal.data.mentorship import create_mentorship_request  # noqa: E402
+from portal.db import execute_query  # noqa: E402
+
+ACTIVE_COUNT = """
+SELECT COUNT(*) AS n FROM Mentorship_Request
+WHERE Student_ID = %s AND Alumni_ID = %s AND Status IN ('Pending', 'Accepted')
+"""
+CLEANUP = "DELETE FROM Mentorship_Request WHERE Student_ID = %s AND Alumni_ID = %s AND Request_Message = 'bench'"
+
+
+def legacy(student_id, alumni_id):
+    existing = execute_query(
+        "SELECT Request_ID FROM Mentorship_Request WHERE Student_ID = %s AND Alumni_ID = %s "
+        "AND Status IN ('Pending', 'Accepted')", (student_id, alumni_id))
+    if existing:
+        return "exists"
+    result = execute_query(
+        "INSERT INTO Mentorship_Request (Student_ID, Alumni_ID, Request_Message, Status, Request_Date) "
+        "VALUES (%s, %s, 'bench', 'Pending', %s)", (student_id, alumni_id, date.today()), fetch=False)
+    return "created" if result else "error"
+
+
+def upsert(student_id, alumni_id):
+    result = create_mentorship_request(student_id, alumni_id, "bench")
+    return result["status"] if result else "error"
+
+
+def run_round(func, student_id, alumni_id, threads):
+    barrier = threading.Barrier(threads)
+    samples, outcomes = [], []
+    lock = threading.Lock()
+
+    def worker():
+        barrier.wait()
+        started = time.perf_counter()
+        outcome = func(student_id, alumni_id)
+        elapsed = (time.perf_counter() - started) * 1000
+        with lock:
+            samples.append(elapsed)
+            outcomes.append(outcome)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    active = execute_query(ACTIVE_COUNT, (student_id, alumni_id))[0]["n"]
+    execute_query(CLEANUP, (student_id, alumni_id), fetch=False)
+    return samples, outcomes, active
+
+
+def parse_ids(text):
+    if "-" in text:
+        low, high = text.split("-")
+        return list(range(int(low), int(high) + 1))
+    return [int(part) for part in text.split(",")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--student-id", type=int, default=1)
+    parser.add_argument("--alumni-ids", default="1-20", help="mentors without an active request from the student")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{'path':<8}{'p50 ms':>10}{'p95 ms':>10}{'created':>9}{'exists':>8}{'errors':>8}{'dup rounds':>12}")
+    for name, func in (("legacy", legacy), ("upsert", upsert)):
+        samples, outcomes, dup_rounds = [], [], 0
+        for alumni_id in parse_ids(args.alumni_ids):
+            round_samples, round_outcomes, active = run_round(func, args.student_id, alumni_id, args.threads)
+            samples += round_samples
+            outcomes += round_outcomes
+            dup_rounds += active > 1
+        samples.sort()
+        print(f"{name:<8}{statistics.median(samples):>10.2f}{samples[int(len(samples) * 0.95) - 1]:>10.2f}"
+              f"{outcomes.count('created'):>9}{outcomes.count('exists'):>8}{outcomes.count('error'):>8}{dup_rounds:>12}")
+
+
+if __name__ == "__main__":
+    main()
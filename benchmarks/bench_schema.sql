@@ -0,0 +1,117 @@
+-- Base tables for the synthetic benchmark database, limited to what the portal
+-- reads and writes. seed_synthetic_data.py creates these, loads the data
+-- and then applies ../schema_updates.sql on top, as a real install would.
+
+CREATE TABLE Industry (
+    Industry_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Name VARCHAR(100) NOT NULL UNIQUE,
+    Description TEXT
+);
+
+CREATE TABLE Skills (
+    Skill_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Skill_Name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE Student (
+    Student_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Name VARCHAR(100) NOT NULL,
+    College_Email VARCHAR(150) NOT NULL UNIQUE,
+    Password VARCHAR(255) NOT NULL DEFAULT '',
+    Semester INT,
+    Department VARCHAR(100),
+    PhoneNumber VARCHAR(20)
+);
+
+CREATE TABLE Alumni (
+    Alumni_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Name VARCHAR(100) NOT NULL,
+    Email VARCHAR(150) NOT NULL UNIQUE,
+    Password VARCHAR(255) NOT NULL DEFAULT '',
+    Graduating_Year INT,
+    Industry_ID INT,
+    PhoneNumber VARCHAR(20),
+    Current_Designation VARCHAR(100),
+    years_of_experience INT,
+    Approved BOOLEAN NOT NULL DEFAULT FALSE,
+    FOREIGN KEY (Industry_ID) REFERENCES Industry(Industry_ID)
+);
+
+CREATE TABLE Student_Skills (
+    Student_ID INT NOT NULL,
+    Skill_ID INT NOT NULL,
+    PRIMARY KEY (Student_ID, Skill_ID),
+    FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID) ON DELETE CASCADE,
+    FOREIGN KEY (Skill_ID) REFERENCES Skills(Skill_ID)
+);
+
+CREATE TABLE Alumni_Skills (
+    Alumni_ID INT NOT NULL,
+    Skill_ID INT NOT NULL,
+    PRIMARY KEY (Alumni_ID, Skill_ID),
+    FOREIGN KEY (Alumni_ID) REFERENCES Alumni(Alumni_ID) ON DELETE CASCADE,
+    FOREIGN KEY (Skill_ID) REFERENCES Skills(Skill_ID)
+);
+
+CREATE TABLE Mentorship_Request (
+    Request_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Student_ID INT NOT NULL,
+    Alumni_ID INT NOT NULL,
+    Request_Message TEXT,
+    Status VARCHAR(20) NOT NULL DEFAULT 'Pending',
+    Request_Date DATE,
+    Decision_Date DATE,
+    FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID) ON DELETE CASCADE,
+    FOREIGN KEY (Alumni_ID) REFERENCES Alumni(Alumni_ID) ON DELETE CASCADE,
+    INDEX idx_request_student (Student_ID, Status),
+    INDEX idx_request_alumni (Alumni_ID, Status)
+);
+
+CREATE TABLE Mentorship_Session (
+    Session_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Request_ID INT,
+    Student_ID INT NOT NULL,
+    Alumni_ID INT NOT NULL,
+    Date DATE,
+    Mode VARCHAR(20),
+    Topics_Discussed TEXT,
+    Status VARCHAR(30) NOT NULL DEFAULT 'Pending_Confirmation',
+    Meeting_Link VARCHAR(255),
+    Proposed_By VARCHAR(20),
+    Content TEXT,
+    FOREIGN KEY (Request_ID) REFERENCES Mentorship_Request(Request_ID),
+    FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID) ON DELETE CASCADE,
+    FOREIGN KEY (Alumni_ID) REFERENCES Alumni(Alumni_ID) ON DELETE CASCADE,
+    INDEX idx_session_student (Student_ID, Status),
+    INDEX idx_session_alumni (Alumni_ID, Status)
+);
+
+CREATE TABLE Feedback (
+    Feedback_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Student_ID INT NOT NULL,
+    Alumni_ID INT NOT NULL,
+    Rating INT NOT NULL,
+    Comments TEXT,
+    Date DATE,
+    FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID) ON DELETE CASCADE,
+    FOREIGN KEY (Alumni_ID) REFERENCES Alumni(Alumni_ID) ON DELETE CASCADE,
+    INDEX idx_feedback_alumni (Alumni_ID),
+    INDEX idx_feedback_student (Student_ID)
+);
+
+CREATE TABLE Placement (
+    Placement_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Student_ID INT NOT NULL,
+    Is_Placed BOOLEAN NOT NULL DEFAULT FALSE,
+    Company_Name VARCHAR(150),
+    Placement_Date DATE,
+    FOREIGN KEY (Student_ID) REFERENCES Student(Student_ID) ON DELETE CASCADE
+);
+
+CREATE TABLE Placement_Log (
+    Log_ID INT AUTO_INCREMENT PRIMARY KEY,
+    Student_ID INT NOT NULL,
+    Company_Name VARCHAR(150),
+    Placement_Date DATE,
+    Log_Timestamp DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
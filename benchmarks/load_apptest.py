@@ -0,0 +1,213 @@
+"""Drive many headless portal sessions at once with Streamlit's AppTest harness.
+
+Each simulated user logs in (session state is seeded, as the login form
+would), then walks its role's pages through the real navigation buttons of
+show_main_app(), optionally submitting a write (a quick mentorship request
+for students, an approval for admins). Every rerun is timed, and the query
+profiler summary the app stores in session_state ('last_query_profile')
+provides the DB queries, query time and pool-acquire time per rerun.
+
+AppTest keeps one global Streamlit runtime per process, so concurrent users
+run in separate worker processes (one per user, all hitting the database at
+once); each therefore has its own pool and caches, like separate server
+processes. Each --concurrency level is run in turn so latency can be read
+against load. Uses the database in portal.db.DB_CONFIG (point it at a database
+built by seed_synthetic_data.py).
+
+    python benchmarks/load_apptest.py --concurrency 1 5 10 25 --students-range 1-10000 --alumni-range 1-5000
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import pickle
+import random
+import resource
+import statistics
+import sys
+import time
+from collections import defaultdict
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+APP = os.path.join(ROOT, "app2.py")
+
+# Role -> navigation buttons clicked in order after the landing page
+JOURNEYS = {
+    "Student": ["📅 Find a Mentor / Sessions", "✏️ Edit Profile", "🏠 My Dashboard"],
+    "Alumni": ["📅 Find a Mentor / Sessions", "✏️ Edit Profile", "🏠 My Dashboard"],
+    "Administrator": ["📋 Placement Log", "👥 User Management", "📊 Analytics Dashboard"],
+}
+
+
+def session_bytes(at):
+    """Approximate per-session memory: the pickled size of everything in session_state"""
+    total = 0
+    for key in at.session_state.filtered_state:
+        try:
+            total += len(pickle.dumps(at.session_state[key], protocol=pickle.HIGHEST_PROTOCOL))
+        except Exception:
+            total += sys.getsizeof(at.session_state[key])
+    return total
+
+
+def find_button(at, label=None, prefix=None):
+    for button in at.button:
+        if (label is not None and button.label == label) or (prefix is not None and button.label.startswith(prefix)):
+            return button
+    return None
+
+
+def record(at, samples, failures, role, elapsed_ms):
+    profile = at.session_state["last_query_profile"] if "last_query_profile" in at.session_state else {}
+    page = profile.get("page", "?")
+    samples.append((page, elapsed_ms, profile.get("queries", 0), profile.get("query_ms", 0.0),
+                    profile.get("acquire_ms", 0.0)))
+    if at.exception:
+        failures.append({"role": role, "page": page, "error": at.exception[0].value})
+
+
+def run_user(role, user_id, writes, timeout):
+    """One simulated session (runs in a worker process); returns its samples"""
+    samples, failures = [], []
+    sys.path.insert(0, ROOT)  # `streamlit run` puts the app's directory on the path; AppTest does not
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.session_state["logged_in"] = True
+    at.session_state["role"] = role
+    at.session_state["user_id"] = user_id
+    at.session_state["name"] = f"Load {role} {user_id}"
+
+    try:
+        started = time.perf_counter()
+        at.run()
+        record(at, samples, failures, role, (time.perf_counter() - started) * 1000)
+
+        for label in JOURNEYS[role]:
+            button = find_button(at, label=label)
+            if button is None:
+                continue
+            started = time.perf_counter()
+            button.click().run()
+            record(at, samples, failures, role, (time.perf_counter() - started) * 1000)
+
+            # One form/action submit per journey when writes are enabled
+            if writes and role == "Student" and label == "🏠 My Dashboard":
+                action = find_button(at, prefix="📨 Quick Request")
+            elif writes and role == "Administrator" and label == "👥 User Management":
+                action = find_button(at, label="✅ Approve Selected Alumni")
+            else:
+                action = None
+            if action is not None:
+                started = time.perf_counter()
+                action.click().run()
+                record(at, samples, failures, role, (time.perf_counter() - started) * 1000)
+    except Exception as e:  # A timed-out or crashed rerun ends this user's journey
+        failures.append({"role": role, "page": None, "error": repr(e)})
+
+    return {
+        "role": role,
+        "samples": samples,
+        "failures": failures,
+        "session_bytes": session_bytes(at),
+        "peak_rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    }
+
+
+def percentile(samples, fraction):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))]
+
+
+def run_level(concurrency, args, rng):
+    users = []
+    for role in rng.choices(list(args.mix.keys()), weights=list(args.mix.values()), k=concurrency):
+        if role == "Student":
+            user_id = rng.randint(*args.students_range)
+        elif role == "Alumni":
+            user_id = rng.randint(*args.alumni_range)
+        else:
+            user_id = 1
+        users.append((role, user_id, args.writes, args.timeout))
+
+    started = time.perf_counter()
+    with multiprocessing.get_context("spawn").Pool(concurrency) as pool:
+        sessions = pool.starmap(run_user, users)
+    wall = time.perf_counter() - started
+
+    reruns, memory, rss, failures = defaultdict(list), defaultdict(list), defaultdict(list), []
+    for session in sessions:
+        for page, *sample in session["samples"]:
+            reruns[(session["role"], page)].append(sample)
+        memory[session["role"]].append(session["session_bytes"])
+        rss[session["role"]].append(session["peak_rss_kib"])
+        failures.extend(session["failures"])
+
+    pages = {}
+    for (role, page), samples in sorted(reruns.items()):
+        latencies = [sample[0] for sample in samples]
+        pages[f"{role}:{page}"] = {
+            "reruns": len(samples),
+            "p50_ms": round(percentile(latencies, 0.50), 1),
+            "p95_ms": round(percentile(latencies, 0.95), 1),
+            "queries_per_rerun": round(statistics.fmean(sample[1] for sample in samples), 1),
+            "query_ms_per_rerun": round(statistics.fmean(sample[2] for sample in samples), 1),
+            "acquire_ms_per_rerun": round(statistics.fmean(sample[3] for sample in samples), 1),
+        }
+    return {
+        "concurrency": concurrency,
+        "wall_s": round(wall, 2),
+        "pages": pages,
+        "session_state_kib": {role: round(statistics.fmean(sizes) / 1024, 1) for role, sizes in memory.items()},
+        "peak_rss_mib": {role: round(statistics.fmean(sizes) / 1024, 1) for role, sizes in rss.items()},
+        "failures": failures,
+    }
+
+
+def parse_range(text):
+    low, high = text.split("-")
+    return int(low), int(high)
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        role, weight = part.split("=")
+        mix[{"student": "Student", "alumni": "Alumni", "admin": "Administrator"}[role.strip().lower()]] = float(weight)
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("student=7,alumni=2,admin=1"))
+    parser.add_argument("--students-range", type=parse_range, default=(1, 100))
+    parser.add_argument("--alumni-range", type=parse_range, default=(1, 50))
+    parser.add_argument("--writes", action="store_true", help="also submit a request (students) or an approval (admins)")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per rerun")
+    parser.add_argument("--seed", type=int, default=11)
+    parser.add_argument("--output", help="write the full results as JSON")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = []
+    for level in args.concurrency:
+        result = run_level(level, args, rng)
+        results.append(result)
+        print(f"\n== {level} concurrent sessions ({result['wall_s']}s wall) ==")
+        print(f"{'role:page':<40}{'reruns':>7}{'p50 ms':>9}{'p95 ms':>9}{'queries':>9}{'query ms':>10}{'acquire ms':>11}")
+        for page, stats in result["pages"].items():
+            print(f"{page:<40}{stats['reruns']:>7}{stats['p50_ms']:>9.1f}{stats['p95_ms']:>9.1f}"
+                  f"{stats['queries_per_rerun']:>9.1f}{stats['query_ms_per_rerun']:>10.1f}{stats['acquire_ms_per_rerun']:>11.1f}")
+        print("session state KiB by role: " + ", ".join(f"{role}={kib}" for role, kib in result["session_state_kib"].items()))
+        print("worker peak RSS MiB by role: " + ", ".join(f"{role}={mib}" for role, mib in result["peak_rss_mib"].items()))
+        if result["failures"]:
+            print(f"{len(result['failures'])} reruns raised exceptions; first: {result['failures'][0]}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(results, handle, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Seed a MySQL database with a reproducible synthetic portal dataset.
+
+Drops and recreates --database, creates the base tables from bench_schema.sql,
+bulk-loads students, alumni, skills, requests, sessions, feedback and
+placements generated from --seed, then applies ../schema_updates.sql so the
+aggregate tables, triggers and procedures the app relies on are in place.
+Loading happens before schema_updates.sql so the triggers do not fire per row;
+its rebuild procedures compute the aggregates once at the end.
+
+    python benchmarks/seed_synthetic_data.py --students 10000 --alumni 5000 --feedback 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import mysql.connector  # noqa: E402
+
+from portal.db import DB_CONFIG  # noqa: E402
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BENCH_SCHEMA = os.path.join(HERE, "bench_schema.sql")
+SCHEMA_UPDATES = os.path.join(HERE, "..", "schema_updates.sql")
+
+INDUSTRIES = ["Software", "Finance", "Healthcare", "Consulting", "Manufacturing", "Education",
+              "Retail", "Energy", "Media", "Government", "Telecom", "Automotive"]
+SKILLS = ["Python", "Java", "SQL", "Machine Learning", "Data Analysis", "Cloud", "DevOps",
+          "Leadership", "Product Management", "Marketing", "Finance", "Public Speaking",
+          "UI Design", "Security", "Networking", "C++", "Statistics", "Project Management",
+          "Sales", "Research", "JavaScript", "React", "Go", "Rust", "Kubernetes", "Docker",
+          "Deep Learning", "NLP", "Computer Vision", "Embedded Systems", "VLSI", "Excel",
+          "Accounting", "Negotiation", "Writing", "Design Thinking", "Agile", "Testing",
+          "Mobile Development", "Big Data"]
+DEPARTMENTS = ["CSE", "ECE", "EEE", "ME", "CE", "BT", "AIML"]
+DESIGNATIONS = ["Software Engineer", "Senior Engineer", "Data Scientist", "Product Manager",
+                "Consultant", "Analyst", "Engineering Manager", "Architect", "Director"]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises",
+             "Wonka", "Cyberdyne", "Soylent", "Tyrell", "Vandelay", "Pied Piper", "Aperture"]
+FIRST_NAMES = ["Aarav", "Diya", "Kabir", "Meera", "Rohan", "Sara", "Vikram", "Anaya", "Ishaan",
+               "Priya", "Arjun", "Nisha", "Dev", "Kavya", "Rahul", "Tara", "Neha", "Aditya"]
+LAST_NAMES = ["Sharma", "Mahesh", "Iyer", "Rao", "Patel", "Gupta", "Nair", "Reddy", "Kumar",
+              "Singh", "Menon", "Das", "Joshi", "Bhat"]
+BATCH = 5000
+
+
+def sql_statements(path):
+    """Split a mysql-client script into statements, honouring DELIMITER lines"""
+    delimiter, buffer = ";", []
+    with open(path, encoding="utf-8") as script:
+        for line in script:
+            stripped = line.strip()
+            if stripped.upper().startswith("DELIMITER "):
+                delimiter = stripped.split(None, 1)[1]
+                continue
+            if not buffer and (not stripped or stripped.startswith("--")):
+                continue
+            buffer.append(line)
+            if stripped.endswith(delimiter):
+                statement = "".join(buffer).rstrip()[: -len(delimiter)].strip()
+                buffer = []
+                if statement:
+                    yield statement
+    if "".join(buffer).strip():
+        yield "".join(buffer).strip()
+
+
+def run_script(cursor, path):
+    for statement in sql_statements(path):
+        cursor.execute(statement)
+        if cursor.with_rows:
+            cursor.fetchall()
+
+
+def insert_rows(connection, table, columns, rows):
+    """Multi-row INSERT in BATCH-sized transactions"""
+    cursor = connection.cursor()
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    for start in range(0, len(rows), BATCH):
+        cursor.executemany(query, rows[start:start + BATCH])
+        connection.commit()
+    cursor.close()
+
+
+def random_date(rng, start, end):
+    return start + timedelta(days=rng.randint(0, (end - start).days))
+
+
+def generate(args):
+    """Build every table's rows in memory from the seed (IDs follow insertion order)"""
+    rng = random.Random(args.seed)
+    today = date.today()
+    data = {}
+
+    data["Industry"] = (["Name", "Description"], [(name, f"{name} industry") for name in INDUSTRIES])
+    data["Skills"] = (["Skill_Name"], [(name,) for name in SKILLS])
+
+    students = []
+    for sid in range(1, args.students + 1):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        students.append((name, f"student{sid}@college.edu", "password", rng.randint(1, 8),
+                         rng.choice(DEPARTMENTS), f"9{rng.randint(100000000, 999999999)}"))
+    data["Student"] = (["Name", "College_Email", "Password", "Semester", "Department", "PhoneNumber"], students)
+
+    alumni = []
+    for aid in range(1, args.alumni + 1):
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        alumni.append((name, f"alumni{aid}@example.com", "password", rng.randint(1995, today.year - 1),
+                       rng.randint(1, len(INDUSTRIES)), f"8{rng.randint(100000000, 999999999)}",
+                       rng.choice(DESIGNATIONS), rng.randint(0, 30), rng.random() < args.approved_ratio))
+    data["Alumni"] = (["Name", "Email", "Password", "Graduating_Year", "Industry_ID", "PhoneNumber",
+                       "Current_Designation", "years_of_experience", "Approved"], alumni)
+
+    def skill_links(count):
+        return [(owner, skill) for owner in range(1, count + 1)
+                for skill in rng.sample(range(1, len(SKILLS) + 1), args.skills_per_user)]
+    data["Student_Skills"] = (["Student_ID", "Skill_ID"], skill_links(args.students))
+    data["Alumni_Skills"] = (["Alumni_ID", "Skill_ID"], skill_links(args.alumni))
+
+    # Requests: unique (student, mentor) pairs so the active-pair key can be added afterwards
+    requests, accepted, pairs = [], [], set()
+    while len(requests) < args.requests:
+        pair = (rng.randint(1, args.students), rng.randint(1, args.alumni))
+        if pair in pairs:
+            continue
+        pairs.add(pair)
+        status = rng.choices(["Pending", "Accepted", "Declined"], weights=[3, 5, 2])[0]
+        requested = random_date(rng, today - timedelta(days=730), today)
+        decided = None if status == "Pending" else requested + timedelta(days=rng.randint(0, 14))
+        requests.append((pair[0], pair[1], "I would like your guidance.", status, requested, decided))
+        if status == "Accepted":
+            accepted.append((len(requests), pair, decided))
+    data["Mentorship_Request"] = (["Student_ID", "Alumni_ID", "Request_Message", "Status", "Request_Date",
+                                   "Decision_Date"], requests)
+
+    sessions = []
+    for _ in range(min(args.sessions, len(accepted) * 3)):
+        request_id, (sid, aid), decided = rng.choice(accepted)
+        status = rng.choices(["Pending_Confirmation", "Confirmed", "Completed"], weights=[1, 2, 5])[0]
+        content = " ".join(rng.choices(SKILLS, k=rng.randint(20, 200))) if status == "Completed" else None
+        sessions.append((request_id, sid, aid, decided + timedelta(days=rng.randint(1, 30)),
+                         rng.choice(["Online", "In-person"]), rng.choice(SKILLS),
+                         status, f"https://meet.example.com/{rng.randint(0, 10 ** 9):09d}", "Student", content))
+    data["Mentorship_Session"] = (["Request_ID", "Student_ID", "Alumni_ID", "Date", "Mode", "Topics_Discussed",
+                                   "Status", "Meeting_Link", "Proposed_By", "Content"], sessions)
+
+    feedback = [(rng.randint(1, args.students), rng.randint(1, args.alumni), rng.choices([1, 2, 3, 4, 5], [1, 1, 3, 5, 5])[0],
+                 "Helpful session.", random_date(rng, today - timedelta(days=730), today))
+                for _ in range(args.feedback)]
+    data["Feedback"] = (["Student_ID", "Alumni_ID", "Rating", "Comments", "Date"], feedback)
+
+    placements, log = [], []
+    for sid in rng.sample(range(1, args.students + 1), int(args.students * args.placed_ratio)):
+        company, placed_on = rng.choice(COMPANIES), random_date(rng, today - timedelta(days=1095), today)
+        placements.append((sid, True, company, placed_on))
+        log.append((sid, company, placed_on, datetime.combine(placed_on, datetime.min.time()) + timedelta(hours=rng.randint(8, 20))))
+    data["Placement"] = (["Student_ID", "Is_Placed", "Company_Name", "Placement_Date"], placements)
+    data["Placement_Log"] = (["Student_ID", "Company_Name", "Placement_Date", "Log_Timestamp"], log)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", default="AlumniMentorshipBench")
+    parser.add_argument("--students", type=int, default=10000)
+    parser.add_argument("--alumni", type=int, default=5000)
+    parser.add_argument("--requests", type=int, default=50000)
+    parser.add_argument("--sessions", type=int, default=30000)
+    parser.add_argument("--feedback", type=int, default=1000000)
+    parser.add_argument("--skills-per-user", type=int, default=5)
+    parser.add_argument("--approved-ratio", type=float, default=0.9)
+    parser.add_argument("--placed-ratio", type=float, default=0.4)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    data = generate(args)
+    print(f"Generated dataset in {time.perf_counter() - started:.1f}s")
+
+    server = {key: value for key, value in DB_CONFIG.items() if key != "database"}
+    connection = mysql.connector.connect(**server)
+    cursor = connection.cursor()
+    cursor.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+    cursor.execute(f"CREATE DATABASE `{args.database}`")
+    cursor.execute(f"USE `{args.database}`")
+    run_script(cursor, BENCH_SCHEMA)
+    cursor.execute("SET unique_checks = 0, foreign_key_checks = 0")
+
+    for table, (columns, rows) in data.items():
+        table_started = time.perf_counter()
+        insert_rows(connection, table, columns, rows)
+        print(f"  {table:<20}{len(rows):>10,} rows  {time.perf_counter() - table_started:6.1f}s")
+
+    cursor.execute("SET unique_checks = 1, foreign_key_checks = 1")
+    schema_started = time.perf_counter()
+    run_script(cursor, SCHEMA_UPDATES)
+    connection.commit()
+    print(f"Applied schema_updates.sql in {time.perf_counter() - schema_started:.1f}s")
+    cursor.close()
+    connection.close()
+    print(f"Seeded `{args.database}` in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
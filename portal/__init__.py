@@ -0,0 +1,6 @@
+"""Student-Alumni Mentorship Portal
+
+portal.db and portal.data hold the data layer and never import Streamlit, so
+they can be used from scripts and benchmarks; portal.ui holds the pages, which
+app2.py imports only when their route is selected.
+"""
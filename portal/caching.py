@@ -0,0 +1,76 @@
+"""Process-wide caches for the data layer
+
+Stand-ins for st.cache_data / st.cache_resource that do not need Streamlit:
+results are shared by every session in the server process, exactly as the
+Streamlit caches were.
+"""
+import copy
+import functools
+import threading
+import time
+
+_data_caches = []
+
+def ttl_cache(ttl):
+    """Cache a loader's result per argument tuple for ``ttl`` seconds
+
+    Like st.cache_data, callers get their own copy of the cached value and
+    ``loader.clear()`` drops every entry. None (a failed query) is never cached,
+    and neither is a load that was already running when clear() was called,
+    since it may have read the data the clear was meant to invalidate.
+    """
+    def decorator(func):
+        lock = threading.Lock()
+        entries = {}  # args -> (expires_at, value)
+        generation = [0]  # Bumped by clear(); loads started under an older one are not stored
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                entry = entries.get(args)
+                started_generation = generation[0]
+            if entry is None or entry[0] <= now:
+                value = func(*args)
+                if value is None:
+                    return None
+                entry = (now + ttl, value)
+                with lock:
+                    if generation[0] == started_generation:
+                        entries[args] = entry
+            return copy.deepcopy(entry[1])
+
+        def clear():
+            with lock:
+                generation[0] += 1
+                entries.clear()
+
+        wrapper.clear = clear
+        _data_caches.append(wrapper)
+        return wrapper
+    return decorator
+
+def singleton(func):
+    """Create a shared object on first use (st.cache_resource for zero-argument factories)"""
+    lock = threading.Lock()
+    instance = []
+
+    @functools.wraps(func)
+    def wrapper():
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(func())
+        return instance[0]
+
+    def clear():
+        with lock:
+            instance.clear()
+
+    wrapper.clear = clear
+    return wrapper
+
+def clear_data_caches():
+    """Drop every ttl_cache entry (what st.cache_data.clear() did); shared objects are kept"""
+    for cache in _data_caches:
+        cache.clear()
@@ -0,0 +1 @@
+"""Data access for the portal, one module per area; import the module you need"""
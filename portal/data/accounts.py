@@ -0,0 +1,306 @@
+"""Logins, registration, profiles, alumni approval and the user directory"""
+from mysql.connector import Error
+
+from portal.data.analytics import get_site_statistics, invalidate_site_statistics
+from portal.data.mentors import on_mentor_changed
+from portal.db import execute_query, get_db_connection, report_error, report_warning
+
+def login_user(email, password, role):
+    """Authenticate user login, explicitly handling empty string passwords for existing users."""
+    table_name = ""
+    id_column = ""
+
+    # Determine table and columns
+    if role == 'Student':
+        table_name = "Student"
+        id_column = "Student_ID"
+        email_column = "College_Email"
+        # Query checks for: 1. Password matches OR 2. DB password is blank AND user provided blank password
+        # Note: We must check for both NULL and '' since the user's DB has NOT NULL but existing records are ''
+        query = f"SELECT {id_column} as user_id, Name FROM {table_name} WHERE {email_column} = %s AND (Password = %s OR Password = '')"
+    elif role == 'Alumni':
+        table_name = "Alumni"
+        id_column = "Alumni_ID"
+        email_column = "Email"
+        query = f"SELECT {id_column} as user_id, Name FROM {table_name} WHERE {email_column} = %s AND (Password = %s OR Password = '') AND Approved = TRUE"
+    elif role == 'Administrator':  # Admin login with simple password
+        table_name = "Admin"
+        id_column = "Admin_ID"
+        email_column = "Email"
+        # Admin must always use a password
+        query = f"SELECT {id_column} as user_id, Name FROM {table_name} WHERE {email_column} = %s AND Password = %s"
+    else:
+        return None
+
+    # For Student/Alumni, we pass the user input password once.
+    if role in ['Student', 'Alumni']:
+        result = execute_query(query, (email, password))
+    
+    # For Admin, we pass it twice for the specific admin query
+    elif role == 'Administrator':
+        result = execute_query(query, (email, password))
+        
+    # Handle Admin fallback (existing logic)
+    if role == 'Administrator' and password == 'admin':
+        if not result or len(result) == 0:
+            return {'user_id': 1, 'Name': 'Administrator'}
+
+    # Check for pending alumni approval
+    if role == 'Alumni' and (not result or len(result) == 0):
+        pending_query = f"SELECT {id_column} FROM {table_name} WHERE {email_column} = %s AND (Password = %s OR Password = '') AND Approved = FALSE"
+        pending_result = execute_query(pending_query, (email, password))
+        if pending_result and len(pending_result) > 0:
+            report_error("Login failed: Your account is pending administrator approval.")
+            return None
+            
+    if result and len(result) > 0:
+        return result[0]
+    
+    return None
+
+def register_user(email, password, name, role, **kwargs):
+    """Register a new user"""
+    connection = None
+    try:
+        connection = get_db_connection()
+        if connection is None:
+            return False
+        
+        cursor = connection.cursor()
+        
+        if role == 'Student':
+            # Assumes Student table has: Name, College_Email, Password, Semester, Department, PhoneNumber
+            query = """
+            INSERT INTO Student (Name, College_Email, Password, Semester, Department, PhoneNumber) 
+            VALUES (%s, %s, %s, %s, %s, %s)
+            """
+            values = (name, email, password, kwargs.get('semester'), 
+                     kwargs.get('department'), kwargs.get('phone_number'))
+        else:  # Alumni
+            # Assumes Alumni table has: Name, Email, Password, Graduating_Year, Industry_ID, PhoneNumber, Current_Designation, years_of_experience, Approved
+            query = """
+            INSERT INTO Alumni (Name, Email, Password, Graduating_Year, Industry_ID, PhoneNumber, Current_Designation, years_of_experience, Approved) 
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """
+            values = (name, email, password, kwargs.get('graduating_year'), 
+                     kwargs.get('industry_id'), kwargs.get('phone_number'),
+                     kwargs.get('current_designation'), kwargs.get('years_of_experience'), False) # Not approved by default
+        
+        cursor.execute(query, values)
+        cursor.close()
+        return True
+    except Error as e:
+        if e.errno == 1062: # Duplicate entry
+            report_error(f"Registration error: An account with the email '{email}' already exists.")
+        else:
+            report_error(f"Registration error: {e}")
+        return False
+    finally:
+        if connection:
+            connection.close()
+
+def get_alumni_info(alumni_id):
+    """Get alumni information"""
+    query = """
+    SELECT a.*, i.Name as Industry_Name 
+    FROM Alumni a 
+    LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID 
+    WHERE a.Alumni_ID = %s
+    """
+    result = execute_query(query, (alumni_id,))
+    return result[0] if result else None
+
+def get_alumni_achievements(alumni_id):
+    """Get achievements for an alumni"""
+    try:
+        query = "SELECT * FROM Achievements WHERE Alumni_ID = %s"
+        return execute_query(query, (alumni_id,))
+    except Error as e:
+        if e.errno == 1146:  # Table doesn't exist
+            report_warning("Achievements table is missing. Please contact the administrator.")
+            return []
+        else:
+            report_error(f"Error fetching achievements: {e}")
+            return []
+
+def update_alumni_profile(alumni_id, **kwargs):
+    """Update alumni profile information"""
+    connection = get_db_connection()
+    if connection is None:
+        return False
+    
+    try:
+        cursor = connection.cursor()
+        
+        # Update Alumni table
+        update_fields = []
+        update_values = []
+        
+        if 'name' in kwargs:
+            update_fields.append("Name = %s")
+            update_values.append(kwargs['name'])
+        if 'email' in kwargs:
+            update_fields.append("Email = %s")
+            update_values.append(kwargs['email'])
+        if 'phone_number' in kwargs:
+            update_fields.append("PhoneNumber = %s")
+            update_values.append(kwargs['phone_number'])
+        if 'current_designation' in kwargs:
+            update_fields.append("Current_Designation = %s")
+            update_values.append(kwargs['current_designation'])
+        if 'years_of_experience' in kwargs:
+            update_fields.append("years_of_experience = %s")
+            update_values.append(kwargs['years_of_experience'])
+        if 'industry_id' in kwargs:
+            update_fields.append("Industry_ID = %s")
+            update_values.append(kwargs['industry_id'])
+        
+        if update_fields:
+            update_values.append(alumni_id)
+            query = f"UPDATE Alumni SET {', '.join(update_fields)} WHERE Alumni_ID = %s"
+            cursor.execute(query, tuple(update_values))
+        
+        cursor.close()
+    except Error as e:
+        report_error(f"Error updating profile: {e}")
+        return False
+    finally:
+        connection.close()
+
+    on_mentor_changed(alumni_id)
+    return True
+
+def get_student_info(student_id):
+    """Get student information"""
+    query = "SELECT * FROM Student WHERE Student_ID = %s"
+    result = execute_query(query, (student_id,))
+    return result[0] if result else None
+
+def get_pending_alumni():
+    """Get alumni pending approval"""
+    query = """
+    SELECT a.Alumni_ID, a.Name, a.Email, a.Graduating_Year, i.Name as Industry_Name, a.Approved 
+    FROM Alumni a 
+    LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID 
+    WHERE a.Approved = FALSE
+    """
+    return execute_query(query)
+
+def approve_alumni(alumni_id):
+    """Approve an alumni"""
+    query = "UPDATE Alumni SET Approved = TRUE WHERE Alumni_ID = %s"
+    result = execute_query(query, (alumni_id,), fetch=False)
+    if result:
+        on_mentor_changed(alumni_id)
+        invalidate_site_statistics()
+    return result
+
+# Admin user directory: per-role table layout, sortable columns and searchable prefixes
+USER_DIRECTORY_PAGE_SIZE = 50
+USER_DIRECTORY_COUNT_CAP = 1000
+USER_DIRECTORY = {
+    'Student': {
+        'table': 'Student',
+        'id': 'Student_ID',
+        'columns': 'Student_ID, Name, College_Email, Department, Semester',
+        'sort': {'Name': 'Name', 'Email': 'College_Email', 'Department': 'Department', 'Newest': 'Student_ID'},
+        'search': ['Name', 'College_Email', 'Department'],
+    },
+    'Alumni': {
+        'table': 'Alumni',
+        'id': 'Alumni_ID',
+        'columns': 'Alumni_ID, Name, Email, Graduating_Year, Current_Designation, Approved',
+        'sort': {'Name': 'Name', 'Email': 'Email', 'Graduating Year': 'Graduating_Year', 'Newest': 'Alumni_ID'},
+        'search': ['Name', 'Email'],
+    },
+}
+
+def _user_directory_where(role, search):
+    """Prefix search across the role's indexed columns"""
+    search = (search or '').strip()
+    if not search:
+        return "", []
+    columns = USER_DIRECTORY[role]['search']
+    return " WHERE (" + " OR ".join(f"{column} LIKE %s" for column in columns) + ")", [f"{search}%"] * len(columns)
+
+def _user_directory_seek(sort_column, id_column, descending, cursor):
+    """Keyset predicate for the rows after ``cursor``, following MySQL's order where NULL sorts lowest
+
+    Department, Graduating_Year and the rest are nullable, and ``col > NULL``
+    is never true, so a page ending on a NULL needs its own branch.
+    """
+    value, last_id = cursor
+    comparison = "<" if descending else ">"
+    if value is None:
+        # NULLs come first ascending (then every non-NULL row) and last descending
+        clause = f"({sort_column} IS NULL AND {id_column} {comparison} %s)"
+        if not descending:
+            clause = f"({clause} OR {sort_column} IS NOT NULL)"
+        return clause, [last_id]
+    clause = f"{sort_column} {comparison} %s OR ({sort_column} = %s AND {id_column} {comparison} %s)"
+    if descending:
+        clause += f" OR {sort_column} IS NULL"
+    return f"({clause})", [value, value, last_id]
+
+def get_user_directory_page(role, search='', sort='Name', descending=False, page_size=USER_DIRECTORY_PAGE_SIZE, cursor=None):
+    """Get one page of students or alumni for the admin directory
+
+    Ordered by the chosen sort column then ID (``Newest`` sorts by ID alone,
+    always descending). ``cursor`` is the (sort value, id) of the last row of
+    the previous page. Returns (rows, next_cursor).
+    """
+    spec = USER_DIRECTORY[role]
+    sort_column, id_column = spec['sort'][sort], spec['id']
+    if sort_column == id_column:
+        descending = True
+    direction, comparison = ("DESC", "<") if descending else ("ASC", ">")
+
+    where, params = _user_directory_where(role, search)
+    query = f"SELECT {spec['columns']} FROM {spec['table']}{where}"
+    if cursor is not None:
+        query += " AND " if where else " WHERE "
+        if sort_column == id_column:
+            query += f"{id_column} {comparison} %s"
+            params.append(cursor[1])
+        else:
+            seek, seek_params = _user_directory_seek(sort_column, id_column, descending, cursor)
+            query += seek
+            params.extend(seek_params)
+    if sort_column == id_column:
+        query += f" ORDER BY {id_column} {direction} LIMIT %s"
+    else:
+        query += f" ORDER BY {sort_column} {direction}, {id_column} {direction} LIMIT %s"
+    params.append(page_size + 1)
+
+    rows = execute_query(query, tuple(params))
+    if rows is None or len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, (rows[-1][sort_column], rows[-1][id_column])
+
+def count_users(role, search=''):
+    """Directory total: cached Site_Counters without a search, else a capped count of matches
+
+    Returns (count, capped); capped is True when there are more than
+    USER_DIRECTORY_COUNT_CAP matches.
+    """
+    if not (search or '').strip():
+        stats = get_site_statistics()
+        if role == 'Student':
+            return stats['total_students'], False
+        return stats['total_alumni'] + stats['pending_alumni'], False
+
+    spec = USER_DIRECTORY[role]
+    where, params = _user_directory_where(role, search)
+    query = f"SELECT COUNT(*) as count FROM (SELECT 1 FROM {spec['table']}{where} LIMIT %s) matches"
+    params.append(USER_DIRECTORY_COUNT_CAP + 1)
+    result = execute_query(query, tuple(params))
+    count = result[0]['count'] if result else 0
+    return min(count, USER_DIRECTORY_COUNT_CAP), count > USER_DIRECTORY_COUNT_CAP
+
+def get_student_profile(student_id):
+    return get_student_info(student_id)
+
+def update_student_profile(student_id, department, semester):
+    q = "UPDATE Student SET Department = %s, Semester = %s WHERE Student_ID = %s"
+    return execute_query(q, (department, semester, student_id), fetch=False)
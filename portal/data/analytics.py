@@ -0,0 +1,216 @@
+"""Site statistics, placement trends and the placement log"""
+import tempfile
+from datetime import timedelta
+
+from mysql.connector import Error
+
+from portal.caching import ttl_cache
+from portal.data.reference import _reference_data
+from portal.db import execute_query, get_db_connection, report_error
+
+# Site-wide totals come from the trigger-maintained Site_Counters table and may be this many seconds stale
+SITE_COUNTERS_MAX_AGE = 60  # seconds
+SITE_COUNTER_NAMES = ('total_students', 'total_alumni', 'pending_alumni', 'total_placements')
+
+@ttl_cache(SITE_COUNTERS_MAX_AGE)
+def _load_site_counters():
+    rows = execute_query("SELECT Counter_Name, Counter_Value FROM Site_Counters")
+    if rows is None:
+        return None
+    return {row['Counter_Name']: int(row['Counter_Value']) for row in rows}
+
+def get_site_statistics():
+    """Get overall site statistics (one primary-key read, cached for SITE_COUNTERS_MAX_AGE)"""
+    counters = _reference_data(_load_site_counters) or {}
+    return {name: counters.get(name, 0) for name in SITE_COUNTER_NAMES}
+
+def invalidate_site_statistics():
+    """Drop the cached counters so the next read sees the latest values"""
+    _load_site_counters.clear()
+
+def rebuild_site_counters():
+    """Recount Site_Counters from the base tables (fixes drift after manual edits)"""
+    result = execute_query("CALL proc_RebuildSiteCounters()", fetch=False) is not None
+    invalidate_site_statistics()
+    return result
+
+# Placement_Rollup bucket sizes; each maps to the pandas frequency used to fill empty buckets
+TREND_GRANULARITIES = {'day': 'D', 'week': 'W-MON', 'month': 'MS'}
+
+def trend_bucket_start(day, granularity):
+    """First day of the day/week (Monday)/month bucket containing ``day``"""
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day
+
+@ttl_cache(SITE_COUNTERS_MAX_AGE)
+def _load_placement_trends(start_date, end_date, granularity):
+    query = """
+    SELECT Bucket_Start as date, Placements as count
+    FROM Placement_Rollup
+    WHERE Granularity = %s AND Bucket_Start BETWEEN %s AND %s AND Placements > 0
+    ORDER BY Bucket_Start
+    """
+    return execute_query(query, (granularity, trend_bucket_start(start_date, granularity), end_date))
+
+def get_placement_trends(start_date, end_date, granularity='day'):
+    """Get placements per day/week/month bucket overlapping [start_date, end_date]
+
+    Reads only the requested buckets from the trigger-maintained
+    Placement_Rollup table; cached for SITE_COUNTERS_MAX_AGE seconds.
+    """
+    if granularity not in TREND_GRANULARITIES:
+        raise ValueError(f"granularity must be one of {', '.join(TREND_GRANULARITIES)}")
+    result = _load_placement_trends(start_date, end_date, granularity)
+    if result is None:
+        _load_placement_trends.clear()
+    return result
+
+def invalidate_placement_trends():
+    """Drop cached trends and counters after a placement write so the admin charts catch up"""
+    _load_placement_trends.clear()
+    _load_site_counters.clear()
+
+def rebuild_placement_rollup():
+    """Recompute Placement_Rollup from the Placement table"""
+    result = execute_query("CALL proc_RebuildPlacementRollup()", fetch=False) is not None
+    _load_placement_trends.clear()
+    return result
+
+# Placement log viewer page size and export read size
+PLACEMENT_LOG_PAGE_SIZE = 50
+PLACEMENT_LOG_EXPORT_CHUNK = 5000
+# st.download_button holds the whole file in memory, so downloads from the UI are capped
+PLACEMENT_LOG_EXPORT_MAX_ROWS = 100000
+PLACEMENT_LOG_COLUMNS = ['Log_ID', 'Log_Timestamp', 'Student_ID', 'Student_Name', 'Company_Name', 'Placement_Date']
+
+def _placement_log_query(filters):
+    """Build the filtered log SELECT (newest first) and its parameters"""
+    query = """
+    SELECT pl.Log_ID, pl.Log_Timestamp, pl.Student_ID, s.Name as Student_Name, pl.Company_Name, pl.Placement_Date
+    FROM Placement_Log pl
+    LEFT JOIN Student s ON pl.Student_ID = s.Student_ID
+    WHERE 1 = 1
+    """
+    params = []
+    filters = filters or {}
+    student = (filters.get('student') or '').strip()
+    if student.isdigit():
+        query += " AND pl.Student_ID = %s"
+        params.append(int(student))
+    elif student:
+        query += " AND s.Name LIKE %s"
+        params.append(f"{student}%")
+    if filters.get('company'):
+        query += " AND pl.Company_Name LIKE %s"
+        params.append(f"{filters['company'].strip()}%")
+    if filters.get('date_from'):
+        query += " AND pl.Log_Timestamp >= %s"
+        params.append(filters['date_from'])
+    if filters.get('date_to'):
+        query += " AND pl.Log_Timestamp < %s"
+        params.append(filters['date_to'] + timedelta(days=1))
+    return query, params
+
+def get_placement_log(filters=None, page_size=PLACEMENT_LOG_PAGE_SIZE, cursor=None):
+    """Get one page of placement log entries, newest first
+
+    Filters: student (ID or name prefix), company (prefix), date_from/date_to
+    (log dates, inclusive). ``cursor`` is the (Log_Timestamp, Log_ID) of the
+    last row of the previous page. Returns (rows, next_cursor); next_cursor is
+    None on the last page and rows is None on a database error.
+    """
+    query, params = _placement_log_query(filters)
+    if cursor is not None:
+        query += " AND (pl.Log_Timestamp < %s OR (pl.Log_Timestamp = %s AND pl.Log_ID < %s))"
+        params.extend([cursor[0], cursor[0], cursor[1]])
+    query += " ORDER BY pl.Log_Timestamp DESC, pl.Log_ID DESC LIMIT %s"
+    params.append(page_size + 1)
+
+    rows = execute_query(query, tuple(params))
+    if rows is None or len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, (rows[-1]['Log_Timestamp'], rows[-1]['Log_ID'])
+
+def _placement_log_schema():
+    """Fixed Arrow schema for Parquet exports, so an all-NULL chunk can't infer a ``null`` column type"""
+    import pyarrow as pa
+
+    return pa.schema([
+        ('Log_ID', pa.int64()),
+        ('Log_Timestamp', pa.timestamp('us')),
+        ('Student_ID', pa.int64()),
+        ('Student_Name', pa.string()),
+        ('Company_Name', pa.string()),
+        ('Placement_Date', pa.date32()),
+    ])
+
+def export_placement_log(filters=None, fmt='csv', max_rows=None):
+    """Stream the filtered placement log into a temporary CSV or Parquet file
+
+    Rows are read from an unbuffered cursor PLACEMENT_LOG_EXPORT_CHUNK at a
+    time and appended to the file, so memory use does not grow with the log.
+    ``max_rows`` keeps only the newest that many entries. Returns the open
+    file positioned at the start (deleted when closed), or None on failure.
+    """
+    import pandas as pd  # Only exports need pandas; keep it off the import path of other pages
+
+    connection = get_db_connection()
+    if connection is None:
+        return None
+
+    out = tempfile.TemporaryFile()
+    writer = cursor = None
+    finished = False
+    try:
+        if fmt == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            schema = _placement_log_schema()
+            writer = pq.ParquetWriter(out, schema)
+        query, params = _placement_log_query(filters)
+        query += " ORDER BY pl.Log_Timestamp DESC, pl.Log_ID DESC"
+        if max_rows is not None:
+            query += " LIMIT %s"
+            params.append(max_rows)
+        cursor = connection.cursor(buffered=False)
+        cursor.execute(query, tuple(params))
+        header = True
+        while True:
+            rows = cursor.fetchmany(PLACEMENT_LOG_EXPORT_CHUNK)
+            if not rows:
+                break
+            chunk = pd.DataFrame(rows, columns=PLACEMENT_LOG_COLUMNS)
+            if writer is not None:
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            else:
+                out.write(chunk.to_csv(index=False, header=header).encode('utf-8'))
+                header = False
+        if writer is not None:
+            writer.close()  # Writes the footer; with no rows this is an empty file that still has the schema
+        elif header:
+            out.write((','.join(PLACEMENT_LOG_COLUMNS) + '\n').encode('utf-8'))
+        out.seek(0)
+        finished = True
+        return out
+    except Error as e:
+        report_error(f"Error exporting placement log: {e}")
+        return None
+    finally:
+        if cursor is not None:
+            try:
+                cursor.close()
+            except Error:
+                pass  # Rows left unread; the pool discards the connection on release
+        connection.close()
+        if not finished:
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+            out.close()
@@ -0,0 +1,264 @@
+"""CSV or Parquet bulk import of students, alumni, skills and placements"""
+import re
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+import pandas as pd
+from mysql.connector import Error
+
+from portal.data.analytics import invalidate_placement_trends
+from portal.data.mentors import mark_mentor_indexes_stale
+from portal.data.reference import get_industries
+from portal.data.skills import SKILL_LINK_TABLES, bulk_sync_skills
+from portal.db import get_db_connection
+
+IMPORT_CHUNK_SIZE = 1000
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Entity -> (required columns, optional columns)
+IMPORT_COLUMNS = {
+    'Students': (['name', 'email', 'password', 'department', 'semester'], ['phone_number']),
+    'Alumni': (['name', 'email', 'password', 'graduating_year', 'industry', 'current_designation'],
+               ['phone_number', 'years_of_experience']),
+    'Skills': (['role', 'email', 'skills'], []),
+    'Placements': (['email', 'company_name', 'placement_date'], []),
+}
+
+def iter_import_file(uploaded_file, chunk_size=IMPORT_CHUNK_SIZE):
+    """Stream an uploaded CSV or Parquet file as (DataFrame chunk, fraction of file read)
+
+    Every column comes back as text, as with the CSV reader, so a nullable
+    integer column (phone numbers) doesn't turn into floats like "5551234567.0".
+    """
+    if uploaded_file.name.lower().endswith('.parquet'):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(uploaded_file)
+        as_text = pa.schema([(field.name, pa.string()) for field in parquet.schema_arrow])
+        total = parquet.metadata.num_rows or 1
+        done = 0
+        for batch in parquet.iter_batches(batch_size=chunk_size):
+            done += batch.num_rows
+            yield pa.Table.from_batches([batch]).cast(as_text).to_pandas(), done / total
+    else:
+        size = uploaded_file.size or 1
+        for chunk in pd.read_csv(uploaded_file, chunksize=chunk_size, dtype=str, keep_default_na=False):
+            yield chunk, min(uploaded_file.tell() / size, 1.0)
+
+def _cell(values, column):
+    value = values.get(column)
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return ''
+    return str(value).strip()
+
+def _parse_int(text, column, low=None, high=None):
+    # Decimal rather than float: "nan", "inf" and "1e400" must fail the row, not the import
+    try:
+        value = Decimal(text)
+    except InvalidOperation:
+        raise ValueError(f"{column} must be a number")
+    if not value.is_finite() or value != value.to_integral_value():
+        raise ValueError(f"{column} must be a whole number")
+    if (low is not None and value < low) or (high is not None and value > high):
+        raise ValueError(f"{column} must be between {low} and {high}")
+    return int(value)
+
+def _validate_import_row(entity, values, industries):
+    """Turn one raw row into a clean record, raising ValueError with a readable reason"""
+    required, _ = IMPORT_COLUMNS[entity]
+    for column in required:
+        if not _cell(values, column):
+            raise ValueError(f"{column} is required")
+
+    email = _cell(values, 'email').lower()
+    if not EMAIL_PATTERN.match(email):
+        raise ValueError("email is not a valid address")
+    record = {'email': email}
+
+    if entity == 'Students':
+        record.update({
+            'name': _cell(values, 'name'),
+            'password': _cell(values, 'password'),
+            'department': _cell(values, 'department'),
+            'semester': _parse_int(_cell(values, 'semester'), 'semester', 1, 10),
+            'phone_number': _cell(values, 'phone_number') or None,
+        })
+    elif entity == 'Alumni':
+        industry_id = industries.get(_cell(values, 'industry').lower())
+        if industry_id is None:
+            raise ValueError(f"unknown industry '{_cell(values, 'industry')}'")
+        experience = _cell(values, 'years_of_experience')
+        record.update({
+            'name': _cell(values, 'name'),
+            'password': _cell(values, 'password'),
+            'graduating_year': _parse_int(_cell(values, 'graduating_year'), 'graduating_year', 1950, datetime.now().year),
+            'industry_id': industry_id,
+            'current_designation': _cell(values, 'current_designation'),
+            'years_of_experience': _parse_int(experience, 'years_of_experience', 0, 80) if experience else None,
+            'phone_number': _cell(values, 'phone_number') or None,
+        })
+    elif entity == 'Skills':
+        role = _cell(values, 'role').title()
+        if role not in SKILL_LINK_TABLES:
+            raise ValueError("role must be Student or Alumni")
+        record.update({
+            'role': role,
+            'skills': [name.strip() for name in _cell(values, 'skills').split(';') if name.strip()],
+        })
+    else:  # Placements
+        try:
+            placement_date = pd.to_datetime(_cell(values, 'placement_date')).date()
+        except (ValueError, TypeError):
+            raise ValueError("placement_date must be a date (YYYY-MM-DD)")
+        record.update({'company_name': _cell(values, 'company_name'), 'placement_date': placement_date})
+    return record
+
+def _lookup_ids_by_email(cursor, role, emails):
+    """Map lower-cased emails to Student_ID / Alumni_ID for one chunk"""
+    if not emails:
+        return {}
+    table, id_column, email_column = {
+        'Student': ('Student', 'Student_ID', 'College_Email'),
+        'Alumni': ('Alumni', 'Alumni_ID', 'Email'),
+    }[role]
+    format_strings = ','.join(['%s'] * len(emails))
+    cursor.execute(f"SELECT {id_column}, {email_column} FROM {table} WHERE {email_column} IN ({format_strings})",
+                   tuple(emails))
+    return {row[1].lower(): row[0] for row in cursor.fetchall()}
+
+def _load_import_chunk(entity, records, report):
+    """Write one validated chunk in a single transaction, recording per-row problems in the report"""
+    connection = get_db_connection()
+    if connection is None:
+        report['errors'].extend({'row': r['row'], 'email': r['email'], 'error': "database unavailable"} for r in records)
+        return
+
+    try:
+        cursor = connection.cursor()
+        if entity in ('Students', 'Alumni'):
+            role = 'Student' if entity == 'Students' else 'Alumni'
+            connection.start_transaction()
+            existing = _lookup_ids_by_email(cursor, role, [r['email'] for r in records])
+            new = []
+            for r in records:
+                if r['email'] in existing:
+                    report['duplicates'] += 1
+                    report['errors'].append({'row': r['row'], 'email': r['email'], 'error': "already registered"})
+                else:
+                    new.append(r)
+            if new and entity == 'Students':
+                cursor.executemany("""
+                INSERT INTO Student (Name, College_Email, Password, Semester, Department, PhoneNumber)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                """, [(r['name'], r['email'], r['password'], r['semester'], r['department'], r['phone_number'])
+                      for r in new])
+            elif new:
+                # Admin-imported alumni are approved up front
+                cursor.executemany("""
+                INSERT INTO Alumni (Name, Email, Password, Graduating_Year, Industry_ID, PhoneNumber, Current_Designation, years_of_experience, Approved)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, TRUE)
+                """, [(r['name'], r['email'], r['password'], r['graduating_year'], r['industry_id'], r['phone_number'],
+                       r['current_designation'], r['years_of_experience']) for r in new])
+            connection.commit()
+            report['loaded'] += len(new)
+
+        elif entity == 'Placements':
+            connection.start_transaction()
+            student_ids = _lookup_ids_by_email(cursor, 'Student', [r['email'] for r in records])
+            rows = []
+            for r in records:
+                if r['email'] in student_ids:
+                    rows.append((student_ids[r['email']], r['company_name'], r['placement_date']))
+                else:
+                    report['errors'].append({'row': r['row'], 'email': r['email'], 'error': "no student with this email"})
+            if rows:
+                # Same single-statement upsert as update_placement
+                cursor.executemany("""
+                INSERT INTO Placement (Student_ID, Is_Placed, Company_Name, Placement_Date)
+                VALUES (%s, TRUE, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    Is_Placed = VALUES(Is_Placed),
+                    Company_Name = VALUES(Company_Name),
+                    Placement_Date = VALUES(Placement_Date)
+                """, rows)
+            connection.commit()
+            report['loaded'] += len(rows)
+
+        else:  # Skills replace each listed user's skill set
+            assignments = {'Student': {}, 'Alumni': {}}
+            for role in assignments:
+                role_records = [r for r in records if r['role'] == role]
+                owner_ids = _lookup_ids_by_email(cursor, role, [r['email'] for r in role_records])
+                for r in role_records:
+                    if r['email'] in owner_ids:
+                        assignments[role][owner_ids[r['email']]] = r['skills']
+                    else:
+                        report['errors'].append({'row': r['row'], 'email': r['email'], 'error': f"no {role.lower()} with this email"})
+            cursor.close()
+            connection.close()  # Hand the connection back before bulk_sync_skills borrows its own
+            for role, role_assignments in assignments.items():
+                if not role_assignments:
+                    continue
+                summary = bulk_sync_skills(role, role_assignments)
+                if summary is None:
+                    report['errors'].append({'row': None, 'email': '', 'error': f"{role} skills chunk failed"})
+                    continue
+                report['loaded'] += len(role_assignments)
+                report['unknown_skills'].update(summary['unknown_skills'])
+            return
+
+        cursor.close()
+    except Error as e:
+        report['errors'].extend({'row': r['row'], 'email': r['email'], 'error': f"chunk rolled back: {e}"} for r in records)
+    finally:
+        connection.close()
+
+def run_bulk_import(entity, uploaded_file, progress=None):
+    """Validate, deduplicate by email and load an uploaded file chunk by chunk
+
+    Returns a report with processed/loaded/duplicate counts and a list of
+    per-row errors ({'row', 'email', 'error'}, row being the file line).
+    """
+    required, _ = IMPORT_COLUMNS[entity]
+    report = {'processed': 0, 'loaded': 0, 'duplicates': 0, 'errors': [], 'unknown_skills': set()}
+    industries = {ind['Name'].lower(): ind['Industry_ID'] for ind in (get_industries() or [])}
+    seen = set()
+    line = 1  # Header line
+
+    for chunk, fraction in iter_import_file(uploaded_file):
+        chunk.columns = [str(column).strip().lower().replace(' ', '_') for column in chunk.columns]
+        missing = [column for column in required if column not in chunk.columns]
+        if missing:
+            report['errors'].append({'row': None, 'email': '', 'error': f"missing columns: {', '.join(missing)}"})
+            break
+
+        records = []
+        for values in chunk.to_dict('records'):
+            line += 1
+            try:
+                record = _validate_import_row(entity, values, industries)
+            except ValueError as e:
+                report['errors'].append({'row': line, 'email': _cell(values, 'email'), 'error': str(e)})
+                continue
+            key = (record.get('role'), record['email'])
+            if key in seen:
+                report['duplicates'] += 1
+                report['errors'].append({'row': line, 'email': record['email'], 'error': "duplicate email in file"})
+                continue
+            seen.add(key)
+            record['row'] = line
+            records.append(record)
+
+        if records:
+            _load_import_chunk(entity, records, report)
+        report['processed'] += len(chunk)
+        if progress:
+            progress(report['processed'], fraction)
+
+    if entity == 'Alumni' and report['loaded']:
+        mark_mentor_indexes_stale()
+    elif entity == 'Placements' and report['loaded']:
+        invalidate_placement_trends()
+    report['unknown_skills'] = sorted(report['unknown_skills'])
+    return report
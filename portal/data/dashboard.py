@@ -0,0 +1,69 @@
+"""The student home page: stats, placement and first mentor page in one CALL"""
+from dataclasses import dataclass, field
+
+from mysql.connector import Error
+
+from portal.data.mentors import MENTOR_PAGE_SIZE
+from portal.db import execute_query, get_db_connection, report_error
+
+def get_student_stats(student_id):
+    """Return total completed sessions and pending requests counts"""
+    completed_q = "SELECT COUNT(*) AS cnt FROM Mentorship_Session WHERE Student_ID = %s AND Status = 'Completed'"
+    pending_q = "SELECT COUNT(*) AS cnt FROM Mentorship_Request WHERE Student_ID = %s AND Status = 'Pending'"
+    completed = execute_query(completed_q, (student_id,))
+    pending = execute_query(pending_q, (student_id,))
+    return (
+        (completed[0]['cnt'] if completed else 0),
+        (pending[0]['cnt'] if pending else 0)
+    )
+
+@dataclass
+class StudentDashboardSnapshot:
+    """Everything the student home page needs, loaded in one round trip"""
+    completed_sessions: int = 0
+    pending_requests: int = 0
+    placement: dict = None
+    mentors: list = field(default_factory=list)
+    next_mentor_cursor: tuple = None
+
+def load_student_dashboard(student_id, include_mentors=True, page_size=MENTOR_PAGE_SIZE):
+    """Load stats, placement and the first mentor page via proc_GetStudentDashboard
+
+    The procedure returns three result sets (stats, placement, mentors). It is
+    issued as a plain CALL statement and the sets are walked with nextset():
+    callproc() would wrap it in a SET of the arguments and a SELECT of them
+    back, tripling the round trips. Returns None if the database could not
+    be reached.
+    """
+    connection = get_db_connection()
+    if connection is None:
+        return None
+
+    try:
+        cursor = connection.cursor()
+        # One extra mentor row tells us whether there is a next page
+        cursor.execute("CALL proc_GetStudentDashboard(%s, %s)", (student_id, page_size + 1 if include_mentors else 0))
+        result_sets = []
+        while True:
+            if cursor.with_rows:
+                result_sets.append([dict(zip(cursor.column_names, row)) for row in cursor.fetchall()])
+            if not cursor.nextset():
+                break  # The CALL's own status packet ends the stream
+        cursor.close()
+    except Error as e:
+        report_error(f"Error loading dashboard: {e}")
+        return None
+    finally:
+        connection.close()
+
+    stats, placement, mentors = (result_sets + [[], [], []])[:3]
+    snapshot = StudentDashboardSnapshot(
+        completed_sessions=stats[0]['Completed_Sessions'] if stats else 0,
+        pending_requests=stats[0]['Pending_Requests'] if stats else 0,
+        placement=placement[0] if placement else None,
+        mentors=mentors[:page_size],
+    )
+    if len(mentors) > page_size:
+        last = snapshot.mentors[-1]
+        snapshot.next_mentor_cursor = (last['Rating'], last['Name'], last['Alumni_ID'])
+    return snapshot
@@ -0,0 +1,288 @@
+"""Mentor recommendations from skill/industry vectors, rating and current load"""
+import threading
+import time
+
+import numpy as np
+
+from portal.caching import singleton
+from portal.db import execute_query
+
+MATCH_STATS_MAX_AGE = 300       # seconds between rating/load refreshes
+MATCH_VECTORS_MAX_AGE = 3600    # seconds between full rebuilds of the mentor vectors
+MATCH_WEIGHTS = {'cosine': 0.45, 'jaccard': 0.25, 'rating': 0.2, 'load': 0.1}
+MATCH_LOAD_HALF = 3             # active requests at which the load penalty reaches half strength
+
+class MentorMatcher:
+    """Sparse skill/industry vectors for mentors, scored against a student in one vectorized pass
+
+    Each mentor is a binary row over skill and industry features, stored as
+    CSR-style NumPy arrays (row index and column per non-zero). A student is
+    scored against every mentor at once with a masked bincount, which gives
+    the dot product for all rows; cosine and Jaccard follow from row sizes.
+    Edits append a replacement row and retire the old one, so they never
+    re-flatten the whole matrix until enough retired rows pile up.
+
+    This is the CSR layout scipy.sparse would give, kept in plain NumPy:
+    SciPy is not in requirements.txt, and one binary matrix-vector product is
+    all the scoring needs.
+
+    Similarity dominates the blend; rating and current load separate mentors
+    who match equally well (``python -m doctest portal/data/matching.py``):
+
+    >>> matcher = MentorMatcher()
+    >>> matcher.rebuild({1: ([10, 11], 1), 2: ([10], 2), 3: ([10, 11], 1), 4: ([10], 2)})
+    >>> matcher.update_stats({1: 4.0, 2: 5.0, 3: 4.0, 4: 2.0}, {3: 6})
+    >>> matcher.set_student(7, [10, 11], [1])
+    >>> [alumni_id for alumni_id, _, _ in matcher.recommend(7)]
+    [1, 3, 2, 4]
+    >>> [round(score, 3) for _, score, _ in matcher.recommend(7, limit=2)]
+    [0.86, 0.793]
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rebuild_lock = threading.Lock()
+        self._columns = {}        # ('skill' | 'industry', id) -> column
+        self._rows = {}           # Alumni_ID -> np.ndarray of columns
+        self._ratings = {}        # Alumni_ID -> average rating
+        self._loads = {}          # Alumni_ID -> active (pending/accepted) requests
+        self._students = {}       # Student_ID -> np.ndarray of columns
+        self._matrix = None       # Flattened arrays, rebuilt lazily after edits
+        self.vectors_built_at = None  # time.monotonic() of the last load; None until the first
+        self.stats_loaded_at = None
+
+    def _column(self, kind, feature_id):
+        key = (kind, feature_id)
+        if key not in self._columns:
+            self._columns[key] = len(self._columns)
+        return self._columns[key]
+
+    def _vector(self, skill_ids, industry_ids):
+        columns = {self._column('skill', skill_id) for skill_id in skill_ids}
+        columns.update(self._column('industry', industry_id) for industry_id in industry_ids if industry_id)
+        return np.array(sorted(columns), dtype=np.int32)
+
+    def rebuild(self, mentor_features):
+        """Replace all mentor vectors; mentor_features maps Alumni_ID -> (skill_ids, industry_id)"""
+        with self._lock:
+            self._rows = {alumni_id: self._vector(skill_ids, [industry_id])
+                          for alumni_id, (skill_ids, industry_id) in mentor_features.items()}
+            self._students.clear()
+            self._matrix = None
+            self.vectors_built_at = time.monotonic()
+
+    def update_mentor(self, alumni_id, skill_ids, industry_id):
+        with self._lock:
+            row = self._vector(skill_ids, [industry_id])
+            self._rows[alumni_id] = row
+            matrix = self._matrix
+            if matrix is None:
+                return
+            # Patch in place: retire the old row and append the new one instead of re-flattening
+            old = matrix['position'].get(alumni_id)
+            if old is not None:
+                matrix['alive'][old] = False
+                matrix['dead'] += 1
+            new = len(matrix['ids'])
+            matrix['position'][alumni_id] = new
+            matrix['ids'] = np.append(matrix['ids'], alumni_id)
+            matrix['sizes'] = np.append(matrix['sizes'], len(row))
+            matrix['cols'] = np.concatenate([matrix['cols'], row])
+            matrix['row_of'] = np.concatenate([matrix['row_of'], np.full(len(row), new, dtype=np.int32)])
+            matrix['ratings'] = np.append(matrix['ratings'], float(self._ratings.get(alumni_id, 0)))
+            matrix['loads'] = np.append(matrix['loads'], self._loads.get(alumni_id, 0))
+            matrix['alive'] = np.append(matrix['alive'], True)
+            if matrix['dead'] > len(matrix['ids']) // 10:
+                self._matrix = None  # Compact on next use
+
+    def remove_mentor(self, alumni_id):
+        with self._lock:
+            if self._rows.pop(alumni_id, None) is None or self._matrix is None:
+                return
+            old = self._matrix['position'].pop(alumni_id)
+            self._matrix['alive'][old] = False
+            self._matrix['dead'] += 1
+
+    def update_stats(self, ratings, loads):
+        with self._lock:
+            self._ratings = ratings
+            self._loads = loads
+            matrix = self._matrix
+            if matrix is not None:
+                ids = matrix['ids']
+                matrix['ratings'] = np.fromiter((float(ratings.get(i, 0)) for i in ids), dtype=np.float32, count=len(ids))
+                matrix['loads'] = np.fromiter((loads.get(i, 0) for i in ids), dtype=np.float32, count=len(ids))
+            self.stats_loaded_at = time.monotonic()
+
+    def set_student(self, student_id, skill_ids, industry_ids):
+        with self._lock:
+            self._students[student_id] = self._vector(skill_ids, industry_ids)
+
+    def forget_student(self, student_id):
+        with self._lock:
+            self._students.pop(student_id, None)
+
+    def has_student(self, student_id):
+        return student_id in self._students
+
+    def _flatten(self):
+        if self._matrix is None:
+            ids = np.fromiter(self._rows.keys(), dtype=np.int64, count=len(self._rows))
+            rows = list(self._rows.values())
+            sizes = np.fromiter((len(row) for row in rows), dtype=np.int32, count=len(rows))
+            self._matrix = {
+                'ids': ids,
+                'position': {int(alumni_id): i for i, alumni_id in enumerate(ids)},
+                'sizes': sizes,
+                'cols': np.concatenate(rows) if rows else np.empty(0, dtype=np.int32),
+                'row_of': np.repeat(np.arange(len(rows), dtype=np.int32), sizes),
+                'ratings': np.fromiter((float(self._ratings.get(i, 0)) for i in ids), dtype=np.float32, count=len(ids)),
+                'loads': np.fromiter((self._loads.get(i, 0) for i in ids), dtype=np.float32, count=len(ids)),
+                'alive': np.ones(len(ids), dtype=bool),
+                'dead': 0,
+            }
+        return self._matrix
+
+    def recommend(self, student_id, limit=5, exclude=()):
+        """Top mentors for a student as [(Alumni_ID, score, similarity)], best first"""
+        with self._lock:
+            student = self._students.get(student_id)
+            if student is None or not len(student) or not self._rows:
+                return []
+            matrix = self._flatten()
+
+            in_student = np.zeros(len(self._columns), dtype=bool)
+            in_student[student] = True
+            hits = in_student[matrix['cols']]
+            dot = np.bincount(matrix['row_of'][hits], minlength=len(matrix['ids'])).astype(np.float32)
+
+            sizes = matrix['sizes'].astype(np.float32)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cosine = np.nan_to_num(dot / np.sqrt(sizes * len(student)))
+                jaccard = np.nan_to_num(dot / (sizes + len(student) - dot))
+            loads = matrix['loads']
+            score = (MATCH_WEIGHTS['cosine'] * cosine
+                     + MATCH_WEIGHTS['jaccard'] * jaccard
+                     + MATCH_WEIGHTS['rating'] * matrix['ratings'] / 5.0
+                     - MATCH_WEIGHTS['load'] * loads / (loads + MATCH_LOAD_HALF))
+            score[(dot == 0) | ~matrix['alive']] = -np.inf  # Only live mentors with something in common
+            if exclude:
+                score[np.isin(matrix['ids'], list(exclude))] = -np.inf
+
+            candidates = int(np.count_nonzero(np.isfinite(score)))
+            if candidates == 0:
+                return []
+            k = min(limit, candidates)
+            top = np.argpartition(-score, k - 1)[:k]
+            top = top[np.argsort(-score[top])]
+            return [(int(matrix['ids'][i]), float(score[i]), float(cosine[i])) for i in top]
+
+def _load_mentor_features(alumni_id=None):
+    """Approved mentors' skill IDs and industry as {Alumni_ID: (skill_ids, industry_id)}"""
+    query = """
+    SELECT a.Alumni_ID, a.Industry_ID, als.Skill_ID
+    FROM Alumni a
+    LEFT JOIN Alumni_Skills als ON a.Alumni_ID = als.Alumni_ID
+    WHERE a.Approved = TRUE
+    """
+    params = None
+    if alumni_id is not None:
+        query += " AND a.Alumni_ID = %s"
+        params = (alumni_id,)
+    result = execute_query(query, params)
+    if result is None:
+        return None
+
+    features = {}
+    for row in result:
+        skill_ids, _ = features.setdefault(row['Alumni_ID'], ([], row['Industry_ID']))
+        if row['Skill_ID'] is not None:
+            skill_ids.append(row['Skill_ID'])
+    return features
+
+def _load_mentor_match_stats():
+    """Current ratings and active request load for approved mentors"""
+    query = """
+    SELECT a.Alumni_ID, COALESCE(r.Avg_Rating, 0) AS Rating, COALESCE(l.Active_Requests, 0) AS Active_Requests
+    FROM Alumni a
+    LEFT JOIN Alumni_Rating_Summary r ON a.Alumni_ID = r.Alumni_ID
+    LEFT JOIN (
+        SELECT Alumni_ID, COUNT(*) AS Active_Requests
+        FROM Mentorship_Request
+        WHERE Status IN ('Pending', 'Accepted')
+        GROUP BY Alumni_ID
+    ) l ON a.Alumni_ID = l.Alumni_ID
+    WHERE a.Approved = TRUE
+    """
+    result = execute_query(query)
+    if result is None:
+        return None
+    ratings = {row['Alumni_ID']: row['Rating'] for row in result}
+    loads = {row['Alumni_ID']: row['Active_Requests'] for row in result}
+    return ratings, loads
+
+def _load_student_features(student_id):
+    """A student's skills plus the industries those skills belong to"""
+    query = """
+    SELECT 'skill' AS Kind, ss.Skill_ID AS Feature_ID
+    FROM Student_Skills ss
+    WHERE ss.Student_ID = %s
+    UNION
+    SELECT 'industry', isx.Industry_ID
+    FROM Student_Skills ss
+    JOIN Industry_Skills isx ON ss.Skill_ID = isx.Skill_ID
+    WHERE ss.Student_ID = %s
+    """
+    result = execute_query(query, (student_id, student_id))
+    if result is None:
+        return None
+    skill_ids = [row['Feature_ID'] for row in result if row['Kind'] == 'skill']
+    industry_ids = [row['Feature_ID'] for row in result if row['Kind'] == 'industry']
+    return skill_ids, industry_ids
+
+def _aged_out(loaded_at, max_age, now):
+    # None means never loaded (or marked stale), which must not depend on host uptime
+    return loaded_at is None or now - loaded_at > max_age
+
+@singleton
+def _mentor_matcher():
+    return MentorMatcher()
+
+def get_mentor_matcher():
+    """Process-wide mentor matcher, reloading vectors and rating/load stats when they age out"""
+    matcher = _mentor_matcher()
+    now = time.monotonic()
+    if (_aged_out(matcher.vectors_built_at, MATCH_VECTORS_MAX_AGE, now)
+            or _aged_out(matcher.stats_loaded_at, MATCH_STATS_MAX_AGE, now)):
+        with matcher.rebuild_lock:
+            now = time.monotonic()
+            if _aged_out(matcher.vectors_built_at, MATCH_VECTORS_MAX_AGE, now):
+                features = _load_mentor_features()
+                if features is not None:
+                    matcher.rebuild(features)
+            if _aged_out(matcher.stats_loaded_at, MATCH_STATS_MAX_AGE, now):
+                stats = _load_mentor_match_stats()
+                if stats is not None:
+                    matcher.update_stats(*stats)
+    return matcher
+
+def get_recommended_mentors(student_id, limit=4):
+    """Best-matching mentors for a student as [(Alumni_ID, score, similarity)]"""
+    matcher = get_mentor_matcher()
+    if not matcher.has_student(student_id):
+        features = _load_student_features(student_id)
+        if features is None:
+            return []
+        matcher.set_student(student_id, *features)
+    return matcher.recommend(student_id, limit=limit)
+
+def refresh_mentor_match_entry(alumni_id):
+    """Update one mentor's vector after their skills, industry or approval changed"""
+    features = _load_mentor_features(alumni_id)
+    if features is None:
+        return
+    matcher = _mentor_matcher()
+    if alumni_id in features:
+        matcher.update_mentor(alumni_id, *features[alumni_id])
+    else:
+        matcher.remove_mentor(alumni_id)
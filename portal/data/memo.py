@@ -0,0 +1,77 @@
+"""Per-user read memoization
+
+Request/session reads are memoized in the viewer's session and reused across
+reruns until a write touches one of the users involved. Writes bump a
+process-wide version for each affected user, so an alumnus accepting a
+request also invalidates the student's cached view.
+"""
+import functools
+import threading
+
+from portal.caching import singleton
+from portal.db import execute_query
+
+# Returns the current session's memo dict, or None to skip memoization; app2.py
+# installs one backed by st.session_state
+_memo_store = lambda: None  # noqa: E731
+
+def set_memo_store(store):
+    """Set the zero-argument callable returning the current session's memo dict"""
+    global _memo_store
+    _memo_store = store
+
+class UserDataVersions:
+    """Process-wide change counters per (role, user_id)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versions = {}
+
+    def get(self, owner):
+        return self._versions.get(owner, 0)
+
+    def bump(self, *owners):
+        with self._lock:
+            for owner in owners:
+                self._versions[owner] = self._versions.get(owner, 0) + 1
+
+@singleton
+def _user_data_versions():
+    return UserDataVersions()
+
+def invalidate_user_data(student_id=None, alumni_id=None):
+    """Drop memoized request/session reads for the given student and/or alumni"""
+    owners = []
+    if student_id is not None:
+        owners.append(('Student', student_id))
+    if alumni_id is not None:
+        owners.append(('Alumni', alumni_id))
+    _user_data_versions().bump(*owners)
+
+def _invalidate_parties(table, id_column, row_id):
+    """Invalidate the student and alumni linked to a request or session row"""
+    rows = execute_query(f"SELECT Student_ID, Alumni_ID FROM {table} WHERE {id_column} = %s", (row_id,))
+    if rows:
+        invalidate_user_data(student_id=rows[0]['Student_ID'], alumni_id=rows[0]['Alumni_ID'])
+
+def memoize_per_user(owner):
+    """Memoize a read helper per session; ``owner(*args)`` names the (role, user_id) whose writes invalidate it"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = (func.__name__,) + args
+            version = _user_data_versions().get(owner(*args))
+            memo = _memo_store()
+            if memo is None:
+                return func(*args)
+            cached = memo.get(key)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            result = func(*args)
+            failed = result is None or (isinstance(result, tuple) and None in result)
+            if not failed:
+                memo[key] = (version, result)
+            return result
+        return wrapper
+    return decorator
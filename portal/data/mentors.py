@@ -0,0 +1,158 @@
+"""Mentor listings, plus the hooks that keep the in-process mentor indexes current"""
+import sys
+
+from portal.data.search import _mentor_search_index, get_mentor_search_index, refresh_mentor_search_entry
+from portal.db import execute_query
+
+# Mentor grids load this many cards at a time
+MENTOR_PAGE_SIZE = 20
+# Seconds a session reuses its loaded mentor grid; edits made in this process reset it sooner
+MENTOR_GRID_MAX_AGE = 300
+
+_mentor_directory = {'generation': 0}
+
+def mentor_directory_generation():
+    """Counter bumped whenever this process changes a mentor, their approval or their rating"""
+    return _mentor_directory['generation']
+
+def touch_mentor_directory():
+    """Make every session's loaded mentor grid reload on its next rerun"""
+    _mentor_directory['generation'] += 1
+
+def get_alumni_with_industry(filters=None, limit=None, after=None):
+    """Get approved alumni with industry information (one row per mentor), best rated first
+
+    Results are ordered by (Rating DESC, Name, Alumni_ID). Pass ``limit`` to cap
+    the page size and ``after`` (the (rating, name, id) of the last row of the
+    previous page) to continue from there without an OFFSET scan. The order is
+    served by idx_alumni_mentor_order (schema_updates.sql) on the trigger-kept
+    Alumni.Avg_Rating copy, so a page reads only its own rows.
+    """
+    query = """
+    SELECT a.Alumni_ID, a.Name, a.Current_Designation, a.years_of_experience,
+           i.Name as Industry_Name, a.Avg_Rating as Rating
+    FROM Alumni a 
+    LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID 
+    WHERE a.Approved = TRUE
+    """
+    params = []
+    
+    if filters:
+        if 'name' in filters and filters['name']:
+            query += " AND a.Name LIKE %s"
+            params.append(f"%{filters['name']}%")
+        
+        if 'industry_id' in filters and filters['industry_id']:
+            query += " AND a.Industry_ID = %s"
+            params.append(filters['industry_id'])
+        
+        if 'skill' in filters and filters['skill']:
+            # Semi-join: only touch Alumni_Skills when filtering, and never fan out rows.
+            # Skill names come from the skills dropdown, so an exact (indexable) match is enough.
+            query += """
+    AND EXISTS (
+        SELECT 1 FROM Alumni_Skills als
+        JOIN Skills s ON als.Skill_ID = s.Skill_ID
+        WHERE als.Alumni_ID = a.Alumni_ID AND s.Skill_Name = %s
+    )
+    """
+            params.append(filters['skill'])
+
+    if after:
+        # Keyset: rows strictly after the cursor in (Rating DESC, Name, Alumni_ID) order
+        rating, name, alumni_id = after
+        # The leading a.Avg_Rating <= %s gives the optimizer a range to seek to
+        query += """
+    AND a.Avg_Rating <= %s
+    AND (a.Avg_Rating < %s OR (a.Avg_Rating = %s AND (a.Name > %s OR (a.Name = %s AND a.Alumni_ID > %s))))
+    """
+        params.extend([rating, rating, rating, name, name, alumni_id])
+
+    query += " ORDER BY a.Avg_Rating DESC, a.Name, a.Alumni_ID"
+    if limit:
+        query += " LIMIT %s"
+        params.append(limit)
+    
+    return execute_query(query, tuple(params) if params else None)
+
+def get_mentors_by_ids(alumni_ids):
+    """Get mentor cards for the given alumni IDs, in the order given"""
+    if not alumni_ids:
+        return []
+    format_strings = ','.join(['%s'] * len(alumni_ids))
+    query = f"""
+    SELECT a.Alumni_ID, a.Name, a.Current_Designation, a.years_of_experience,
+           i.Name as Industry_Name, a.Avg_Rating as Rating
+    FROM Alumni a 
+    LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID 
+    WHERE a.Approved = TRUE AND a.Alumni_ID IN ({format_strings})
+    """
+    result = execute_query(query, tuple(alumni_ids))
+    if result is None:
+        return None
+    by_id = {row['Alumni_ID']: row for row in result}
+    return [by_id[alumni_id] for alumni_id in alumni_ids if alumni_id in by_id]
+
+def get_mentor_page(filters=None, page_size=MENTOR_PAGE_SIZE, cursor=None):
+    """Get one page of mentors; returns (mentors, next_cursor) with next_cursor None on the last page"""
+    if filters and filters.get('query'):
+        # Free-text search is ranked by the search index; the cursor is an offset into that ranking
+        ranked = get_mentor_search_index().search(
+            filters['query'], industry_id=filters.get('industry_id'), skill=filters.get('skill')
+        )
+        start = cursor or 0
+        rows = get_mentors_by_ids([alumni_id for alumni_id, _ in ranked[start:start + page_size]])
+        next_cursor = start + page_size if start + page_size < len(ranked) else None
+        return rows, (next_cursor if rows is not None else None)
+
+    rows = get_alumni_with_industry(filters, limit=page_size + 1, after=cursor)
+    if rows is None:
+        return None, None
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    last = rows[-1]
+    return rows, (last['Rating'], last['Name'], last['Alumni_ID'])
+
+def _loaded_matching():
+    """portal.data.matching if a page has imported it; until then there is no matcher to update"""
+    return sys.modules.get('portal.data.matching')
+
+def mark_mentor_indexes_stale():
+    """Force the search index and matcher to reload on next use (after bulk mentor changes)"""
+    touch_mentor_directory()
+    _mentor_search_index().built_at = None
+    matching = _loaded_matching()
+    if matching is not None:
+        matching._mentor_matcher().vectors_built_at = None
+
+def on_mentor_changed(alumni_id):
+    """Keep the in-process search index and matcher in step with a mentor edit"""
+    touch_mentor_directory()
+    refresh_mentor_search_entry(alumni_id)
+    matching = _loaded_matching()
+    if matching is not None:
+        matching.refresh_mentor_match_entry(alumni_id)
+
+def forget_student_match(student_id):
+    """Drop a student's cached match vector after their skills changed"""
+    matching = _loaded_matching()
+    if matching is not None:
+        matching._mentor_matcher().forget_student(student_id)
+
+def get_mentors_by_industry(industry_id):
+    q = """
+    SELECT a.Alumni_ID, a.Name, a.Current_Designation
+    FROM Alumni a
+    WHERE a.Industry_ID = %s AND a.Approved = TRUE
+    ORDER BY a.Name
+    """
+    return execute_query(q, (industry_id,))
+
+def filter_mentors_using_procedure(industry_keyword, min_rating):
+    """
+    Calls stored procedure:
+    proc_FilterMentors(industry_keyword, min_rating)
+    """
+    query = "CALL proc_FilterMentors(%s, %s)"
+    return execute_query(query, (industry_keyword, min_rating))
@@ -0,0 +1,202 @@
+"""Mentorship requests, sessions and session content"""
+import random
+import string
+from datetime import datetime
+
+from mysql.connector import Error
+
+from portal.data.memo import _invalidate_parties, invalidate_user_data, memoize_per_user
+from portal.db import execute_query, get_db_connection, report_error
+
+def generate_meeting_id():
+    """Generates a mock meeting link"""
+    code = ''.join(random.choices(string.ascii_lowercase + string.digits, k=12))
+    return f"https://meet.example.com/{code[:4]}-{code[4:8]}-{code[8:]}"
+
+def get_student_sessions(student_id):
+    """Call the updated GetStudentMentorshipDetails procedure"""
+    query = "CALL proc_GetStudentMentorshipDetails(%s)"  # Calling procedure: proc_GetStudentMentorshipDetails
+    return execute_query(query, (student_id,))
+
+# Session listings only carry this many characters of Content; the full text is loaded on demand
+CONTENT_PREVIEW_CHARS = 200
+
+def store_session_content(session_id, content):
+    """Store content for a session"""
+    query = "UPDATE Mentorship_Session SET Content = %s WHERE Session_ID = %s"
+    result = execute_query(query, (content, session_id), fetch=False)
+    if result:
+        _invalidate_parties('Mentorship_Session', 'Session_ID', session_id)  # Listings carry a content preview
+    return result
+
+def view_session_content(session_id):
+    """View content for a session"""
+    query = "SELECT Content FROM Mentorship_Session WHERE Session_ID = %s"
+    result = execute_query(query, (session_id,))
+    return result[0]['Content'] if result else None
+
+def get_session_contents(session_ids):
+    """Fetch full content for several sessions in one query as {Session_ID: Content}"""
+    if not session_ids:
+        return {}
+    format_strings = ','.join(['%s'] * len(session_ids))
+    query = f"SELECT Session_ID, Content FROM Mentorship_Session WHERE Session_ID IN ({format_strings})"
+    result = execute_query(query, tuple(session_ids))
+    return {row['Session_ID']: row['Content'] for row in result} if result else {}
+
+def create_mentorship_request(student_id, alumni_id, message):
+    """Create a Pending request unless the pair already has a Pending/Accepted one
+
+    One statement: uq_request_active_pair (schema_updates.sql) rejects a second
+    active request for the same pair, and the ON DUPLICATE KEY branch hands back
+    the existing Request_ID instead of failing. Returns
+    {'status': 'created' | 'exists', 'request_id': int} or None on error.
+    """
+    connection = get_db_connection()
+    if connection is None:
+        return None
+
+    try:
+        cursor = connection.cursor()
+        q = """
+        INSERT INTO Mentorship_Request (Student_ID, Alumni_ID, Request_Message, Status, Request_Date)
+        VALUES (%s, %s, %s, 'Pending', %s)
+        ON DUPLICATE KEY UPDATE Request_ID = LAST_INSERT_ID(Request_ID)
+        """
+        cursor.execute(q, (student_id, alumni_id, message, datetime.now().date()))
+        # Affected rows: 1 = inserted, 0 = an active request already existed
+        status = 'created' if cursor.rowcount == 1 else 'exists'
+        request_id = cursor.lastrowid
+        cursor.close()
+    except Error as e:
+        report_error(f"Error creating request: {e}")
+        return None
+    finally:
+        connection.close()
+
+    if status == 'created':
+        invalidate_user_data(student_id=student_id, alumni_id=alumni_id)
+    return {'status': status, 'request_id': request_id}
+
+@memoize_per_user(lambda user_id, role, status: (role, user_id))
+def get_requests_by_status(user_id, role, status):
+    """
+    Gets requests for a user based on role and status.
+    For Student: requests they SENT.
+    For Alumni: requests they RECEIVED.
+    """
+    if role == 'Student':
+        q = """
+        SELECT mr.Request_ID, mr.Request_Message, mr.Request_Date, mr.Status, a.Name AS Mentor_Name
+        FROM Mentorship_Request mr
+        JOIN Alumni a ON mr.Alumni_ID = a.Alumni_ID
+        WHERE mr.Student_ID = %s AND mr.Status = %s
+        ORDER BY mr.Request_Date DESC
+        """
+        return execute_query(q, (user_id, status))
+    elif role == 'Alumni':
+        q = """
+        SELECT mr.Request_ID, mr.Request_Message, mr.Request_Date, mr.Status, s.Name AS Student_Name
+        FROM Mentorship_Request mr
+        JOIN Student s ON mr.Student_ID = s.Student_ID
+        WHERE mr.Alumni_ID = %s AND mr.Status = %s
+        ORDER BY mr.Request_Date DESC
+        """
+        return execute_query(q, (user_id, status))
+    return []
+
+@memoize_per_user(lambda student_id: ('Student', student_id))
+def get_student_sessions_by_status(student_id):
+    """Gets all sessions for a student, grouped by status"""
+    # Get accepted requests that don't have a session yet (Ready to Propose)
+    q_new = """
+        SELECT mr.Request_ID, mr.Alumni_ID, a.Name AS Mentor_Name
+        FROM Mentorship_Request mr
+        JOIN Alumni a ON mr.Alumni_ID = a.Alumni_ID
+        WHERE mr.Student_ID = %s AND mr.Status = 'Accepted'
+        AND mr.Request_ID NOT IN (SELECT Request_ID FROM Mentorship_Session WHERE Request_ID IS NOT NULL)
+    """
+    new_requests = execute_query(q_new, (student_id,))
+
+    # Get sessions that are pending, confirmed, or completed
+    q_sessions = f"""
+        SELECT ms.Session_ID, ms.Alumni_ID, a.Name AS Mentor_Name, ms.Date, ms.Mode, ms.Topics_Discussed, ms.Status, ms.Meeting_Link, ms.Proposed_By,
+               LEFT(ms.Content, {CONTENT_PREVIEW_CHARS}) AS Content_Preview,
+               EXISTS (SELECT 1 FROM Feedback f WHERE f.Session_ID = ms.Session_ID) AS Has_Feedback
+        FROM Mentorship_Session ms
+        JOIN Alumni a ON ms.Alumni_ID = a.Alumni_ID
+        WHERE ms.Student_ID = %s
+        ORDER BY ms.Date DESC
+    """
+    sessions = execute_query(q_sessions, (student_id,))
+
+    return new_requests, sessions
+
+def propose_session(request_id, student_id, alumni_id, date, mode, topics):
+    q = """
+    INSERT INTO Mentorship_Session (Request_ID, Student_ID, Alumni_ID, Date, Mode, Topics_Discussed, Status, Proposed_By)
+    VALUES (%s, %s, %s, %s, %s, %s, 'Pending_Confirmation', 'Student')
+    """
+    result = execute_query(q, (request_id, student_id, alumni_id, date, mode, topics), fetch=False)
+    if result:
+        invalidate_user_data(student_id=student_id, alumni_id=alumni_id)
+    return result
+
+def confirm_session(session_id):
+    meeting_link = generate_meeting_id()
+    q = "UPDATE Mentorship_Session SET Status = 'Confirmed', Meeting_Link = %s WHERE Session_ID = %s"
+    result = execute_query(q, (meeting_link, session_id), fetch=False)
+    if result:
+        _invalidate_parties('Mentorship_Session', 'Session_ID', session_id)
+    return result
+
+def mark_session_completed(session_id):
+    q = "UPDATE Mentorship_Session SET Status = 'Completed' WHERE Session_ID = %s"
+    result = execute_query(q, (session_id,), fetch=False)
+    if result:
+        _invalidate_parties('Mentorship_Session', 'Session_ID', session_id)
+    return result
+
+@memoize_per_user(lambda alumni_id: ('Alumni', alumni_id))
+def get_pending_requests_for_alumni(alumni_id):
+    # This function is now the dedicated getter for pending requests.
+    q = """
+    SELECT mr.Request_ID, mr.Student_ID, s.Name AS Student_Name, mr.Request_Message, mr.Request_Date
+    FROM Mentorship_Request mr
+    JOIN Student s ON mr.Student_ID = s.Student_ID
+    WHERE mr.Alumni_ID = %s AND mr.Status = 'Pending'
+    ORDER BY mr.Request_Date DESC
+    """
+    return execute_query(q, (alumni_id,))
+
+def update_request_status(request_id, new_status):
+    q = "UPDATE Mentorship_Request SET Status = %s, Decision_Date = %s WHERE Request_ID = %s"
+    result = execute_query(q, (new_status, datetime.now().date(), request_id), fetch=False)
+    if result:
+        _invalidate_parties('Mentorship_Request', 'Request_ID', request_id)
+    return result
+
+@memoize_per_user(lambda alumni_id: ('Alumni', alumni_id))
+def get_alumni_sessions_by_status(alumni_id):
+    # Get pending requests
+    q_req = """
+        SELECT mr.Request_ID, s.Name AS Student_Name, mr.Request_Message, mr.Request_Date
+        FROM Mentorship_Request mr
+        JOIN Student s ON mr.Student_ID = s.Student_ID
+        WHERE mr.Alumni_ID = %s AND mr.Status = 'Pending'
+        ORDER BY mr.Request_Date DESC
+    """
+    pending_requests = execute_query(q_req, (alumni_id,))
+
+    # Get sessions
+    q_sessions = f"""
+        SELECT ms.Session_ID, s.Name AS Student_Name, ms.Date, ms.Mode, ms.Topics_Discussed, ms.Status, ms.Meeting_Link, ms.Proposed_By,
+               LEFT(ms.Content, {CONTENT_PREVIEW_CHARS}) AS Content_Preview
+        FROM Mentorship_Session ms
+        JOIN Student s ON ms.Student_ID = s.Student_ID
+        WHERE ms.Alumni_ID = %s
+        ORDER BY ms.Date DESC
+    """
+    sessions = execute_query(q_sessions, (alumni_id,))
+
+    return pending_requests, sessions
@@ -0,0 +1,47 @@
+"""Student placement status"""
+from mysql.connector import Error
+
+from portal.data.analytics import invalidate_placement_trends
+from portal.db import execute_query, get_db_connection, report_error
+
+def get_placement_status(student_id):
+    """Get student placement status"""
+    query = "SELECT * FROM Placement WHERE Student_ID = %s"
+    result = execute_query(query, (student_id,))
+    return result[0] if result else None
+    
+def update_placement(student_id, is_placed, company_name, placement_date):
+    """Upsert a student's placement in one statement
+
+    Returns {'action': 'inserted' | 'updated' | 'unchanged', 'log_written': bool}
+    or False on failure. log_written mirrors the Placement_Log triggers, which
+    record a row whenever a placed row is inserted or its details change.
+    """
+    connection = get_db_connection()
+    if connection is None:
+        return False
+
+    try:
+        cursor = connection.cursor()
+        # Relies on uq_placement_student (schema_updates.sql)
+        query = """
+        INSERT INTO Placement (Student_ID, Is_Placed, Company_Name, Placement_Date)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            Is_Placed = VALUES(Is_Placed),
+            Company_Name = VALUES(Company_Name),
+            Placement_Date = VALUES(Placement_Date)
+        """
+        cursor.execute(query, (student_id, is_placed, company_name, placement_date))
+        # Affected rows: 1 = inserted, 2 = updated, 0 = same values as before
+        action = {1: 'inserted', 2: 'updated'}.get(cursor.rowcount, 'unchanged')
+        cursor.close()
+    except Error as e:
+        report_error(f"Error updating placement: {e}")
+        return False
+    finally:
+        connection.close()
+
+    if action != 'unchanged':
+        invalidate_placement_trends()
+    return {'action': action, 'log_written': bool(is_placed) and action != 'unchanged'}
@@ -0,0 +1,102 @@
+"""Mentor ratings and session feedback"""
+from mysql.connector import Error
+
+from portal.data.memo import invalidate_user_data
+from portal.data.mentors import touch_mentor_directory
+from portal.db import execute_query, get_db_connection, report_error, report_warning
+
+def get_alumni_rating(alumni_id):
+    """Get an alumni's average rating from the Alumni_Rating_Summary aggregate"""
+    query = "SELECT Avg_Rating as rating FROM Alumni_Rating_Summary WHERE Alumni_ID = %s"
+    result = execute_query(query, (alumni_id,))
+    if result and len(result) > 0 and result[0]['rating'] is not None:
+        return float(result[0]['rating'])
+    return 0.0 # Return 0.0 if no ratings yet
+
+def get_alumni_ratings(alumni_ids):
+    """Get average ratings for many alumni in one primary-key lookup (0.0 if no ratings yet)"""
+    ratings = {alumni_id: 0.0 for alumni_id in alumni_ids}
+    if not ratings:
+        return ratings
+
+    format_strings = ','.join(['%s'] * len(ratings))
+    query = f"SELECT Alumni_ID, Avg_Rating as rating FROM Alumni_Rating_Summary WHERE Alumni_ID IN ({format_strings})"
+    result = execute_query(query, tuple(ratings))
+    for row in result or []:
+        if row['rating'] is not None:
+            ratings[row['Alumni_ID']] = float(row['rating'])
+    return ratings
+
+def rebuild_rating_summary():
+    """Recompute Alumni_Rating_Summary from the Feedback table"""
+    return execute_query("CALL proc_RebuildAlumniRatingSummary()", fetch=False) is not None
+
+def verify_rating_summary():
+    """Return alumni whose stored rating aggregate has drifted from their Feedback rows"""
+    query = """
+    SELECT a.Alumni_ID, a.Name,
+           COALESCE(f.Rating_Sum, 0) AS Expected_Sum, COALESCE(f.Rating_Count, 0) AS Expected_Count,
+           COALESCE(r.Rating_Sum, 0) AS Stored_Sum, COALESCE(r.Rating_Count, 0) AS Stored_Count
+    FROM Alumni a
+    LEFT JOIN (
+        SELECT Alumni_ID, SUM(Rating) AS Rating_Sum, COUNT(*) AS Rating_Count
+        FROM Feedback
+        GROUP BY Alumni_ID
+    ) f ON a.Alumni_ID = f.Alumni_ID
+    LEFT JOIN Alumni_Rating_Summary r ON a.Alumni_ID = r.Alumni_ID
+    WHERE COALESCE(f.Rating_Sum, 0) <> COALESCE(r.Rating_Sum, 0)
+       OR COALESCE(f.Rating_Count, 0) <> COALESCE(r.Rating_Count, 0)
+    """
+    return execute_query(query)
+
+def submit_feedback(student_id, alumni_id, rating, comments, session_id=None):
+    """Submit feedback for a session and update the alumni's rating aggregate in one CALL
+
+    proc_SubmitFeedback inserts the Feedback row, folds it into
+    Alumni_Rating_Summary and commits, all server-side, so a submission is one
+    round trip (a plain CALL: callproc() would add a SET and a SELECT of the
+    arguments). A session can only be rated once (unique Session_ID), so a
+    repeat submission is rejected.
+    """
+    connection = get_db_connection()
+    if connection is None:
+        return False
+
+    try:
+        cursor = connection.cursor()
+        cursor.execute("CALL proc_SubmitFeedback(%s, %s, %s, %s, %s)",
+                       (student_id, alumni_id, session_id, rating, comments))
+        cursor.close()
+    except Error as e:
+        if e.errno == 1062:  # Duplicate entry on uq_feedback_session
+            report_warning("You have already submitted feedback for this session.")
+        else:
+            report_error(f"Error submitting feedback: {e}")
+        return False
+    finally:
+        connection.close()
+
+    invalidate_user_data(student_id=student_id, alumni_id=alumni_id)
+    touch_mentor_directory()  # The rating moves the mentor in every grid's order
+    return True
+
+def get_student_feedback(student_id):
+    """Get student's past sessions"""
+    query = """
+    SELECT DISTINCT a.Alumni_ID, a.Name 
+    FROM Mentorship_Session ms 
+    JOIN Alumni a ON ms.Alumni_ID = a.Alumni_ID 
+    WHERE ms.Student_ID = %s
+    """
+    return execute_query(query, (student_id,))
+
+def get_alumni_feedback(alumni_id):
+    """Get feedback received by an alumni"""
+    query = """
+    SELECT f.Rating, f.Comments, f.Date, s.Name as Student_Name 
+    FROM Feedback f 
+    JOIN Student s ON f.Student_ID = s.Student_ID 
+    WHERE f.Alumni_ID = %s 
+    ORDER BY f.Date DESC
+    """
+    return execute_query(query, (alumni_id,))
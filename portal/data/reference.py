@@ -0,0 +1,70 @@
+"""Industry and skill reference data, cached process-wide"""
+from mysql.connector import Error
+
+from portal.caching import ttl_cache
+from portal.db import execute_query, report_error, report_warning
+
+# Reference data (Industry, Skills) rarely changes, so it is cached process-wide for all sessions
+REFERENCE_DATA_TTL = 600  # seconds
+
+@ttl_cache(REFERENCE_DATA_TTL)
+def _load_industries():
+    return execute_query("SELECT Industry_ID, Name FROM Industry ORDER BY Name")
+
+@ttl_cache(REFERENCE_DATA_TTL)
+def _load_skills():
+    return execute_query("SELECT Skill_ID, Skill_Name FROM Skills ORDER BY Skill_Name")
+
+def _reference_data(loader):
+    """Read through a cached loader without keeping failed lookups in the cache"""
+    result = loader()
+    if result is None:
+        loader.clear()
+    return result
+
+def invalidate_reference_data(industries=True, skills=True):
+    """Drop cached reference data; call after any edit to the Industry or Skills tables"""
+    if industries:
+        _load_industries.clear()
+    if skills:
+        _load_skills.clear()
+
+def get_industries():
+    """Get all industries"""
+    return _reference_data(_load_industries)
+
+def get_skills():
+    """Get all distinct skills"""
+    result = _reference_data(_load_skills)
+    if result:
+        return list(dict.fromkeys(row['Skill_Name'] for row in result))
+    return []
+
+def get_all_skills():
+    # Uses the cached Skills reference data
+    res = _reference_data(_load_skills)
+    return res or []
+
+def get_industry_description(industry_id):
+    res = execute_query("SELECT Description FROM Industry WHERE Industry_ID = %s", (industry_id,))
+    return res[0]['Description'] if res and 'Description' in res[0] else ""
+
+def get_industry_skills(industry_id):
+    """Get skills associated with an industry"""
+    try:
+        query = """
+        SELECT s.Skill_Name
+        FROM Industry_Skills isx
+        JOIN Skills s ON isx.Skill_ID = s.Skill_ID
+        WHERE isx.Industry_ID = %s
+        ORDER BY s.Skill_Name
+        """
+        res = execute_query(query, (industry_id,))
+        return [r['Skill_Name'] for r in res] if res else []
+    except Error as e:
+        if e.errno == 1146:  # Table doesn't exist
+            report_warning("Industry_Skills table is missing. Please contact the administrator.")
+            return []
+        else:
+            report_error(f"Error fetching industry skills: {e}")
+            return []
@@ -0,0 +1,220 @@
+"""In-process mentor search index: weighted tokens with trigram typo tolerance"""
+import re
+import threading
+import time
+
+from portal.caching import singleton
+from portal.db import execute_query
+
+SEARCH_INDEX_MAX_AGE = 900      # seconds before the index is rebuilt from the database
+SEARCH_MIN_SIMILARITY = 0.35    # trigram similarity needed for a typo-tolerant match
+SEARCH_FIELD_WEIGHTS = {'name': 3.0, 'skills': 2.0, 'designation': 1.5, 'industry': 1.0}
+
+def _search_tokens(text):
+    return re.findall(r"[\w+#]+", (text or "").lower())
+
+def _trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class MentorSearchIndex:
+    """In-process trigram index over mentor name, designation, industry and skill names"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.rebuild_lock = threading.Lock()
+        self._docs = {}         # Alumni_ID -> {'name', 'industry_id', 'skills', 'tokens'}
+        self._vocab = {}        # token -> {'grams': trigram count, 'postings': {Alumni_ID: field weight}}
+        self._gram_tokens = {}  # trigram -> tokens containing it
+        self.built_at = None    # time.monotonic() of the last rebuild; None until the first
+
+    def __len__(self):
+        return len(self._docs)
+
+    def is_stale(self, max_age):
+        # None means never built (or marked stale), which must not depend on host uptime
+        return self.built_at is None or time.monotonic() - self.built_at > max_age
+
+    def rebuild(self, rows):
+        """Replace the whole index with freshly loaded mentor documents"""
+        fresh = MentorSearchIndex()
+        for row in rows:
+            fresh._add(row)
+        with self._lock:
+            self._docs, self._vocab, self._gram_tokens = fresh._docs, fresh._vocab, fresh._gram_tokens
+            self.built_at = time.monotonic()
+
+    def upsert(self, row):
+        """Add or re-index one mentor"""
+        with self._lock:
+            self._remove(row['Alumni_ID'])
+            self._add(row)
+
+    def remove(self, alumni_id):
+        with self._lock:
+            self._remove(alumni_id)
+
+    def _add(self, row):
+        alumni_id = row['Alumni_ID']
+        skills = [name for name in row.get('Skills') or [] if name]
+        fields = {
+            'name': row.get('Name'),
+            'designation': row.get('Current_Designation'),
+            'industry': row.get('Industry_Name'),
+            'skills': ' '.join(skills),
+        }
+        tokens = set()
+        for field, text in fields.items():
+            weight = SEARCH_FIELD_WEIGHTS[field]
+            for token in _search_tokens(text):
+                entry = self._vocab.get(token)
+                if entry is None:
+                    grams = _trigrams(token)
+                    entry = self._vocab[token] = {'grams': len(grams), 'postings': {}}
+                    for gram in grams:
+                        self._gram_tokens.setdefault(gram, set()).add(token)
+                if weight > entry['postings'].get(alumni_id, 0):
+                    entry['postings'][alumni_id] = weight
+                tokens.add(token)
+        self._docs[alumni_id] = {
+            'name': row.get('Name') or '',
+            'industry_id': row.get('Industry_ID'),
+            'skills': set(skills),
+            'tokens': tokens,
+        }
+
+    def _remove(self, alumni_id):
+        doc = self._docs.pop(alumni_id, None)
+        if doc is None:
+            return
+        for token in doc['tokens']:
+            entry = self._vocab[token]
+            entry['postings'].pop(alumni_id, None)
+            if not entry['postings']:
+                del self._vocab[token]
+                for gram in _trigrams(token):
+                    tokens = self._gram_tokens.get(gram)
+                    if tokens is not None:
+                        tokens.discard(token)
+                        if not tokens:
+                            del self._gram_tokens[gram]
+
+    def _similar_tokens(self, word):
+        """Indexed tokens that match a query word exactly, by prefix, or within typo distance"""
+        grams = _trigrams(word)
+        shared = {}
+        for gram in grams:
+            for token in self._gram_tokens.get(gram, ()):
+                shared[token] = shared.get(token, 0) + 1
+
+        matches = {}
+        for token, count in shared.items():
+            if token == word:
+                similarity = 1.0
+            elif token.startswith(word):
+                similarity = 0.9  # Still typing
+            else:
+                similarity = 2 * count / (len(grams) + self._vocab[token]['grams'])
+            if similarity >= SEARCH_MIN_SIMILARITY:
+                matches[token] = similarity
+        return matches
+
+    def search(self, text, industry_id=None, skill=None, limit=None):
+        """Rank mentors matching every word of ``text``; returns [(Alumni_ID, score)] best first"""
+        words = _search_tokens(text)
+        if not words:
+            return []
+
+        with self._lock:
+            scores = None
+            for word in words:
+                word_scores = {}
+                for token, similarity in self._similar_tokens(word).items():
+                    for alumni_id, weight in self._vocab[token]['postings'].items():
+                        score = similarity * weight
+                        if score > word_scores.get(alumni_id, 0):
+                            word_scores[alumni_id] = score
+                if scores is None:
+                    scores = word_scores
+                else:
+                    # Every query word has to match something
+                    scores = {alumni_id: score + word_scores[alumni_id]
+                              for alumni_id, score in scores.items() if alumni_id in word_scores}
+                if not scores:
+                    return []
+
+            results = []
+            for alumni_id, score in scores.items():
+                doc = self._docs[alumni_id]
+                if industry_id and doc['industry_id'] != industry_id:
+                    continue
+                if skill and skill not in doc['skills']:
+                    continue
+                results.append((alumni_id, score, doc['name']))
+
+        results.sort(key=lambda item: (-item[1], item[2], item[0]))
+        return [(alumni_id, score) for alumni_id, score, _ in results[:limit]]
+
+def _load_mentor_documents(alumni_id=None):
+    """Load approved mentors with a 'Skills' list of skill names each, for indexing
+
+    Skills come from a second query and are attached in Python rather than
+    through GROUP_CONCAT, which MySQL silently cuts off at group_concat_max_len.
+    """
+    query = """
+    SELECT a.Alumni_ID, a.Name, a.Current_Designation, a.Industry_ID, i.Name as Industry_Name
+    FROM Alumni a
+    LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID
+    WHERE a.Approved = TRUE
+    """
+    skills_query = """
+    SELECT als.Alumni_ID, s.Skill_Name
+    FROM Alumni a
+    JOIN Alumni_Skills als ON a.Alumni_ID = als.Alumni_ID
+    JOIN Skills s ON als.Skill_ID = s.Skill_ID
+    WHERE a.Approved = TRUE
+    """
+    params = None
+    if alumni_id is not None:
+        query += " AND a.Alumni_ID = %s"
+        skills_query += " AND a.Alumni_ID = %s"
+        params = (alumni_id,)
+    rows = execute_query(query, params)
+    if rows is None:
+        return None
+    skill_rows = execute_query(skills_query, params)
+    if skill_rows is None:
+        return None
+
+    skills = {}
+    for skill_row in skill_rows:
+        skills.setdefault(skill_row['Alumni_ID'], []).append(skill_row['Skill_Name'])
+    for row in rows:
+        row['Skills'] = skills.get(row['Alumni_ID'], [])
+    return rows
+
+@singleton
+def _mentor_search_index():
+    return MentorSearchIndex()
+
+def get_mentor_search_index():
+    """Process-wide mentor search index, rebuilt from the database when older than SEARCH_INDEX_MAX_AGE"""
+    index = _mentor_search_index()
+    if index.is_stale(SEARCH_INDEX_MAX_AGE):
+        with index.rebuild_lock:  # Only one session reloads; the rest reuse its result
+            if index.is_stale(SEARCH_INDEX_MAX_AGE):
+                rows = _load_mentor_documents()
+                if rows is not None:
+                    index.rebuild(rows)
+    return index
+
+def refresh_mentor_search_entry(alumni_id):
+    """Re-index one mentor after their profile, skills or approval changed"""
+    index = _mentor_search_index()
+    rows = _load_mentor_documents(alumni_id)
+    if rows is None:
+        return
+    if rows:
+        index.upsert(rows[0])
+    else:
+        index.remove(alumni_id)  # No longer an approved mentor
@@ -0,0 +1,154 @@
+"""Student and alumni skill lists"""
+from mysql.connector import Error
+
+from portal.data.mentors import forget_student_match, mark_mentor_indexes_stale, on_mentor_changed
+from portal.data.reference import _load_skills, _reference_data
+from portal.db import execute_query, get_db_connection, report_error
+
+def get_alumni_skills(alumni_id):
+    """Get skills for an alumni"""
+    query = """
+    SELECT s.Skill_Name 
+    FROM Alumni_Skills als
+    JOIN Skills s ON als.Skill_ID = s.Skill_ID
+    WHERE als.Alumni_ID = %s
+    """
+    result = execute_query(query, (alumni_id,))
+    return [row['Skill_Name'] for row in result] if result else []
+
+# Skill link tables per owner role: (table, owner column)
+SKILL_LINK_TABLES = {
+    'Alumni': ('Alumni_Skills', 'Alumni_ID'),
+    'Student': ('Student_Skills', 'Student_ID'),
+}
+
+def _skill_ids_by_name(cursor, skill_names):
+    """Map skill names to Skill_IDs, using the cached Skills list and the DB only for misses"""
+    known = {row['Skill_Name']: row['Skill_ID'] for row in (_reference_data(_load_skills) or [])}
+    missing = [name for name in set(skill_names) if name not in known]
+    if missing:
+        format_strings = ','.join(['%s'] * len(missing))
+        cursor.execute(f"SELECT Skill_ID, Skill_Name FROM Skills WHERE Skill_Name IN ({format_strings})", tuple(missing))
+        known.update({row[1]: row[0] for row in cursor.fetchall()})
+    return {name: known[name] for name in skill_names if name in known}
+
+def _sync_skill_rows(cursor, role, current, wanted):
+    """Apply the difference between {(owner_id, skill_id)} sets with one DELETE and one multi-row INSERT"""
+    table, owner_column = SKILL_LINK_TABLES[role]
+    removes = sorted(current - wanted)
+    adds = sorted(wanted - current)
+    if removes:
+        pairs = ','.join(['(%s, %s)'] * len(removes))
+        cursor.execute(
+            f"DELETE FROM {table} WHERE ({owner_column}, Skill_ID) IN ({pairs})",
+            tuple(value for pair in removes for value in pair)
+        )
+    if adds:
+        # executemany rewrites a simple INSERT into a single multi-row statement
+        cursor.executemany(f"INSERT INTO {table} ({owner_column}, Skill_ID) VALUES (%s, %s)", adds)
+    return len(adds), len(removes)
+
+def sync_skills(role, owner_id, skill_names):
+    """Make one student's or alumni's skills match skill_names in a single transaction
+
+    Only the difference is written: unchanged rows are left alone, so
+    concurrent readers never see the profile without skills.
+    """
+    table, owner_column = SKILL_LINK_TABLES[role]
+    connection = get_db_connection()
+    if connection is None:
+        return False
+
+    try:
+        cursor = connection.cursor()
+        skill_ids = _skill_ids_by_name(cursor, skill_names)
+        connection.start_transaction()
+        cursor.execute(f"SELECT Skill_ID FROM {table} WHERE {owner_column} = %s FOR UPDATE", (owner_id,))
+        current = {(owner_id, row[0]) for row in cursor.fetchall()}
+        wanted = {(owner_id, skill_id) for skill_id in skill_ids.values()}
+        _sync_skill_rows(cursor, role, current, wanted)
+        connection.commit()
+        cursor.close()
+        return True
+    except Error as e:
+        report_error(f"Error updating skills: {e}")
+        return False
+    finally:
+        connection.close()
+
+def bulk_sync_skills(role, assignments, chunk_size=500, progress=None):
+    """Set skills for many owners at once; assignments maps owner_id -> skill names
+
+    Owners are processed in chunks, each in one transaction with a single
+    SELECT, DELETE and multi-row INSERT. ``progress(done, total)`` is called
+    after every chunk. Returns {'added', 'removed', 'unknown_skills'}, or
+    None if the database could not be reached.
+    """
+    table, owner_column = SKILL_LINK_TABLES[role]
+    owner_ids = list(assignments)
+    summary = {'added': 0, 'removed': 0, 'unknown_skills': set()}
+    connection = get_db_connection()
+    if connection is None:
+        return None
+
+    try:
+        cursor = connection.cursor()
+        skill_ids = _skill_ids_by_name(cursor, [name for names in assignments.values() for name in names])
+        for start in range(0, len(owner_ids), chunk_size):
+            chunk = owner_ids[start:start + chunk_size]
+            connection.start_transaction()
+            format_strings = ','.join(['%s'] * len(chunk))
+            cursor.execute(
+                f"SELECT {owner_column}, Skill_ID FROM {table} WHERE {owner_column} IN ({format_strings}) FOR UPDATE",
+                tuple(chunk)
+            )
+            current = set(cursor.fetchall())
+            wanted = set()
+            for owner_id in chunk:
+                for name in assignments[owner_id]:
+                    if name in skill_ids:
+                        wanted.add((owner_id, skill_ids[name]))
+                    else:
+                        summary['unknown_skills'].add(name)
+            added, removed = _sync_skill_rows(cursor, role, current, wanted)
+            connection.commit()
+            summary['added'] += added
+            summary['removed'] += removed
+            if progress:
+                progress(min(start + chunk_size, len(owner_ids)), len(owner_ids))
+        cursor.close()
+    except Error as e:
+        report_error(f"Error importing skills: {e}")
+        return None
+    finally:
+        connection.close()
+        if role == 'Alumni':
+            mark_mentor_indexes_stale()
+        else:
+            for owner_id in owner_ids:
+                forget_student_match(owner_id)
+    summary['unknown_skills'] = sorted(summary['unknown_skills'])
+    return summary
+
+def update_alumni_skills(alumni_id, skills):
+    """Update alumni skills"""
+    if not sync_skills('Alumni', alumni_id, skills):
+        return False
+    on_mentor_changed(alumni_id)
+    return True
+
+def get_student_skills(student_id):
+    q = """
+    SELECT s.Skill_Name
+    FROM Student_Skills ss
+    JOIN Skills s ON ss.Skill_ID = s.Skill_ID
+    WHERE ss.Student_ID = %s
+    """
+    res = execute_query(q, (student_id,))
+    return [r['Skill_Name'] for r in res] if res else []
+
+def update_student_skills(student_id, skill_names):
+    if not sync_skills('Student', student_id, skill_names):
+        return False
+    forget_student_match(student_id)  # Re-vectorized on next recommendation
+    return True
@@ -0,0 +1,250 @@
+"""MySQL connection pool and query helpers shared by the whole data layer"""
+import logging
+import threading
+import time
+
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+
+from portal.caching import singleton
+from portal.profiling import ProfiledCursor, _current_profile
+
+logger = logging.getLogger(__name__)
+
+# Where data-layer errors and warnings go; app2.py routes them to st.error / st.warning
+_message_handlers = {'error': logger.error, 'warning': logger.warning}
+
+def set_message_handlers(error=None, warning=None):
+    """Route user-facing data-layer errors/warnings (e.g. to st.error and st.warning)"""
+    if error is not None:
+        _message_handlers['error'] = error
+    if warning is not None:
+        _message_handlers['warning'] = warning
+
+def report_error(message):
+    _message_handlers['error'](message)
+
+def report_warning(message):
+    _message_handlers['warning'](message)
+
+# Database configuration
+DB_CONFIG = {
+    'host': 'localhost',
+    'database': 'AlumniMentorshipDB',  
+    'user': 'root',  
+    'password': '12345',  
+}
+
+# Connection pool configuration (one pool per Streamlit server process)
+DB_POOL_CONFIG = {
+    'pool_size': 10,               # Max open connections; keep well below MySQL max_connections
+    'borrow_timeout': 5,           # Seconds to wait for a free connection before giving up
+    'max_lifetime': 1800,          # Seconds before a connection is closed and replaced
+    'health_check_interval': 30,   # Ping connections that sat idle longer than this before reuse
+}
+
+class PooledConnection:
+    """A borrowed pool connection; close() hands it back to the pool instead of disconnecting
+
+    close() is idempotent, and ``with`` closes on exit, so helpers can release
+    the connection in a ``finally`` whatever the block raised.
+    """
+
+    def __init__(self, pool, entry):
+        self._pool = pool
+        self._entry = entry
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __getattr__(self, name):
+        return getattr(self._entry['connection'], name)
+
+    def cursor(self, *args, **kwargs):
+        cursor = self._entry['connection'].cursor(*args, **kwargs)
+        profile = _current_profile.get()
+        return ProfiledCursor(cursor, profile) if profile is not None else cursor
+
+    def close(self):
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            pool.release(self._entry)
+
+class ConnectionPool:
+    """Thread-safe MySQL connection pool shared by every user session
+
+    Connections run in autocommit mode, so a plain read never leaves a
+    transaction open that release() would have to roll back. Helpers whose
+    writes must commit together call connection.start_transaction() first.
+    """
+
+    def __init__(self, db_config, pool_size=10, borrow_timeout=5, max_lifetime=1800, health_check_interval=30):
+        self.db_config = db_config
+        self.pool_size = pool_size
+        self.borrow_timeout = borrow_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._lock = threading.Condition()
+        self._idle = []  # LIFO so the warmest connections are reused first
+        self._open = 0
+        self._in_use = 0
+        self._counters = {
+            'borrows': 0,
+            'waits': 0,
+            'wait_time': 0.0,
+            'timeouts': 0,
+            'created': 0,
+            'recycled': 0,
+            'failed_health_checks': 0,
+        }
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._counters[name] += amount
+
+    def acquire(self):
+        """Borrow a connection, waiting up to borrow_timeout seconds for one to free up"""
+        started = time.monotonic()
+        deadline = started + self.borrow_timeout
+        waited = False
+        with self._lock:
+            while not self._idle and self._open >= self.pool_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    if waited:  # Saturation is exactly when avg_wait_ms matters
+                        self._counters['wait_time'] += time.monotonic() - started
+                    raise PoolError(f"Timed out after {self.borrow_timeout}s waiting for a free database connection")
+                if not waited:
+                    waited = True
+                    self._counters['waits'] += 1
+                self._lock.wait(remaining)
+            if waited:
+                self._counters['wait_time'] += time.monotonic() - started
+            entry = self._idle.pop() if self._idle else None
+            if entry is None:
+                self._open += 1  # Reserve the slot before connecting outside the lock
+            self._in_use += 1
+            self._counters['borrows'] += 1
+
+        try:
+            entry = self._checkout(entry)
+        except Exception:  # Not only Error: any failure here must give the reserved slot back
+            if entry is not None:
+                self._disconnect(entry)
+            with self._lock:
+                self._open -= 1
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+        return PooledConnection(self, entry)
+
+    def _checkout(self, entry):
+        """Recycle expired connections, health-check stale ones and open new ones as needed"""
+        now = time.monotonic()
+        if entry is not None:
+            if now - entry['created_at'] > self.max_lifetime:
+                self._count('recycled')
+                self._disconnect(entry)
+                entry = None
+            elif now - entry['last_used'] > self.health_check_interval:
+                try:
+                    entry['connection'].ping(reconnect=False)
+                except Error:
+                    self._count('failed_health_checks')
+                    self._disconnect(entry)
+                    entry = None
+
+        if entry is None:
+            connection = mysql.connector.connect(**{**self.db_config, 'autocommit': True})
+            self._count('created')
+            entry = {'connection': connection, 'created_at': now, 'last_used': now}
+        return entry
+
+    def release(self, entry):
+        """Return a connection to the pool, rolling back anything left uncommitted"""
+        healthy = True
+        try:
+            if entry['connection'].unread_result:
+                healthy = False  # An abandoned unbuffered read; the next borrower can't use it
+            elif entry['connection'].in_transaction:
+                entry['connection'].rollback()
+        except Exception:
+            healthy = False
+        entry['last_used'] = time.monotonic()
+
+        with self._lock:
+            self._in_use -= 1
+            if healthy:
+                self._idle.append(entry)
+            else:
+                self._open -= 1
+            self._lock.notify()
+        if not healthy:
+            self._disconnect(entry)
+
+    def _disconnect(self, entry):
+        try:
+            entry['connection'].close()
+        except Error:
+            pass
+
+    def stats(self):
+        """Snapshot of pool usage for the admin dashboard"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update({
+                'pool_size': self.pool_size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+            })
+        stats['avg_wait_ms'] = (stats['wait_time'] / stats['waits'] * 1000) if stats['waits'] else 0.0
+        return stats
+
+@singleton
+def get_connection_pool():
+    """Process-wide connection pool shared by all user sessions"""
+    return ConnectionPool(DB_CONFIG, **DB_POOL_CONFIG)
+
+def get_db_connection():
+    """Borrow a database connection from the shared pool (close() returns it)"""
+    started = time.perf_counter()
+    try:
+        return get_connection_pool().acquire()
+    except Error as e:
+        report_error(f"Error connecting to MySQL: {e}")
+        return None
+    finally:
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record_acquire((time.perf_counter() - started) * 1000)
+
+def execute_query(query, params=None, fetch=True):
+    """Execute a SQL query and return results"""
+    connection = get_db_connection()
+    if connection is None:
+        return None
+    
+    try:
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute(query, params)
+        
+        if fetch:
+            result = cursor.fetchall()
+        else:
+            result = cursor.rowcount  # Committed already: pool connections autocommit
+        
+        cursor.close()
+        return result
+    except Error as e:
+        # Avoid showing duplicate errors if register_user handles it
+        if "Duplicate entry" not in str(e):
+            report_error(f"Database error: {e}")
+        return None
+    finally:
+        connection.close()
@@ -0,0 +1,52 @@
+"""Issue a page's independent reads concurrently and wait for them together
+
+The data layer is synchronous (mysql.connector, one pooled connection per
+query), so concurrency comes from a process-wide thread pool rather than an
+event loop: each read borrows its own pool connection, and a page pays
+roughly its slowest query instead of the sum.
+"""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from portal.caching import singleton
+from portal.db import DB_POOL_CONFIG
+
+# More workers than pool connections would only queue on the pool's borrow timeout
+FAN_OUT_WORKERS = DB_POOL_CONFIG['pool_size']
+
+# Per-session context the worker threads need (app2.py carries Streamlit's
+# ScriptRunContext over, so st.error and st.session_state work inside reads)
+_thread_context = {'capture': lambda: None, 'attach': lambda captured: None}
+
+def set_thread_context(capture, attach):
+    """``capture()`` runs on the calling thread; ``attach(captured)`` runs on the worker before each read"""
+    _thread_context['capture'] = capture
+    _thread_context['attach'] = attach
+
+@singleton
+def _fan_out_executor():
+    return ThreadPoolExecutor(max_workers=FAN_OUT_WORKERS, thread_name_prefix='portal-fanout')
+
+def _run(attach, captured, func, args):
+    attach(captured)
+    return func(*args)
+
+def fetch_all(**calls):
+    """Run ``name=(func, *args)`` reads concurrently and return {name: result}
+
+    Each read runs in a copy of the caller's contextvars, so the query
+    profiler still attributes its statements to the current rerun. If a read
+    raises, the exception is re-raised here once every read has finished.
+    """
+    if len(calls) <= 1:
+        return {name: func(*args) for name, (func, *args) in calls.items()}
+
+    captured = _thread_context['capture']()
+    attach = _thread_context['attach']
+    executor = _fan_out_executor()
+    futures = {
+        name: executor.submit(contextvars.copy_context().run, _run, attach, captured, func, args)
+        for name, (func, *args) in calls.items()
+    }
+    wait(futures.values())
+    return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,218 @@
+"""Per-rerun SQL profiling: statements, row counts and pool borrows, plus the slow-query log"""
+import contextlib
+import contextvars
+import json
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from portal.caching import singleton
+
+PROFILE_HISTORY_SIZE = 200        # Rerun summaries kept for the Query Profiler page
+SLOW_QUERY_THRESHOLD_MS = 200     # Statements slower than this (execute + fetch) go to the slow-query log
+SLOW_QUERY_LOG_SIZE = 500
+REPEATED_QUERY_THRESHOLD = 3      # Same statement this many times in one rerun is flagged as a likely N+1
+
+# The profile of the rerun running in the current context (None outside main())
+_current_profile = contextvars.ContextVar('query_profile', default=None)
+
+def _normalize_sql(sql):
+    return " ".join(str(sql).split())[:500]
+
+@dataclass
+class RerunProfile:
+    """Statements and connection borrows recorded during one script rerun"""
+    started_at: float = field(default_factory=time.time)
+    page: str = None
+    role: str = None
+    statements: list = field(default_factory=list)   # {'sql', 'kind', 'ms', 'rows'}
+    acquire_ms: list = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def record_statement(self, sql, kind):
+        statement = {'sql': _normalize_sql(sql), 'kind': kind, 'ms': 0.0, 'rows': 0}
+        with self._lock:
+            self.statements.append(statement)
+        return statement
+
+    def record_acquire(self, ms):
+        with self._lock:
+            self.acquire_ms.append(ms)
+
+    def summary(self, duration_ms):
+        repeated = Counter(statement['sql'] for statement in self.statements)
+        slowest = max(self.statements, key=lambda statement: statement['ms'], default=None)
+        return {
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds'),
+            'page': self.page,
+            'role': self.role,
+            'duration_ms': round(duration_ms, 2),
+            'queries': len(self.statements),
+            'query_ms': round(sum(statement['ms'] for statement in self.statements), 2),
+            'rows': sum(statement['rows'] for statement in self.statements),
+            'acquires': len(self.acquire_ms),
+            'acquire_ms': round(sum(self.acquire_ms), 2),
+            'slowest_ms': round(slowest['ms'], 2) if slowest else 0.0,
+            'slowest_sql': slowest['sql'] if slowest else None,
+            'repeated': {sql: count for sql, count in repeated.items() if count >= REPEATED_QUERY_THRESHOLD},
+        }
+
+class ProfiledCursor:
+    """Cursor wrapper timing execute/executemany/callproc plus the fetches that follow"""
+
+    def __init__(self, cursor, profile):
+        self._cursor = cursor
+        self._profile = profile
+        self._statement = None
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self.fetchall())
+
+    def _run(self, kind, sql, call):
+        self._statement = self._profile.record_statement(sql, kind)
+        started = time.perf_counter()
+        try:
+            return call()
+        finally:
+            self._statement['ms'] += (time.perf_counter() - started) * 1000
+            if self._cursor.rowcount is not None and self._cursor.rowcount > 0:
+                self._statement['rows'] = self._cursor.rowcount
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        return self._run('execute', operation, lambda: self._cursor.execute(operation, params, *args, **kwargs))
+
+    def executemany(self, operation, seq_params, *args, **kwargs):
+        return self._run('executemany', operation, lambda: self._cursor.executemany(operation, seq_params, *args, **kwargs))
+
+    def callproc(self, procname, args=()):
+        return self._run('callproc', f"CALL {procname}", lambda: self._cursor.callproc(procname, args))
+
+    def _fetch(self, call, count):
+        started = time.perf_counter()
+        result = call()
+        if self._statement is not None:
+            self._statement['ms'] += (time.perf_counter() - started) * 1000
+            self._statement['rows'] = max(self._statement['rows'], 0) + count(result)
+        return result
+
+    def nextset(self):
+        # Reading the next result set of a CALL is part of the statement's cost
+        return self._fetch(self._cursor.nextset, lambda more: 0)
+
+    def fetchone(self):
+        return self._fetch(self._cursor.fetchone, lambda row: 0 if row is None else 1)
+
+    def fetchmany(self, size=None):
+        if size is None:
+            return self._fetch(self._cursor.fetchmany, len)
+        return self._fetch(lambda: self._cursor.fetchmany(size), len)
+
+    def fetchall(self):
+        return self._fetch(self._cursor.fetchall, len)
+
+    def stored_results(self):
+        # callproc already read these (buffered), so only the row counts are added
+        for result in self._cursor.stored_results():
+            if self._statement is not None and result.rowcount > 0:
+                self._statement['rows'] += result.rowcount
+            yield result
+
+class QueryProfiler:
+    """Process-wide store of rerun summaries, per page/role totals and the slow-query log"""
+
+    def __init__(self, slow_threshold_ms=SLOW_QUERY_THRESHOLD_MS):
+        self.slow_threshold_ms = slow_threshold_ms
+        self._lock = threading.Lock()
+        self._reruns = deque(maxlen=PROFILE_HISTORY_SIZE)
+        self._slow = deque(maxlen=SLOW_QUERY_LOG_SIZE)
+        self._totals = {}  # (page, role) -> counters
+
+    def record(self, profile, duration_ms):
+        summary = profile.summary(duration_ms)
+        slow = [
+            {'at': summary['started_at'], 'page': profile.page, 'role': profile.role,
+             'ms': round(statement['ms'], 2), 'rows': statement['rows'], 'sql': statement['sql']}
+            for statement in profile.statements if statement['ms'] >= self.slow_threshold_ms
+        ]
+        with self._lock:
+            self._reruns.append(summary)
+            self._slow.extend(slow)
+            totals = self._totals.setdefault((profile.page, profile.role), Counter())
+            totals['reruns'] += 1
+            totals['rerun_seconds'] += duration_ms / 1000
+            totals['queries'] += summary['queries']
+            totals['query_seconds'] += summary['query_ms'] / 1000
+            totals['rows'] += summary['rows']
+            totals['acquires'] += summary['acquires']
+            totals['acquire_seconds'] += summary['acquire_ms'] / 1000
+            totals['slow_queries'] += len(slow)
+        return summary
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'slow_threshold_ms': self.slow_threshold_ms,
+                'reruns': list(self._reruns),
+                'slow_queries': list(self._slow),
+                'totals': [{'page': page, 'role': role, **counters} for (page, role), counters in self._totals.items()],
+            }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2, default=str)
+
+    def to_prometheus(self):
+        """Totals in the Prometheus text exposition format"""
+        metrics = [
+            ('reruns', 'portal_reruns_total', 'Script reruns profiled'),
+            ('rerun_seconds', 'portal_rerun_seconds_total', 'Wall time spent in profiled reruns'),
+            ('queries', 'portal_queries_total', 'SQL statements executed'),
+            ('query_seconds', 'portal_query_seconds_total', 'Time spent executing and fetching SQL statements'),
+            ('rows', 'portal_query_rows_total', 'Rows fetched or affected'),
+            ('acquires', 'portal_connection_acquires_total', 'Connections borrowed from the pool'),
+            ('acquire_seconds', 'portal_connection_acquire_seconds_total', 'Time spent waiting to borrow connections'),
+            ('slow_queries', 'portal_slow_queries_total', 'Statements slower than the slow-query threshold'),
+        ]
+        totals = self.snapshot()['totals']
+        lines = []
+        for key, name, help_text in metrics:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for row in totals:
+                page = str(row['page']).replace('\\', '\\\\').replace('"', '\\"')
+                lines.append(f'{name}{{page="{page}",role="{row["role"]}"}} {row.get(key, 0):g}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            self._reruns.clear()
+            self._slow.clear()
+            self._totals.clear()
+
+@singleton
+def get_query_profiler():
+    """Process-wide query profiler shared by all user sessions"""
+    return QueryProfiler()
+
+@contextlib.contextmanager
+def profile_rerun(describe, on_summary=None):
+    """Profile every query issued while the block runs
+
+    ``describe()`` is called when the block exits and returns the (page, role)
+    the rerun ended on; the recorded summary is passed to ``on_summary``.
+    """
+    profile = RerunProfile()
+    token = _current_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+        profile.page, profile.role = describe()
+        summary = get_query_profiler().record(profile, (time.perf_counter() - started) * 1000)
+        if on_summary is not None:
+            on_summary(summary)
@@ -0,0 +1 @@
+"""Streamlit pages, imported by app2.show_main_app() when their route is selected"""
@@ -0,0 +1,405 @@
+"""Administrator pages"""
+import functools
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from portal.data.accounts import (
+    USER_DIRECTORY, approve_alumni, count_users, get_pending_alumni, get_user_directory_page,
+)
+from portal.data.analytics import (
+    PLACEMENT_LOG_COLUMNS, PLACEMENT_LOG_EXPORT_MAX_ROWS, SITE_COUNTERS_MAX_AGE, TREND_GRANULARITIES,
+    export_placement_log, get_placement_log, get_placement_trends, get_site_statistics,
+    rebuild_placement_rollup, rebuild_site_counters, trend_bucket_start,
+)
+from portal.data.bulk_import import IMPORT_COLUMNS, run_bulk_import
+from portal.data.ratings import rebuild_rating_summary, verify_rating_summary
+from portal.data.reference import REFERENCE_DATA_TTL, invalidate_reference_data
+from portal.db import get_connection_pool
+from portal.profiling import get_query_profiler
+from portal.ui.widgets import turn_page
+
+def analytics_dashboard():
+    """Analytics Dashboard Page"""
+    st.markdown("<h1 style='text-align: center; color: #00d4ff; margin-bottom: 30px;'>📊 Analytics Dashboard</h1>", unsafe_allow_html=True)
+
+    # Get statistics
+    stats = get_site_statistics()
+
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>📈 Key Metrics</h2>", unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("👨‍🎓 Total Students", stats.get('total_students', 0))
+    with col2:
+        st.metric("👨‍💼 Total Alumni (Approved)", stats.get('total_alumni', 0))
+    with col3:
+        st.metric("⏳ Pending Alumni", stats.get('pending_alumni', 0))
+    with col4:
+        st.metric("💼 Total Placements", stats.get('total_placements', 0))
+    st.caption(f"Totals are maintained by database triggers and refreshed at least every {SITE_COUNTERS_MAX_AGE} seconds.")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+
+    # Placement trends chart
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>📊 Placement Trends</h2>", unsafe_allow_html=True)
+    today = datetime.now().date()
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        date_range = st.date_input("📅 Date Range", value=(today - timedelta(days=365), today), max_value=today)
+    with col2:
+        granularity = st.selectbox("🕒 Group By", list(TREND_GRANULARITIES.keys()), index=1,
+                                   format_func=str.capitalize)
+
+    if isinstance(date_range, (tuple, list)) and len(date_range) == 2:
+        start_date, end_date = date_range
+        trends = get_placement_trends(start_date, end_date, granularity)
+        if trends:
+            df = pd.DataFrame(trends)
+            df['date'] = pd.to_datetime(df['date'])
+            df['count'] = df['count'].astype(int)
+            # Show empty buckets as zero instead of skipping them
+            buckets = pd.date_range(trend_bucket_start(start_date, granularity), end_date,
+                                    freq=TREND_GRANULARITIES[granularity])
+            df = df.set_index('date').reindex(buckets, fill_value=0)
+            st.bar_chart(df)
+        else:
+            st.info("📭 No placement data to display.")
+    else:
+        st.info("📅 Pick an end date to show the chart.")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+
+    # Rating aggregate maintenance
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>⭐ Mentor Rating Aggregates</h2>", unsafe_allow_html=True)
+    st.write("Ratings are served from the Alumni_Rating_Summary table, which is updated whenever feedback is submitted.")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("🔍 Verify Rating Aggregates", use_container_width=True):
+            drift = verify_rating_summary()
+            if drift is None:
+                st.error("❌ Could not verify rating aggregates.")
+            elif drift:
+                st.warning(f"⚠️ {len(drift)} alumni have drifted rating aggregates. Rebuild to fix them.")
+                st.dataframe(pd.DataFrame(drift), use_container_width=True)
+            else:
+                st.success("✅ All rating aggregates match the Feedback table.")
+    with col2:
+        if st.button("🔄 Rebuild Rating Aggregates", use_container_width=True):
+            if rebuild_rating_summary():
+                st.success("✅ Rating aggregates rebuilt from Feedback.")
+            else:
+                st.error("❌ Failed to rebuild rating aggregates.")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+
+    # Reference data cache
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>🗂️ Reference Data Cache</h2>", unsafe_allow_html=True)
+    st.write(f"Industries and skills are cached for all users for up to {REFERENCE_DATA_TTL // 60} minutes. "
+             "Refresh the cache after editing the Industry or Skills tables.")
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("♻️ Refresh Industries & Skills", use_container_width=True):
+            invalidate_reference_data()
+            st.success("✅ Reference data will be reloaded on next use.")
+    with col2:
+        if st.button("🔢 Recount Site Totals & Trends", use_container_width=True):
+            if rebuild_site_counters() and rebuild_placement_rollup():
+                st.success("✅ Site counters and placement trends recounted from the base tables.")
+            else:
+                st.error("❌ Failed to recount site counters.")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+
+    # Connection pool health
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>🔌 Database Connection Pool</h2>", unsafe_allow_html=True)
+    pool_stats = get_connection_pool().stats()
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🔗 In Use", f"{pool_stats['in_use']} / {pool_stats['pool_size']}")
+    with col2:
+        st.metric("💤 Idle", pool_stats['idle'])
+    with col3:
+        st.metric("⏳ Waits", pool_stats['waits'])
+    with col4:
+        st.metric("⏱️ Avg Wait", f"{pool_stats['avg_wait_ms']:.1f} ms")
+
+    with st.expander("Detailed pool metrics"):
+        st.json(pool_stats)
+
+def _placement_log_download(filters, fmt):
+    """Deferred download data for the export buttons
+
+    st.download_button needs the whole payload as bytes (Streamlit has no way
+    to stream a file to the browser), so the export is capped at
+    PLACEMENT_LOG_EXPORT_MAX_ROWS entries to bound what is read into memory
+    here. The temp file is closed (which deletes it) straight away.
+    """
+    out = export_placement_log(filters, fmt, max_rows=PLACEMENT_LOG_EXPORT_MAX_ROWS)
+    if out is None:
+        return b""
+    with out:
+        return out.read()
+
+def placement_log_page():
+    """Placement Log Page"""
+    st.markdown("<h1 style='text-align: center; color: #00d4ff; margin-bottom: 30px;'>📋 Placement Log</h1>", unsafe_allow_html=True)
+    st.info("⚡ This log is automatically updated by a database trigger when a student's placement status is set to 'Placed'.")
+
+    with st.form("placement_log_filters"):
+        col1, col2, col3 = st.columns([1, 1, 1.2])
+        with col1:
+            student = st.text_input("👤 Student (ID or name)")
+        with col2:
+            company = st.text_input("🏢 Company")
+        with col3:
+            date_range = st.date_input("📅 Logged Between", value=())
+        st.form_submit_button("🔍 Apply Filters", use_container_width=True)
+
+    filters = {'student': student, 'company': company}
+    if isinstance(date_range, (tuple, list)) and date_range:
+        filters['date_from'] = date_range[0]
+        filters['date_to'] = date_range[-1]
+
+    # Cursors of the pages visited so far; page n starts after cursors[n]
+    view = st.session_state.get('placement_log_view')
+    if view is None or view['filters'] != filters:
+        view = {'filters': filters, 'cursors': [None], 'page': 0}
+        st.session_state['placement_log_view'] = view
+
+    log_entries, next_cursor = get_placement_log(filters, cursor=view['cursors'][view['page']])
+    if next_cursor is not None and len(view['cursors']) == view['page'] + 1:
+        view['cursors'].append(next_cursor)
+
+    if log_entries:
+        df = pd.DataFrame(log_entries, columns=PLACEMENT_LOG_COLUMNS)
+        # Reorder for clarity
+        df = df[['Log_Timestamp', 'Student_ID', 'Student_Name', 'Company_Name', 'Placement_Date', 'Log_ID']]
+        st.dataframe(df, use_container_width=True, hide_index=True)
+    elif view['page'] == 0:
+        st.info("📭 No placement log entries found.")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("⬅️ Newer", disabled=view['page'] == 0, on_click=turn_page, args=('placement_log_view', -1),
+                  use_container_width=True)
+    with col2:
+        st.markdown(f"<p style='text-align: center;'>Page {view['page'] + 1}</p>", unsafe_allow_html=True)
+    with col3:
+        st.button("Older ➡️", disabled=next_cursor is None, on_click=turn_page, args=('placement_log_view', 1),
+                  use_container_width=True)
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>⬇️ Export</h2>", unsafe_allow_html=True)
+    st.write(f"Exports the newest {PLACEMENT_LOG_EXPORT_MAX_ROWS:,} entries matching the filters above; "
+             "narrow the dates to export older ones. The file is generated when you click download.")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("📄 Download CSV", data=functools.partial(_placement_log_download, filters, 'csv'),
+                           file_name="placement_log.csv", mime="text/csv", on_click="ignore",
+                           use_container_width=True)
+    with col2:
+        st.download_button("🧱 Download Parquet", data=functools.partial(_placement_log_download, filters, 'parquet'),
+                           file_name="placement_log.parquet", mime="application/octet-stream", on_click="ignore",
+                           use_container_width=True)
+
+def user_management():
+    """User Management Page"""
+    st.markdown("<h1 style='text-align: center; color: #00d4ff; margin-bottom: 30px;'>👥 User Management</h1>", unsafe_allow_html=True)
+    st.write("⚙️ Manage users and approve pending alumni registrations.")
+
+    # Pending Alumni Approvals Section
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>⏳ Pending Alumni Approvals</h2>", unsafe_allow_html=True)
+
+    try:
+        pending_alumni = get_pending_alumni()
+
+        if pending_alumni and len(pending_alumni) > 0:
+            st.write(f"📋 Found {len(pending_alumni)} pending alumni registration(s).")
+
+            # Display pending alumni in a table
+            df = pd.DataFrame(pending_alumni)
+            st.dataframe(df, use_container_width=True)
+
+            # Approval section
+            st.markdown("<h3 style='color: #00d4ff; margin-bottom: 15px;'>✅ Approve Alumni</h3>", unsafe_allow_html=True)
+            with st.container(border=True):
+                with st.form("approval_form"):
+                    alumni_options = {f"{row['Name']} (ID: {row['Alumni_ID']})": row['Alumni_ID']
+                                     for row in pending_alumni}
+                    if alumni_options:
+                        selected = st.selectbox("👤 Select Alumni to Approve", list(alumni_options.keys()))
+                        submit_button = st.form_submit_button("✅ Approve Selected Alumni", use_container_width=True)
+
+                        if submit_button:
+                            alumni_id = alumni_options[selected]
+                            if approve_alumni(alumni_id):
+                                st.success(f"🎉 Alumni approved successfully!")
+                                st.rerun()
+                            else:
+                                st.error("❌ Failed to approve alumni. Please try again.")
+                    else:
+                        st.info("📭 No alumni to select.")
+        else:
+            st.info("✅ No pending alumni registrations. All alumni accounts are approved.")
+
+    except Exception as e:
+        st.error(f"❌ Error loading pending alumni: {e}")
+        st.info("🔍 Please check your database connection and ensure the Alumni table exists.")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+
+    # User directory
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>📊 User Directory</h2>", unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns([1, 2, 1, 1])
+    with col1:
+        role = st.radio("👥 Users", list(USER_DIRECTORY.keys()), horizontal=True)
+    with col2:
+        search = st.text_input("🔍 Search", placeholder="Start of a name, email" + (" or department" if role == 'Student' else ""))
+    with col3:
+        sort = st.selectbox("↕️ Sort By", list(USER_DIRECTORY[role]['sort'].keys()))
+    with col4:
+        descending = st.toggle("Descending", disabled=sort == 'Newest')
+
+    view_filters = {'role': role, 'search': search.strip(), 'sort': sort, 'descending': descending}
+    view = st.session_state.get('user_directory_view')
+    if view is None or view['filters'] != view_filters:
+        view = {'filters': view_filters, 'cursors': [None], 'page': 0}
+        st.session_state['user_directory_view'] = view
+
+    users, next_cursor = get_user_directory_page(role, view_filters['search'], sort, descending,
+                                                 cursor=view['cursors'][view['page']])
+    if next_cursor is not None and len(view['cursors']) == view['page'] + 1:
+        view['cursors'].append(next_cursor)
+
+    total, capped = count_users(role, view_filters['search'])
+    label = "students" if role == 'Student' else "alumni"
+    st.write(f"📈 {'Matching' if view_filters['search'] else 'Total'}: {total:,}{'+' if capped else ''} {label}")
+
+    if users:
+        st.dataframe(pd.DataFrame(users), use_container_width=True, hide_index=True)
+    elif view['page'] == 0:
+        st.info(f"📭 No {label} found.")
+
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col1:
+        st.button("⬅️ Previous", key="users_prev", disabled=view['page'] == 0, on_click=turn_page,
+                  args=('user_directory_view', -1), use_container_width=True)
+    with col2:
+        st.markdown(f"<p style='text-align: center;'>Page {view['page'] + 1}</p>", unsafe_allow_html=True)
+    with col3:
+        st.button("Next ➡️", key="users_next", disabled=next_cursor is None, on_click=turn_page,
+                  args=('user_directory_view', 1), use_container_width=True)
+
+def query_profiler_page():
+    """Admin debug page: per-rerun query counts and latency, slow-query log and metric dumps"""
+    st.markdown("<h1 style='text-align: center; color: #00d4ff; margin-bottom: 30px;'>🐞 Query Profiler</h1>", unsafe_allow_html=True)
+    st.write("⚙️ Every rerun records each SQL statement (execute + fetch time, rows) and each pool borrow, tagged with the page and role it ran for.")
+
+    profiler = get_query_profiler()
+    snapshot = profiler.snapshot()
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        threshold = st.number_input("🐢 Slow-query threshold (ms)", min_value=1, value=int(profiler.slow_threshold_ms), step=50)
+        profiler.slow_threshold_ms = threshold
+    with col2:
+        if st.button("🧹 Reset Profiler", use_container_width=True):
+            profiler.reset()
+            st.rerun()
+
+    last = st.session_state.get('last_query_profile')
+    if last:
+        st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>🔁 Your Previous Rerun</h2>", unsafe_allow_html=True)
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("📄 Page", last['page'])
+        with col2:
+            st.metric("🧮 Queries", last['queries'])
+        with col3:
+            st.metric("⏱️ Query Time", f"{last['query_ms']:.1f} ms")
+        with col4:
+            st.metric("🔗 Acquire Time", f"{last['acquire_ms']:.1f} ms")
+        if last['repeated']:
+            st.warning("⚠️ Statements repeated within one rerun (possible N+1):")
+            st.json(last['repeated'])
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>📊 Totals by Page</h2>", unsafe_allow_html=True)
+    if snapshot['totals']:
+        totals = pd.DataFrame(snapshot['totals'])
+        totals['queries_per_rerun'] = (totals['queries'] / totals['reruns']).round(1)
+        totals['avg_query_ms'] = (totals['query_seconds'] * 1000 / totals['queries'].clip(lower=1)).round(2)
+        st.dataframe(totals.sort_values('query_seconds', ascending=False), use_container_width=True, hide_index=True)
+    else:
+        st.info("📭 No reruns profiled yet.")
+
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>🕒 Recent Reruns</h2>", unsafe_allow_html=True)
+    if snapshot['reruns']:
+        reruns = pd.DataFrame(snapshot['reruns'][::-1]).drop(columns=['repeated'])
+        st.dataframe(reruns, use_container_width=True, hide_index=True)
+
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>🐢 Slow-Query Log</h2>", unsafe_allow_html=True)
+    if snapshot['slow_queries']:
+        st.dataframe(pd.DataFrame(snapshot['slow_queries'][::-1]), use_container_width=True, hide_index=True)
+    else:
+        st.success(f"✅ No statements slower than {profiler.slow_threshold_ms} ms.")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>⬇️ Dumps</h2>", unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.download_button("🧾 Download JSON", data=profiler.to_json, file_name="query_profile.json",
+                           mime="application/json", on_click="ignore", use_container_width=True)
+    with col2:
+        st.download_button("📈 Download Prometheus Metrics", data=profiler.to_prometheus, file_name="query_metrics.prom",
+                           mime="text/plain", on_click="ignore", use_container_width=True)
+    with st.expander("Prometheus text"):
+        st.code(profiler.to_prometheus(), language="text")
+
+def bulk_import_page():
+    """Admin page for loading students, alumni, skills and placements from CSV/Parquet"""
+    st.markdown("<h1 style='text-align: center; color: #00d4ff; margin-bottom: 30px;'>📥 Bulk Import</h1>", unsafe_allow_html=True)
+    st.write("⚙️ Onboard a whole batch at once. Files are read in chunks, validated, deduplicated by email and loaded in multi-row transactions.")
+
+    entity = st.selectbox("📦 What are you importing?", list(IMPORT_COLUMNS.keys()))
+    required, optional = IMPORT_COLUMNS[entity]
+    st.caption(f"Required columns: {', '.join(required)}" + (f" | Optional: {', '.join(optional)}" if optional else ""))
+    if entity == 'Skills':
+        st.caption("role is Student or Alumni; separate skills with ';'. Each listed user's skills are replaced.")
+    elif entity == 'Alumni':
+        st.caption("industry must match an existing industry name. Imported alumni are approved immediately.")
+
+    uploaded = st.file_uploader("📄 Upload a CSV or Parquet file", type=['csv', 'parquet'])
+    if uploaded is not None and st.button("🚀 Start Import", use_container_width=True):
+        bar = st.progress(0.0, text="Starting import...")
+
+        def show_progress(processed, fraction):
+            bar.progress(fraction, text=f"Processed {processed:,} rows")
+
+        st.session_state['import_report'] = run_bulk_import(entity, uploaded, progress=show_progress)
+        bar.progress(1.0, text="Import finished")
+
+    report = st.session_state.get('import_report')
+    if report:
+        st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>📋 Import Report</h2>", unsafe_allow_html=True)
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("📄 Rows Processed", f"{report['processed']:,}")
+        with col2:
+            st.metric("✅ Loaded", f"{report['loaded']:,}")
+        with col3:
+            st.metric("♻️ Duplicates", f"{report['duplicates']:,}")
+        with col4:
+            st.metric("⚠️ Errors", f"{len(report['errors']):,}")
+
+        if report['unknown_skills']:
+            st.warning(f"Unknown skills were skipped: {', '.join(report['unknown_skills'][:20])}")
+        if report['errors']:
+            errors_df = pd.DataFrame(report['errors'])
+            st.dataframe(errors_df.head(1000), use_container_width=True)
+            st.download_button("⬇️ Download Error Report", errors_df.to_csv(index=False),
+                               file_name="import_errors.csv", mime="text/csv", on_click="ignore")
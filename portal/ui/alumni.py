@@ -0,0 +1,296 @@
+"""Alumni pages"""
+import pandas as pd
+import streamlit as st
+
+from portal.data.accounts import get_alumni_achievements, get_alumni_info, update_alumni_profile
+from portal.data.mentorship import (
+    CONTENT_PREVIEW_CHARS, confirm_session, get_alumni_sessions_by_status,
+    get_pending_requests_for_alumni, get_session_contents, mark_session_completed,
+    store_session_content, update_request_status,
+)
+from portal.data.ratings import get_alumni_feedback, get_alumni_rating
+from portal.data.reference import get_industries, get_skills
+from portal.data.skills import get_alumni_skills, update_alumni_skills
+from portal.fanout import fetch_all
+
+def alumni_dashboard():
+    """Alumni Dashboard Page"""
+    st.markdown(f"<h1 style='text-align: center; color: #00d4ff; margin-bottom: 30px;'>Welcome, {st.session_state['name']}!</h1>", unsafe_allow_html=True)
+
+    # The four sections read independently, so load them concurrently
+    alumni_id = st.session_state['user_id']
+    data = fetch_all(
+        info=(get_alumni_info, alumni_id),
+        rating=(get_alumni_rating, alumni_id),
+        pending_requests=(get_pending_requests_for_alumni, alumni_id),
+        feedback=(get_alumni_feedback, alumni_id),
+    )
+
+    # Display alumni info
+    alumni_info = data['info']
+    if alumni_info:
+        st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>📋 My Profile Summary</h2>", unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.info(f"🏢 Industry: {alumni_info.get('Industry_Name', 'N/A')}")
+        with col2:
+            st.info(f"💼 Designation: {alumni_info.get('Current_Designation', 'N/A')}")
+        with col3:
+            st.info(f"📈 Experience: {alumni_info.get('years_of_experience', 0)} years")
+
+        if alumni_info.get('Graduating_Year'):
+            st.info(f"🎓 Graduating Year: {alumni_info['Graduating_Year']}")
+
+    # Display rating
+    rating = data['rating']
+    st.metric(label="⭐ My Average Rating", value=f"{rating:.1f} / 5.0")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+
+    # Immediately show new requests section
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>📨 New Mentorship Requests</h2>", unsafe_allow_html=True)
+
+    # --- FIXED: Use the dedicated function to get pending requests ---
+    pending_requests = data['pending_requests']
+
+    if pending_requests:
+        st.markdown(f"<p style='color: #00d4ff; margin-bottom: 15px;'>You have **{len(pending_requests)}** new request(s) to review</p>", unsafe_allow_html=True)
+
+        for req in pending_requests:
+            with st.container(border=True):
+                st.markdown(f"<h4 style='color: #00d4ff;'>👨‍🎓 Request from: {req['Student_Name']}</h4>", unsafe_allow_html=True)
+                st.write(f"📅 Date: {req['Request_Date']}")
+                st.write(f"💬 Message: {req['Request_Message']}")
+                c1, c2 = st.columns(2)
+                with c1:
+                    if st.button("✅ Accept", key=f"acc_{req['Request_ID']}", use_container_width=True):
+                        if update_request_status(req['Request_ID'], 'Accepted'):
+                            # FIXED: Added message about next step
+                            st.success("🎉 Request Accepted! Student will be notified to propose a time.")
+                            st.rerun()
+                with c2:
+                    if st.button("❌ Decline", key=f"dec_{req['Request_ID']}", use_container_width=True):
+                        if update_request_status(req['Request_ID'], 'Declined'):
+                            st.warning("📝 Request Declined.")
+                            st.rerun()
+    else:
+        st.info("📭 No new mentorship requests at this time.")
+
+    st.markdown("<hr style='border: 1px solid #00d4ff; margin: 40px 0;'>", unsafe_allow_html=True)
+
+    st.markdown("<h2 style='color: #00d4ff; margin-bottom: 20px;'>💬 My Feedback</h2>", unsafe_allow_html=True)
+    feedback = data['feedback']
+
+    if feedback:
+        df = pd.DataFrame(feedback)
+        # Reorder columns for better display
+        df = df[['Date', 'Student_Name', 'Rating', 'Comments']]
+        st.dataframe(df, use_container_width=True)
+    else:
+        st.info("📭 No feedback received yet.")
+
+def requests_and_sessions_page():
+    st.markdown("<h1 style='text-align: center; color: #00d4ff; margin-bottom: 30px;'>Manage Requests & Sessions</h1>", unsafe_allow_html=True)
+    pending_requests, sessions = get_alumni_sessions_by_status(st.session_state['user_id'])
+
+    if sessions is None:
+        st.error("❌ Failed to fetch sessions. Please try again later.")
+        return
+
+    tab1, tab2, tab3 = st.tabs(["📨 New Mentorship Requests", "⚙️ Manage Scheduled Sessions", "🏁 Completed Sessions"])
+
+    with tab1: # New Mentorship Requests
+        st.subheader("New Requests to Review")
+        st.info("💡 Accepting a request allows the student to propose a session time.")
+        
+        # --- FIXED: Use the main list of pending requests for the display and actions ---
+        if not pending_requests:
+            st.info("📭 No new mentorship requests.")
+        for req in pending_requests:
+            with st.container(border=True):
+                st.markdown(f"<h4 style='color: #00d4ff;'>👨‍🎓 Request from: {req['Student_Name']}</h4>", unsafe_allow_html=True)
+                st.write(f"📅 Date: {req['Request_Date']}")
+                st.write(f"💬 Message: {req['Request_Message']}")
+                c1, c2 = st.columns(2)
+                with c1:
+                    if st.button("✅ Accept", key=f"acc_{req['Request_ID']}"):
+                        if update_request_status(req['Request_ID'], 'Accepted'):
+                            st.success("🎉 Request Accepted! Student will propose a time.")
+                            st.rerun()
+                with c2:
+                    if st.button("❌ Decline", key=f"dec_{req['Request_ID']}"):
+                        if update_request_status(req['Request_ID'], 'Declined'):
+                            st.warning("📝 Request Declined.")
+                            st.rerun()
+
+    with tab2: # Manage Scheduled Sessions
+        st.subheader("Scheduled Sessions")
+        pending_you, pending_student, confirmed = [], [], []
+        if sessions:
+            for s in sessions:
+                if s['Status'] == 'Pending_Confirmation':
+                    if s['Proposed_By'] == 'Student':
+                        pending_you.append(s)
+                    else:
+                        pending_student.append(s)
+                elif s['Status'] == 'Confirmed':
+                    confirmed.append(s)
+
+        st.markdown("---")
+        st.markdown("<h5 style='color: #00d4ff;'>⏳ Pending My Approval (Student Proposed)</h5>", unsafe_allow_html=True)
+        if not pending_you:
+            st.info("📭 No sessions pending your approval.")
+        for s in pending_you:
+            with st.container(border=True):
+                st.write(f"👨‍🎓 Student: **{s['Student_Name']}** | 📅 Date: **{s['Date']}** | 💻 Mode: **{s['Mode']}**")
+                st.write(f"💬 Topics: {s['Topics_Discussed']}")
+                if st.button("✅ Confirm This Session", key=f"confirm_alum_{s['Session_ID']}"):
+                    if confirm_session(s['Session_ID']):
+                        st.success("🎉 Session Confirmed! Meeting link is generated.")
+                        st.rerun()
+
+        st.markdown("---")
+        st.markdown("<h5 style='color: #00d4ff;'>⏳ Pending Student Approval (You Proposed)</h5>", unsafe_allow_html=True)
+        if not pending_student:
+            st.info("📭 No sessions pending student approval.")
+        for s in pending_student:
+            with st.container(border=True):
+                st.write(f"👨‍🎓 Student: **{s['Student_Name']}** | 📅 Date: **{s['Date']}** | 📊 Status: **{s['Status']}**")
+
+        st.markdown("---")
+        st.markdown("<h5 style='color: #00d4ff;'>✅ Confirmed & Upcoming</h5>", unsafe_allow_html=True)
+        if not confirmed:
+            st.info("📭 No confirmed sessions.")
+        for s in confirmed:
+            with st.container(border=True):
+                st.write(f"👨‍🎓 Student: **{s['Student_Name']}** | 📅 Date: **{s['Date']}** | 💻 Mode: **{s['Mode']}**")
+                st.success(f"🔗 Meeting Link: {s['Meeting_Link']}")
+                if st.button("🏁 Mark as Completed", key=f"complete_alum_{s['Session_ID']}"):
+                    if mark_session_completed(s['Session_ID']):
+                        st.success("✅ Session marked as complete.")
+                        st.rerun()
+
+    with tab3: # Completed Sessions
+        st.subheader("Completed Sessions")
+        completed = [s for s in sessions if s['Status'] == 'Completed']
+        if completed:
+            # Only sessions opened for editing load their full content, in one batched query
+            opened = [s['Session_ID'] for s in completed if st.session_state.get(f"edit_content_{s['Session_ID']}")]
+            contents = get_session_contents(opened)
+
+            for session in completed:
+                with st.expander(f"Session with {session['Student_Name']} - {session['Date']}"):
+                    st.write(f"Topics: {session.get('Topics_Discussed', 'N/A')}")
+                    # View/Edit Session Content (Alumni should manage content)
+                    if st.toggle("✏️ Open session content", key=f"edit_content_{session['Session_ID']}"):
+                        current_content = contents.get(session['Session_ID']) or ""
+                        with st.form(f"content_form_alumni_{session['Session_ID']}"):
+                            content = st.text_area("📝 Session Content & Key Takeaways", value=current_content, height=150)
+                            if st.form_submit_button("💾 Save Content", use_container_width=True):
+                                if store_session_content(session['Session_ID'], content):
+                                    st.success("✅ Content saved successfully!")
+                                    st.rerun()
+                                else:
+                                    st.error("❌ Failed to save content")
+                    else:
+                        preview = session.get('Content_Preview') or ""
+                        if preview:
+                            ellipsis = "…" if len(preview) >= CONTENT_PREVIEW_CHARS else ""
+                            st.caption(f"📝 {preview}{ellipsis}")
+                        else:
+                            st.caption("📝 No content saved yet.")
+        else:
+            st.info("📭 No sessions marked as completed yet.")
+
+
+def edit_profile():
+    """Edit Profile Page"""
+    st.title("Edit My Profile")
+    
+    # Get current profile data (independent reads, loaded concurrently; industries
+    # and skills come from the process-wide reference cache and are read inline)
+    alumni_id = st.session_state['user_id']
+    data = fetch_all(
+        info=(get_alumni_info, alumni_id),
+        skills=(get_alumni_skills, alumni_id),
+        achievements=(get_alumni_achievements, alumni_id),
+    )
+    alumni_info = data['info']
+    current_skills = data['skills']
+    current_achievements = data['achievements']
+    
+    if not alumni_info:
+        st.error("Could not load profile information.")
+        return
+    
+    # Edit Alumni Information
+    st.header("Personal Information")
+    with st.form("edit_profile_form"):
+        name = st.text_input("Full Name", value=alumni_info.get('Name', ''))
+        email = st.text_input("Email", value=alumni_info.get('Email', ''))
+        phone_number = st.text_input("Phone Number", value=alumni_info.get('PhoneNumber', ''))
+        current_designation = st.text_input("Current Designation", value=alumni_info.get('Current_Designation', ''))
+        years_of_experience = st.number_input("Years of Experience", min_value=0, step=1, 
+                                             value=int(alumni_info.get('years_of_experience', 0) or 0))
+        
+        industries = get_industries()
+        industry_id = None
+        if industries:
+            industry_options = {ind['Name']: ind['Industry_ID'] for ind in industries}
+            current_industry_name = alumni_info.get('Industry_Name')
+            
+            # Find the index of the current industry
+            try:
+                # Add a 'Select' option to handle cases where the current industry might be None
+                keys = list(industry_options.keys())
+                try:
+                    default_index = keys.index(current_industry_name)
+                except ValueError:
+                    default_index = 0 # Default to first if not found (or 'Select' if added)
+
+            except ValueError:
+                 # No current industry name or list is empty
+                 default_index = 0
+                
+            selected_industry = st.selectbox("Industry", list(industry_options.keys()), index=default_index)
+            industry_id = industry_options[selected_industry]
+        else:
+            st.warning("Could not load industries")
+        
+        submit_profile = st.form_submit_button("Update Profile")
+        
+        if submit_profile:
+            if update_alumni_profile(st.session_state['user_id'], name=name, email=email, 
+                                   phone_number=phone_number, current_designation=current_designation,
+                                   years_of_experience=years_of_experience, industry_id=industry_id):
+                st.success("Profile updated successfully!")
+                st.session_state['name'] = name # Update name in session state
+                st.rerun()
+            else:
+                st.error("Failed to update profile")
+    
+    # Edit Skills
+    st.header("Skills")
+    all_skills = get_skills()
+    with st.form("edit_skills_form"):
+        selected_skills = st.multiselect("Select Skills", all_skills, default=current_skills)
+        submit_skills = st.form_submit_button("Update Skills")
+        
+        if submit_skills:
+            if update_alumni_skills(st.session_state['user_id'], selected_skills):
+                st.success("Skills updated successfully!")
+                st.rerun()
+            else:
+                st.error("Failed to update skills")
+    
+    # Edit Achievements
+    st.header("Achievements")
+    if current_achievements:
+        st.write("Current Achievements:")
+        for achievement in current_achievements:
+            # Assumes Achievement table has Title and Year
+            with st.expander(f"{achievement.get('Title', 'Achievement')} - {achievement.get('Year', 'N/A')}"):
+                st.write(f"Description: {achievement.get('Description', 'N/A')}")
+    
+    # Note: Adding new achievements would require additional implementation
+    st.info("To add or remove achievements, please contact the administrator.")
@@ -0,0 +1,159 @@
+"""Login and registration page"""
+from datetime import datetime
+
+import streamlit as st
+
+from portal.data.accounts import login_user, register_user
+from portal.data.reference import get_industries
+
+def show_login_page():
+    """Display login/register page"""
+    st.title("🎓 Student-Alumni Mentorship Portal")
+    
+    # Apply custom dark theme CSS to match screenshot
+    st.markdown("""
+    <style>
+    /* Target the main app container */
+    .stApp {
+        background-color: #1a1a1a;
+        color: #ffffff;
+    }
+    /* Target Streamlit's containers/tabs */
+    [data-baseweb="tab-list"] {
+        background-color: #262626;
+    }
+    [data-baseweb="tab"] {
+        background-color: #262626;
+        color: #aaaaaa;
+    }
+    [data-baseweb="tab"][aria-selected="true"] {
+        color: #ffffff;
+        border-bottom-color: #007bff; /* Blue underline for active tab */
+    }
+    /* Target form background */
+    .stForm {
+        background-color: #262626;
+        border-radius: 8px;
+        padding: 20px;
+    }
+    /* Style input labels */
+    .st-emotion-cache-16txtl3 {
+        color: #ffffff !important;
+    }
+    /* Style input boxes */
+    .stTextInput input, .stNumberInput input {
+        background-color: #333333;
+        color: #ffffff;
+        border-radius: 6px;
+        border: 1px solid #555555;
+    }
+    /* Style radio buttons */
+    .stRadio label {
+        color: #ffffff;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+
+    tab1, tab2 = st.tabs(["Login", "Register"])
+    
+    with tab1:
+        st.subheader("Login")
+        with st.form("login_form"):
+            email = st.text_input("Email")
+            password = st.text_input("Password", type="password")
+            role = st.radio("Login as", ["Student", "Alumni", "Administrator"])
+            
+            submit_button = st.form_submit_button("Login")
+            
+            if submit_button:
+                if email and password:
+                    user = login_user(email, password, role)
+                    if user:
+                        st.session_state['logged_in'] = True
+                        st.session_state['role'] = role
+                        st.session_state['user_id'] = user['user_id']
+                        st.session_state['name'] = user['Name']
+                        st.success("Login successful!")
+                        st.rerun()
+                    # Error messages (Invalid credentials, Pending approval) are now handled inside login_user()
+                else:
+                    st.error("Please fill in all fields")
+    
+    with tab2:
+        st.subheader("Register")
+        
+        # --- FIX: MOVE ROLE SELECTION OUTSIDE THE FORM ---
+        # This allows the page to rerun and display the correct fields
+        # when the radio button is changed.
+        user_role = st.radio("I am a...", ["Student", "Alumni"], key="register_role_select")
+
+        with st.form("register_form"):
+            
+            # --- COMMON FIELDS ---
+            st.info(f"Please fill in the details for a new {user_role}.")
+            email = st.text_input("Email")
+            password = st.text_input("Password", type="password")
+            name = st.text_input("Full Name")
+            phone_number = st.text_input("Phone Number") # <-- COMMON FIELD
+            
+            # The user_role radio button was here, but has been moved up.
+            
+            # --- ROLE-SPECIFIC FIELDS ---
+            if user_role == 'Student':
+                st.write("--- Student Details ---")
+                semester = st.number_input("Semester", min_value=1, max_value=10, step=1)
+                department = st.text_input("Department")
+                # phone_number was removed from here
+            
+            else:  # Alumni
+                st.write("--- Alumni Details ---")
+                graduating_year = st.number_input("Graduating Year", min_value=1980, max_value=datetime.now().year, step=1)
+                current_designation = st.text_input("Current Designation")
+                years_of_experience = st.number_input("Years of Experience", min_value=0, step=1)
+                
+                industries = get_industries()
+                industry_id = None # Default
+                if industries:
+                    industry_options = {ind['Name']: ind['Industry_ID'] for ind in industries}
+                    # Add a placeholder
+                    industry_options_list = ["--- Select an Industry ---"] + list(industry_options.keys())
+                    selected_industry = st.selectbox("Industry", industry_options_list)
+                    if selected_industry != "--- Select an Industry ---":
+                        industry_id = industry_options[selected_industry]
+                else:
+                    st.warning("Could not load industries. Please contact admin.")
+            
+            submit_button = st.form_submit_button("Register")
+            
+            if submit_button:
+                # --- NEW VALIDATION LOGIC ---
+                success = False
+                
+                # 1. Validate common fields
+                if not email or not password or not name or not phone_number:
+                    st.error("Please fill in all common fields: Email, Password, Name, and Phone Number.")
+                else:
+                    # 2. Validate role-specific fields and register
+                    if user_role == 'Student':
+                        if not department:
+                            st.error("Please provide your Department.")
+                        else:
+                            success = register_user(email, password, name, user_role, 
+                                                   semester=semester, department=department, 
+                                                   phone_number=phone_number)
+                    
+                    else:  # Alumni
+                        if not current_designation or not industry_id:
+                            st.error("Please provide your Current Designation and select an Industry.")
+                        else:
+                            success = register_user(email, password, name, user_role, 
+                                                   graduating_year=graduating_year, industry_id=industry_id,
+                                                   phone_number=phone_number, current_designation=current_designation,
+                                                   years_of_experience=years_of_experience)
+                    
+                    # 3. Handle success/failure
+                    if success:
+                        if user_role == 'Student':
+                            st.success("Registration successful! Please login.")
+                        else:
+                            st.success("Registration successful! Please wait for admin approval before logging in.")
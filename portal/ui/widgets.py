@@ -0,0 +1,39 @@
+"""Widgets shared by several pages: mentor grids and keyset page turns"""
+import time
+
+import streamlit as st
+
+from portal.data.mentors import MENTOR_GRID_MAX_AGE, get_mentor_page, mentor_directory_generation
+
+def load_mentor_grid(grid_key, filters):
+    """Return the mentors loaded so far for a grid, starting over at page one when the filters change
+
+    A grid also starts over once it is MENTOR_GRID_MAX_AGE seconds old or a
+    mentor changed since it was loaded, so new approvals and ratings show up.
+    """
+    state_key = f"mentor_grid_{grid_key}"
+    grid = st.session_state.get(state_key)
+    generation = mentor_directory_generation()
+    if (grid is None or grid['filters'] != filters or grid['generation'] != generation
+            or time.monotonic() - grid['loaded_at'] > MENTOR_GRID_MAX_AGE):
+        mentors, cursor = get_mentor_page(filters)
+        grid = {'filters': dict(filters), 'mentors': mentors or [], 'cursor': cursor,
+                'generation': generation, 'loaded_at': time.monotonic()}
+        if mentors is not None:
+            st.session_state[state_key] = grid
+    return grid
+
+def load_more_mentors(grid_key):
+    """Append the next page of mentors to a grid (used as a button callback)"""
+    grid = st.session_state.get(f"mentor_grid_{grid_key}")
+    if not grid or grid['cursor'] is None:
+        return
+    mentors, cursor = get_mentor_page(grid['filters'], cursor=grid['cursor'])
+    if mentors is not None:
+        grid['mentors'].extend(mentors)
+        grid['cursor'] = cursor
+
+def turn_page(state_key, step):
+    """Move a keyset-paged admin table one page forward (1) or back (-1)"""
+    view = st.session_state[state_key]
+    view['page'] = max(0, view['page'] + step)
@@ -0,0 +1,501 @@
+-- Schema additions for AlumniMentorshipDB used by app2.py.
+-- Apply after the base schema: mysql -u root -p AlumniMentorshipDB < schema_updates.sql
+-- Every step is safe to repeat, so the file can be re-run after a partial apply.
+
+-- ==================================================================
+-- Migration helpers
+-- ==================================================================
+-- MySQL has no ADD COLUMN / CREATE INDEX ... IF NOT EXISTS, so columns,
+-- indexes and foreign keys go through these checks against
+-- information_schema. They are dropped again at the end of the file.
+DROP PROCEDURE IF EXISTS proc_MigrateAddColumn;
+DROP PROCEDURE IF EXISTS proc_MigrateAddIndex;
+DROP PROCEDURE IF EXISTS proc_MigrateAddForeignKey;
+DELIMITER //
+CREATE PROCEDURE proc_MigrateAddColumn(IN p_table VARCHAR(64), IN p_column VARCHAR(64), IN p_definition TEXT)
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.COLUMNS
+                   WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = p_table AND COLUMN_NAME = p_column) THEN
+        SET @migration_ddl = CONCAT('ALTER TABLE ', p_table, ' ADD COLUMN ', p_column, ' ', p_definition);
+        PREPARE migration_stmt FROM @migration_ddl;
+        EXECUTE migration_stmt;
+        DEALLOCATE PREPARE migration_stmt;
+    END IF;
+END //
+
+-- p_kind is 'INDEX' or 'UNIQUE INDEX'; p_columns is the column list without parentheses
+CREATE PROCEDURE proc_MigrateAddIndex(IN p_table VARCHAR(64), IN p_index VARCHAR(64), IN p_kind VARCHAR(16), IN p_columns TEXT)
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.STATISTICS
+                   WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = p_table AND INDEX_NAME = p_index) THEN
+        SET @migration_ddl = CONCAT('CREATE ', p_kind, ' ', p_index, ' ON ', p_table, ' (', p_columns, ')');
+        PREPARE migration_stmt FROM @migration_ddl;
+        EXECUTE migration_stmt;
+        DEALLOCATE PREPARE migration_stmt;
+    END IF;
+END //
+
+CREATE PROCEDURE proc_MigrateAddForeignKey(IN p_table VARCHAR(64), IN p_constraint VARCHAR(64), IN p_definition TEXT)
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.TABLE_CONSTRAINTS
+                   WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = p_table
+                     AND CONSTRAINT_NAME = p_constraint AND CONSTRAINT_TYPE = 'FOREIGN KEY') THEN
+        SET @migration_ddl = CONCAT('ALTER TABLE ', p_table, ' ADD CONSTRAINT ', p_constraint, ' ', p_definition);
+        PREPARE migration_stmt FROM @migration_ddl;
+        EXECUTE migration_stmt;
+        DEALLOCATE PREPARE migration_stmt;
+    END IF;
+END //
+DELIMITER ;
+
+-- ==================================================================
+-- Mentor rating aggregates
+-- ==================================================================
+-- One row per rated alumni, kept up to date by submit_feedback() in the
+-- same transaction as the Feedback insert, so rating reads are a
+-- primary-key lookup instead of an AVG over all feedback.
+CREATE TABLE IF NOT EXISTS Alumni_Rating_Summary (
+    Alumni_ID INT PRIMARY KEY,
+    Rating_Sum INT NOT NULL DEFAULT 0,
+    Rating_Count INT NOT NULL DEFAULT 0,
+    Avg_Rating DECIMAL(4,2) AS (IF(Rating_Count = 0, 0, Rating_Sum / Rating_Count)) STORED,
+    Last_Updated TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (Alumni_ID) REFERENCES Alumni(Alumni_ID) ON DELETE CASCADE
+);
+
+DROP PROCEDURE IF EXISTS proc_RebuildAlumniRatingSummary;
+DELIMITER //
+-- Recompute every aggregate from Feedback (run after bulk edits or if drift is detected)
+CREATE PROCEDURE proc_RebuildAlumniRatingSummary()
+BEGIN
+    START TRANSACTION;
+    DELETE FROM Alumni_Rating_Summary;
+    INSERT INTO Alumni_Rating_Summary (Alumni_ID, Rating_Sum, Rating_Count)
+    SELECT Alumni_ID, SUM(Rating), COUNT(*)
+    FROM Feedback
+    GROUP BY Alumni_ID;
+    COMMIT;
+END //
+DELIMITER ;
+
+-- Keep the stored function (used by proc_FilterMentors) as a cheap lookup too
+DROP FUNCTION IF EXISTS fn_CalculateAlumniRating;
+DELIMITER //
+CREATE FUNCTION fn_CalculateAlumniRating(p_alumni_id INT)
+RETURNS DECIMAL(4,2)
+READS SQL DATA
+BEGIN
+    RETURN COALESCE((SELECT Avg_Rating FROM Alumni_Rating_Summary WHERE Alumni_ID = p_alumni_id), 0);
+END //
+DELIMITER ;
+
+CALL proc_RebuildAlumniRatingSummary();
+
+-- ==================================================================
+-- Mentor search
+-- ==================================================================
+-- Free-text search runs against an in-process trigram index; the skills
+-- dropdown filter is an exact match that can use this index.
+CALL proc_MigrateAddIndex('Skills', 'idx_skills_name', 'INDEX', 'Skill_Name');
+
+-- ==================================================================
+-- Student dashboard loader
+-- ==================================================================
+-- Returns three result sets in one round trip: stats, placement and the
+-- first p_mentor_limit mentors (same order as get_alumni_with_industry).
+DROP PROCEDURE IF EXISTS proc_GetStudentDashboard;
+DELIMITER //
+CREATE PROCEDURE proc_GetStudentDashboard(IN p_student_id INT, IN p_mentor_limit INT)
+BEGIN
+    SELECT
+        (SELECT COUNT(*) FROM Mentorship_Session
+         WHERE Student_ID = p_student_id AND Status = 'Completed') AS Completed_Sessions,
+        (SELECT COUNT(*) FROM Mentorship_Request
+         WHERE Student_ID = p_student_id AND Status = 'Pending') AS Pending_Requests;
+
+    SELECT * FROM Placement WHERE Student_ID = p_student_id;
+
+    SELECT a.Alumni_ID, a.Name, a.Current_Designation, a.years_of_experience,
+           i.Name AS Industry_Name, a.Avg_Rating AS Rating
+    FROM Alumni a
+    LEFT JOIN Industry i ON a.Industry_ID = i.Industry_ID
+    WHERE a.Approved = TRUE
+    ORDER BY a.Avg_Rating DESC, a.Name, a.Alumni_ID
+    LIMIT p_mentor_limit;
+END //
+DELIMITER ;
+
+-- ==================================================================
+-- Session feedback
+-- ==================================================================
+-- Feedback is tied to the session it rates; each session can be rated once.
+CALL proc_MigrateAddColumn('Feedback', 'Session_ID', 'INT NULL');
+CALL proc_MigrateAddIndex('Feedback', 'uq_feedback_session', 'UNIQUE INDEX', 'Session_ID');
+CALL proc_MigrateAddForeignKey('Feedback', 'fk_feedback_session',
+    'FOREIGN KEY (Session_ID) REFERENCES Mentorship_Session(Session_ID)');
+
+-- Insert feedback and update the rating aggregate as one committed transaction,
+-- so a submission is a single CALL with no separate COMMIT round trip
+DROP PROCEDURE IF EXISTS proc_SubmitFeedback;
+DELIMITER //
+CREATE PROCEDURE proc_SubmitFeedback(
+    IN p_student_id INT, IN p_alumni_id INT, IN p_session_id INT, IN p_rating INT, IN p_comments TEXT)
+BEGIN
+    DECLARE EXIT HANDLER FOR SQLEXCEPTION
+    BEGIN
+        ROLLBACK;
+        RESIGNAL;  -- Keeps the original error (1062 for an already-rated session)
+    END;
+
+    START TRANSACTION;
+    INSERT INTO Feedback (Student_ID, Alumni_ID, Session_ID, Rating, Comments, Date)
+    VALUES (p_student_id, p_alumni_id, p_session_id, p_rating, p_comments, CURDATE());
+
+    INSERT INTO Alumni_Rating_Summary (Alumni_ID, Rating_Sum, Rating_Count)
+    VALUES (p_alumni_id, p_rating, 1)
+    ON DUPLICATE KEY UPDATE Rating_Sum = Rating_Sum + p_rating, Rating_Count = Rating_Count + 1;
+    COMMIT;
+END //
+DELIMITER ;
+
+-- ==================================================================
+-- Placement upserts
+-- ==================================================================
+-- One placement row per student so update_placement() can be a single
+-- INSERT ... ON DUPLICATE KEY UPDATE. Collapse any duplicates left by the
+-- old check-then-write path first, keeping the newest row.
+DELETE p_old FROM Placement p_old
+JOIN Placement p_new ON p_old.Student_ID = p_new.Student_ID AND p_old.Placement_ID < p_new.Placement_ID;
+
+CALL proc_MigrateAddIndex('Placement', 'uq_placement_student', 'UNIQUE INDEX', 'Student_ID');
+
+-- An upsert fires the INSERT trigger for new rows and the UPDATE trigger for
+-- existing ones, so the log is written from both. A row is logged when it is
+-- placed and its details actually changed (an identical re-submit is skipped).
+-- placement_log is the base schema's trigger; if the deployed one has another
+-- name, the check below stops the script rather than log every placement twice.
+DROP TRIGGER IF EXISTS placement_log;
+DROP TRIGGER IF EXISTS trg_Placement_Log_Insert;
+DROP TRIGGER IF EXISTS trg_Placement_Log_Update;
+
+DROP PROCEDURE IF EXISTS proc_CheckPlacementLogTriggers;
+DELIMITER //
+CREATE PROCEDURE proc_CheckPlacementLogTriggers()
+BEGIN
+    DECLARE v_leftover TEXT;
+    SELECT GROUP_CONCAT(TRIGGER_NAME) INTO v_leftover
+    FROM information_schema.TRIGGERS
+    WHERE EVENT_OBJECT_SCHEMA = DATABASE()
+      AND EVENT_OBJECT_TABLE = 'Placement'
+      AND ACTION_STATEMENT LIKE '%Placement_Log%'
+      AND TRIGGER_NAME NOT IN ('trg_Placement_Log_Insert', 'trg_Placement_Log_Update');
+    IF v_leftover IS NOT NULL THEN
+        SET v_leftover = LEFT(CONCAT('Drop these Placement_Log triggers, then re-run: ', v_leftover), 128);
+        SIGNAL SQLSTATE '45000' SET MESSAGE_TEXT = v_leftover;
+    END IF;
+END //
+DELIMITER ;
+CALL proc_CheckPlacementLogTriggers();
+DROP PROCEDURE proc_CheckPlacementLogTriggers;
+
+DELIMITER //
+CREATE TRIGGER trg_Placement_Log_Insert
+AFTER INSERT ON Placement
+FOR EACH ROW
+BEGIN
+    IF NEW.Is_Placed THEN
+        INSERT INTO Placement_Log (Student_ID, Company_Name, Placement_Date, Log_Timestamp)
+        VALUES (NEW.Student_ID, NEW.Company_Name, NEW.Placement_Date, NOW());
+    END IF;
+END //
+
+CREATE TRIGGER trg_Placement_Log_Update
+AFTER UPDATE ON Placement
+FOR EACH ROW
+BEGIN
+    IF NEW.Is_Placed AND NOT (OLD.Is_Placed <=> NEW.Is_Placed
+                              AND OLD.Company_Name <=> NEW.Company_Name
+                              AND OLD.Placement_Date <=> NEW.Placement_Date) THEN
+        INSERT INTO Placement_Log (Student_ID, Company_Name, Placement_Date, Log_Timestamp)
+        VALUES (NEW.Student_ID, NEW.Company_Name, NEW.Placement_Date, NOW());
+    END IF;
+END //
+DELIMITER ;
+
+-- ==================================================================
+-- Mentorship request de-duplication
+-- ==================================================================
+-- A student may hold at most one Pending/Accepted request per mentor.
+-- Active_Pair is NULL for closed requests, and NULLs never collide in a
+-- unique index, so history is unaffected.
+-- Close duplicate Accepted requests first, keeping the oldest. Their
+-- sessions keep the Request_ID and still list under the student and mentor.
+UPDATE Mentorship_Request dup
+JOIN Mentorship_Request keep_req
+  ON keep_req.Student_ID = dup.Student_ID
+ AND keep_req.Alumni_ID = dup.Alumni_ID
+ AND keep_req.Status = 'Accepted'
+ AND keep_req.Request_ID < dup.Request_ID
+SET dup.Status = 'Declined', dup.Decision_Date = CURDATE()
+WHERE dup.Status = 'Accepted';
+
+-- Then duplicate Pending requests: keep the Accepted one, else the oldest.
+UPDATE Mentorship_Request dup
+JOIN Mentorship_Request keep_req
+  ON keep_req.Student_ID = dup.Student_ID
+ AND keep_req.Alumni_ID = dup.Alumni_ID
+ AND keep_req.Request_ID <> dup.Request_ID
+ AND (keep_req.Status = 'Accepted'
+      OR (keep_req.Status = 'Pending' AND keep_req.Request_ID < dup.Request_ID))
+SET dup.Status = 'Declined', dup.Decision_Date = CURDATE()
+WHERE dup.Status = 'Pending';
+
+CALL proc_MigrateAddColumn('Mentorship_Request', 'Active_Pair',
+    'VARCHAR(32) AS (IF(Status IN (''Pending'', ''Accepted''), CONCAT(Student_ID, '':'', Alumni_ID), NULL)) STORED');
+CALL proc_MigrateAddIndex('Mentorship_Request', 'uq_request_active_pair', 'UNIQUE INDEX', 'Active_Pair');
+
+-- ==================================================================
+-- Site counters
+-- ==================================================================
+-- Totals for the admin dashboard, kept current by the triggers below so
+-- get_site_statistics() reads four rows instead of COUNT(*)-scanning
+-- Student, Alumni and Placement.
+CREATE TABLE IF NOT EXISTS Site_Counters (
+    Counter_Name VARCHAR(32) PRIMARY KEY,
+    Counter_Value BIGINT NOT NULL DEFAULT 0
+);
+
+DROP PROCEDURE IF EXISTS proc_RebuildSiteCounters;
+DELIMITER //
+-- Recount every counter from the base tables (initial load and drift repair)
+CREATE PROCEDURE proc_RebuildSiteCounters()
+BEGIN
+    START TRANSACTION;
+    REPLACE INTO Site_Counters (Counter_Name, Counter_Value) VALUES
+        ('total_students', (SELECT COUNT(*) FROM Student)),
+        ('total_alumni', (SELECT COUNT(*) FROM Alumni WHERE Approved = TRUE)),
+        ('pending_alumni', (SELECT COUNT(*) FROM Alumni WHERE Approved = FALSE)),
+        ('total_placements', (SELECT COUNT(*) FROM Placement WHERE Is_Placed = TRUE));
+    COMMIT;
+END //
+DELIMITER ;
+
+CALL proc_RebuildSiteCounters();
+
+DROP TRIGGER IF EXISTS trg_Student_Counters_Insert;
+DROP TRIGGER IF EXISTS trg_Student_Counters_Delete;
+DROP TRIGGER IF EXISTS trg_Alumni_Counters_Insert;
+DROP TRIGGER IF EXISTS trg_Alumni_Counters_Update;
+DROP TRIGGER IF EXISTS trg_Alumni_Counters_Delete;
+DROP TRIGGER IF EXISTS trg_Placement_Counters_Insert;
+DROP TRIGGER IF EXISTS trg_Placement_Counters_Update;
+DROP TRIGGER IF EXISTS trg_Placement_Counters_Delete;
+DELIMITER //
+CREATE TRIGGER trg_Student_Counters_Insert AFTER INSERT ON Student
+FOR EACH ROW
+    UPDATE Site_Counters SET Counter_Value = Counter_Value + 1 WHERE Counter_Name = 'total_students' //
+
+CREATE TRIGGER trg_Student_Counters_Delete AFTER DELETE ON Student
+FOR EACH ROW
+    UPDATE Site_Counters SET Counter_Value = Counter_Value - 1 WHERE Counter_Name = 'total_students' //
+
+CREATE TRIGGER trg_Alumni_Counters_Insert AFTER INSERT ON Alumni
+FOR EACH ROW
+    UPDATE Site_Counters SET Counter_Value = Counter_Value + 1
+    WHERE Counter_Name = IF(NEW.Approved, 'total_alumni', 'pending_alumni') //
+
+CREATE TRIGGER trg_Alumni_Counters_Update AFTER UPDATE ON Alumni
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Approved <=> NEW.Approved) THEN
+        UPDATE Site_Counters
+        SET Counter_Value = Counter_Value + IF(Counter_Name = IF(NEW.Approved, 'total_alumni', 'pending_alumni'), 1, -1)
+        WHERE Counter_Name IN ('total_alumni', 'pending_alumni');
+    END IF;
+END //
+
+CREATE TRIGGER trg_Alumni_Counters_Delete AFTER DELETE ON Alumni
+FOR EACH ROW
+    UPDATE Site_Counters SET Counter_Value = Counter_Value - 1
+    WHERE Counter_Name = IF(OLD.Approved, 'total_alumni', 'pending_alumni') //
+
+CREATE TRIGGER trg_Placement_Counters_Insert AFTER INSERT ON Placement
+FOR EACH ROW
+BEGIN
+    IF NEW.Is_Placed THEN
+        UPDATE Site_Counters SET Counter_Value = Counter_Value + 1 WHERE Counter_Name = 'total_placements';
+    END IF;
+END //
+
+CREATE TRIGGER trg_Placement_Counters_Update AFTER UPDATE ON Placement
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Is_Placed <=> NEW.Is_Placed) THEN
+        UPDATE Site_Counters SET Counter_Value = Counter_Value + IF(NEW.Is_Placed, 1, -1)
+        WHERE Counter_Name = 'total_placements';
+    END IF;
+END //
+
+CREATE TRIGGER trg_Placement_Counters_Delete AFTER DELETE ON Placement
+FOR EACH ROW
+BEGIN
+    IF OLD.Is_Placed THEN
+        UPDATE Site_Counters SET Counter_Value = Counter_Value - 1 WHERE Counter_Name = 'total_placements';
+    END IF;
+END //
+DELIMITER ;
+
+-- ==================================================================
+-- Placement trend rollups
+-- ==================================================================
+-- Placed counts per day, week (starting Monday) and month, adjusted by the
+-- Placement triggers below so get_placement_trends() reads only the buckets
+-- in the requested range instead of grouping every Placement row.
+CREATE TABLE IF NOT EXISTS Placement_Rollup (
+    Granularity ENUM('day', 'week', 'month') NOT NULL,
+    Bucket_Start DATE NOT NULL,
+    Placements INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (Granularity, Bucket_Start)
+);
+
+DROP PROCEDURE IF EXISTS proc_AdjustPlacementRollup;
+DROP PROCEDURE IF EXISTS proc_RebuildPlacementRollup;
+DELIMITER //
+-- Add p_delta to the three buckets containing p_date
+CREATE PROCEDURE proc_AdjustPlacementRollup(IN p_date DATE, IN p_delta INT)
+BEGIN
+    IF p_date IS NOT NULL THEN
+        INSERT INTO Placement_Rollup (Granularity, Bucket_Start, Placements) VALUES
+            ('day', p_date, p_delta),
+            ('week', DATE_SUB(p_date, INTERVAL WEEKDAY(p_date) DAY), p_delta),
+            ('month', DATE_SUB(p_date, INTERVAL DAYOFMONTH(p_date) - 1 DAY), p_delta)
+        ON DUPLICATE KEY UPDATE Placements = Placements + VALUES(Placements);
+    END IF;
+END //
+
+-- Recompute every bucket from Placement (initial load and drift repair)
+CREATE PROCEDURE proc_RebuildPlacementRollup()
+BEGIN
+    START TRANSACTION;
+    DELETE FROM Placement_Rollup;
+    INSERT INTO Placement_Rollup (Granularity, Bucket_Start, Placements)
+    SELECT 'day', Placement_Date, COUNT(*)
+    FROM Placement WHERE Is_Placed = TRUE AND Placement_Date IS NOT NULL
+    GROUP BY Placement_Date;
+    INSERT INTO Placement_Rollup (Granularity, Bucket_Start, Placements)
+    SELECT 'week', DATE_SUB(Placement_Date, INTERVAL WEEKDAY(Placement_Date) DAY) AS Bucket, COUNT(*)
+    FROM Placement WHERE Is_Placed = TRUE AND Placement_Date IS NOT NULL
+    GROUP BY Bucket;
+    INSERT INTO Placement_Rollup (Granularity, Bucket_Start, Placements)
+    SELECT 'month', DATE_SUB(Placement_Date, INTERVAL DAYOFMONTH(Placement_Date) - 1 DAY) AS Bucket, COUNT(*)
+    FROM Placement WHERE Is_Placed = TRUE AND Placement_Date IS NOT NULL
+    GROUP BY Bucket;
+    COMMIT;
+END //
+DELIMITER ;
+
+CALL proc_RebuildPlacementRollup();
+
+DROP TRIGGER IF EXISTS trg_Placement_Rollup_Insert;
+DROP TRIGGER IF EXISTS trg_Placement_Rollup_Update;
+DROP TRIGGER IF EXISTS trg_Placement_Rollup_Delete;
+DELIMITER //
+CREATE TRIGGER trg_Placement_Rollup_Insert AFTER INSERT ON Placement
+FOR EACH ROW
+BEGIN
+    IF NEW.Is_Placed THEN
+        CALL proc_AdjustPlacementRollup(NEW.Placement_Date, 1);
+    END IF;
+END //
+
+CREATE TRIGGER trg_Placement_Rollup_Update AFTER UPDATE ON Placement
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Is_Placed <=> NEW.Is_Placed AND OLD.Placement_Date <=> NEW.Placement_Date) THEN
+        IF OLD.Is_Placed THEN
+            CALL proc_AdjustPlacementRollup(OLD.Placement_Date, -1);
+        END IF;
+        IF NEW.Is_Placed THEN
+            CALL proc_AdjustPlacementRollup(NEW.Placement_Date, 1);
+        END IF;
+    END IF;
+END //
+
+CREATE TRIGGER trg_Placement_Rollup_Delete AFTER DELETE ON Placement
+FOR EACH ROW
+BEGIN
+    IF OLD.Is_Placed THEN
+        CALL proc_AdjustPlacementRollup(OLD.Placement_Date, -1);
+    END IF;
+END //
+DELIMITER ;
+
+-- ==================================================================
+-- Placement log paging
+-- ==================================================================
+-- get_placement_log() pages newest-first by (Log_Timestamp, Log_ID) and can
+-- narrow by student or company prefix; each index serves one access path.
+CALL proc_MigrateAddIndex('Placement_Log', 'idx_placement_log_time', 'INDEX', 'Log_Timestamp, Log_ID');
+CALL proc_MigrateAddIndex('Placement_Log', 'idx_placement_log_student', 'INDEX', 'Student_ID, Log_Timestamp, Log_ID');
+CALL proc_MigrateAddIndex('Placement_Log', 'idx_placement_log_company', 'INDEX', 'Company_Name, Log_Timestamp, Log_ID');
+
+-- ==================================================================
+-- Admin user directory
+-- ==================================================================
+-- Sort and prefix-search paths for get_user_directory_page(). InnoDB appends
+-- the primary key to every secondary index, so each one also serves the
+-- (column, id) keyset order. Emails are already covered by the base schema's
+-- unique keys.
+CALL proc_MigrateAddIndex('Student', 'idx_student_name', 'INDEX', 'Name');
+CALL proc_MigrateAddIndex('Student', 'idx_student_department', 'INDEX', 'Department');
+CALL proc_MigrateAddIndex('Alumni', 'idx_alumni_name', 'INDEX', 'Name');
+CALL proc_MigrateAddIndex('Alumni', 'idx_alumni_graduating_year', 'INDEX', 'Graduating_Year');
+
+-- ==================================================================
+-- Mentor directory order
+-- ==================================================================
+-- Mentor grids page by (rating DESC, Name, Alumni_ID). Sorting on the
+-- summary table's rating through a LEFT JOIN cannot use an index, so every
+-- page filesorted all approved alumni. Alumni carries a copy of the rating,
+-- kept in step by triggers on Alumni_Rating_Summary, and these indexes
+-- serve the order directly (also when filtered by industry).
+CALL proc_MigrateAddColumn('Alumni', 'Avg_Rating', 'DECIMAL(4,2) NOT NULL DEFAULT 0');
+
+UPDATE Alumni a
+LEFT JOIN Alumni_Rating_Summary r ON a.Alumni_ID = r.Alumni_ID
+SET a.Avg_Rating = COALESCE(r.Avg_Rating, 0);
+
+CALL proc_MigrateAddIndex('Alumni', 'idx_alumni_mentor_order', 'INDEX', 'Approved, Avg_Rating DESC, Name, Alumni_ID');
+CALL proc_MigrateAddIndex('Alumni', 'idx_alumni_industry_order', 'INDEX', 'Approved, Industry_ID, Avg_Rating DESC, Name, Alumni_ID');
+
+DROP TRIGGER IF EXISTS trg_Rating_Summary_Insert;
+DROP TRIGGER IF EXISTS trg_Rating_Summary_Update;
+DROP TRIGGER IF EXISTS trg_Rating_Summary_Delete;
+DELIMITER //
+CREATE TRIGGER trg_Rating_Summary_Insert AFTER INSERT ON Alumni_Rating_Summary
+FOR EACH ROW
+BEGIN
+    UPDATE Alumni SET Avg_Rating = NEW.Avg_Rating WHERE Alumni_ID = NEW.Alumni_ID;
+END //
+
+CREATE TRIGGER trg_Rating_Summary_Update AFTER UPDATE ON Alumni_Rating_Summary
+FOR EACH ROW
+BEGIN
+    IF NOT (OLD.Avg_Rating <=> NEW.Avg_Rating) THEN
+        UPDATE Alumni SET Avg_Rating = NEW.Avg_Rating WHERE Alumni_ID = NEW.Alumni_ID;
+    END IF;
+END //
+
+CREATE TRIGGER trg_Rating_Summary_Delete AFTER DELETE ON Alumni_Rating_Summary
+FOR EACH ROW
+BEGIN
+    UPDATE Alumni SET Avg_Rating = 0 WHERE Alumni_ID = OLD.Alumni_ID;
+END //
+DELIMITER ;
+
+-- ==================================================================
+-- Cleanup
+-- ==================================================================
+DROP PROCEDURE IF EXISTS proc_MigrateAddColumn;
+DROP PROCEDURE IF EXISTS proc_MigrateAddIndex;
+DROP PROCEDURE IF EXISTS proc_MigrateAddForeignKey;